@@ -0,0 +1,51 @@
+"""
+Benchmark: wallet generation throughput with and without the key cache
+
+Run from the repository root:
+    python -m benchmarks.bench_encryption
+"""
+
+import logging
+import time
+from src.burner_swarm.pool_manager import PoolManager
+from src.utils.encryption import clear_key_cache
+
+
+def run(count: int, cached: bool) -> float:
+    """
+    Generate wallets and return wallets/sec
+    
+    Args:
+        count: Number of wallets to generate
+        cached: Keep derived keys cached between wallets
+        
+    Returns:
+        Wallets per second
+    """
+    pool_manager = PoolManager(min_reserve_size=0)
+    clear_key_cache()
+    
+    start = time.perf_counter()
+    for _ in range(count):
+        if not cached:
+            clear_key_cache()  # Forces PBKDF2 per wallet (previous behaviour)
+        pool_manager.generate_wallet()
+    elapsed = time.perf_counter() - start
+    
+    return count / elapsed
+
+
+def main():
+    """Run benchmark"""
+    logging.disable(logging.INFO)
+    
+    uncached = run(50, cached=False)
+    cached = run(5000, cached=True)
+    
+    print(f"PBKDF2 per wallet: {uncached:10.1f} wallets/sec")
+    print(f"Cached key:        {cached:10.1f} wallets/sec")
+    print(f"Speedup:           {cached / uncached:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
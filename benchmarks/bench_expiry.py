@@ -0,0 +1,62 @@
+"""
+Benchmark: expired-wallet cleanup, full scan vs expiry heap
+
+Run from the repository root:
+    python -m benchmarks.bench_expiry
+"""
+
+import logging
+import os
+import time
+from solders.pubkey import Pubkey
+from src.burner_swarm.pool_manager import PoolManager, BurnerWallet
+
+WALLETS = 100_000
+MAX_AGE_HOURS = 24
+
+
+def build(expired: int) -> PoolManager:
+    """Reserve pool of WALLETS wallets, the first `expired` past max age"""
+    now = int(time.time())
+    pool_manager = PoolManager(min_reserve_size=0)
+    for i in range(WALLETS):
+        created_at = now - MAX_AGE_HOURS * 3600 - 60 if i < expired else now
+        pool_manager.add_to_reserve(
+            BurnerWallet(public_key=Pubkey(os.urandom(32)), keypair=None, created_at=created_at)
+        )
+    return pool_manager
+
+
+def scan_cleanup(pool_manager: PoolManager) -> int:
+    """Previous cleanup: check every reserve/active wallet"""
+    expired = [
+        wallet
+        for pool in (pool_manager.active_pool, pool_manager.reserve_pool)
+        for wallet in pool.values()
+        if wallet.is_expired(MAX_AGE_HOURS)
+    ]
+    for wallet in expired:
+        pool_manager.retire_wallet(wallet)
+    return len(expired)
+
+
+def main():
+    """Run benchmark"""
+    logging.disable(logging.INFO)
+    print(f"{'expired':>8} {'scan (ms)':>10} {'heap (ms)':>10} {'speedup':>8}")
+    for expired in (0, 10, 100, 1000, 10000):
+        pool_manager = build(expired)
+        start = time.perf_counter()
+        assert scan_cleanup(pool_manager) == expired
+        scan = time.perf_counter() - start
+        
+        pool_manager = build(expired)
+        start = time.perf_counter()
+        assert len(pool_manager.cleanup_expired_wallets(MAX_AGE_HOURS)) == expired
+        heap = time.perf_counter() - start
+        
+        print(f"{expired:>8} {scan * 1e3:>10.2f} {heap * 1e3:>10.2f} {scan / heap:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark: per-wallet vs batched wallet generation
+
+Run from the repository root:
+    python -m benchmarks.bench_generation
+"""
+
+import logging
+import time
+from src.burner_swarm.pool_manager import PoolManager
+
+
+def run_single(pool_manager: PoolManager, count: int) -> float:
+    """Generate wallets one at a time, return seconds"""
+    start = time.perf_counter()
+    for _ in range(count):
+        pool_manager.generate_wallet()
+    return time.perf_counter() - start
+
+
+def run_batch(pool_manager: PoolManager, count: int) -> float:
+    """Generate wallets in one batch, return seconds"""
+    start = time.perf_counter()
+    pool_manager.generate_batch(count)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run benchmark"""
+    logging.disable(logging.INFO)
+    pool_manager = PoolManager(min_reserve_size=0)
+    pool_manager.generate_wallet()  # Warm key cache
+    
+    print(f"{'n':>6} {'single (us/wallet)':>20} {'batch (us/wallet)':>20} {'speedup':>8}")
+    for count in (1, 10, 100, 1000):
+        repeats = max(1, 1000 // count)
+        single = min(run_single(pool_manager, count) for _ in range(repeats))
+        batch = min(run_batch(pool_manager, count) for _ in range(repeats))
+        print(
+            f"{count:>6} {single / count * 1e6:>20.1f} {batch / count * 1e6:>20.1f} "
+            f"{single / batch:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
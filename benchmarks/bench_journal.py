@@ -0,0 +1,62 @@
+"""
+Benchmark: journal append throughput with group commit vs fsync per transition
+
+Run from the repository root:
+    python -m benchmarks.bench_journal
+"""
+
+import logging
+import tempfile
+import threading
+import time
+from src.burner_swarm.journal import JournalWalletStore
+from src.burner_swarm.pool_manager import PoolManager
+
+TRANSITIONS = 2000
+THREADS = 4
+
+
+def run(wallets, sync_each: bool) -> tuple:
+    """Journal activate transitions from several threads, return (seconds, commits)"""
+    with tempfile.TemporaryDirectory() as directory:
+        store = JournalWalletStore(directory, compact_threshold=TRANSITIONS * 10)
+        for wallet in wallets:
+            store.save(wallet)
+        store.flush()
+        commits_before = store.commits
+        
+        def worker(chunk):
+            for wallet in chunk:
+                wallet.mark_used()
+                store.save(wallet)
+                if sync_each:
+                    store.flush()
+        
+        chunks = [wallets[i::THREADS] for i in range(THREADS)]
+        threads = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        store.flush()
+        elapsed = time.perf_counter() - start
+        
+        commits = store.commits - commits_before
+        store.close()
+        return elapsed, commits
+
+
+def main():
+    """Run benchmark"""
+    logging.disable(logging.INFO)
+    wallets = PoolManager(min_reserve_size=0).generate_batch(TRANSITIONS)
+    
+    print(f"{'mode':>16} {'transitions/s':>14} {'fsyncs':>8}")
+    for name, sync_each in (("fsync each", True), ("group commit", False)):
+        elapsed, commits = run(wallets, sync_each)
+        print(f"{name:>16} {TRANSITIONS / elapsed:>14.0f} {commits:>8}")
+
+
+if __name__ == "__main__":
+    main()
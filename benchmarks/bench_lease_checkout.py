@@ -0,0 +1,82 @@
+"""
+Benchmark: concurrent leased checkouts from a shared SQLite store
+
+Each process drains the shared reserve with atomic leased checkouts;
+reports aggregate checkouts/s and per-checkout latency percentiles.
+
+Run from the repository root:
+    python -m benchmarks.bench_lease_checkout
+"""
+
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from solders.pubkey import Pubkey
+from src.burner_swarm.pool_manager import BurnerWallet, WalletStatus
+from src.burner_swarm.wallet_store import SQLiteWalletStore, SharedSQLiteWalletStore
+
+WALLETS = 20_000
+
+
+def seed(path: str):
+    """Fill the reserve with synthetic wallets (checkout never decrypts)"""
+    store = SQLiteWalletStore(path, batch_size=WALLETS)
+    now = int(time.time())
+    for i in range(WALLETS):
+        store.save(BurnerWallet(
+            public_key=Pubkey(os.urandom(32)),
+            keypair=None,
+            created_at=now + i,
+            status=WalletStatus.RESERVE,
+            encrypted_private_key=os.urandom(120)
+        ))
+    store.close()
+
+
+def drain(args) -> list:
+    """Check out wallets until the reserve is empty, returning latencies"""
+    path, start_at = args
+    logging.disable(logging.INFO)
+    store = SharedSQLiteWalletStore(path, busy_timeout=30.0)
+    latencies = []
+    
+    while time.time() < start_at:
+        time.sleep(0.001)
+    while True:
+        start = time.perf_counter()
+        wallet = store.checkout()
+        if wallet is None:
+            break
+        latencies.append(time.perf_counter() - start)
+    
+    store.close()
+    return latencies
+
+
+def main():
+    """Run benchmark"""
+    logging.disable(logging.INFO)
+    print(f"{'processes':>9} {'checkouts/s':>12} {'p50 (us)':>9} {'p99 (us)':>9}")
+    
+    for processes in (1, 2, 4, 8):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "wallets.db")
+            seed(path)
+            SharedSQLiteWalletStore(path).close()  # Migrate schema up front
+            
+            with multiprocessing.Pool(processes) as pool:
+                start_at = time.time() + 0.5
+                results = pool.map(drain, [(path, start_at)] * processes)
+                elapsed = time.time() - start_at
+            
+            latencies = sorted(latency for result in results for latency in result)
+            assert len(latencies) == WALLETS
+            p50 = latencies[len(latencies) // 2]
+            p99 = latencies[int(len(latencies) * 0.99)]
+            print(f"{processes:>9} {WALLETS / elapsed:>12.0f} {p50 * 1e6:>9.0f} {p99 * 1e6:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
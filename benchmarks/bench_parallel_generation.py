@@ -0,0 +1,50 @@
+"""
+Benchmark: multi-process wallet generation scaling
+
+Run from the repository root:
+    python -m benchmarks.bench_parallel_generation
+"""
+
+import logging
+import os
+import time
+from src.burner_swarm.parallel_generator import ParallelWalletGenerator
+from src.burner_swarm.pool_manager import PoolManager
+
+WALLETS = 20000
+
+
+def run(workers: int) -> float:
+    """Generate WALLETS wallets with the given worker count, return wallets/sec"""
+    generator = ParallelWalletGenerator(workers=workers, chunk_size=500)
+    try:
+        generator.generate_encrypted(workers)  # Start workers and warm key caches
+        
+        start = time.perf_counter()
+        generator.generate_encrypted(WALLETS)
+        elapsed = time.perf_counter() - start
+    finally:
+        generator.close()
+    
+    return WALLETS / elapsed
+
+
+def main():
+    """Run benchmark"""
+    logging.disable(logging.INFO)
+    print(f"CPUs available: {os.cpu_count()}")
+    
+    pool_manager = PoolManager(min_reserve_size=0)
+    pool_manager.generate_batch(100)  # Warm key cache
+    start = time.perf_counter()
+    pool_manager.generate_batch(WALLETS)
+    baseline = WALLETS / (time.perf_counter() - start)
+    print(f"{'in-process':>10}: {baseline:10.1f} wallets/sec")
+    
+    for workers in (1, 2, 4, 8):
+        rate = run(workers)
+        print(f"{workers:>10}: {rate:10.1f} wallets/sec ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: top-k rotation candidates, sort over all wallets vs priority heaps
+
+Run from the repository root:
+    python -m benchmarks.bench_rotation
+"""
+
+import logging
+import os
+import random
+import time
+from solders.pubkey import Pubkey
+from src.burner_swarm.pool_manager import BurnerWallet, WalletStatus
+from src.burner_swarm.rotation_strategy import RotationStrategy
+
+WALLETS = 100_000
+MAX_USES = 5
+MAX_AGE_HOURS = 24
+ROUNDS = 20
+
+
+def build() -> list:
+    """Active wallets with mixed usage counts and ages"""
+    now = int(time.time())
+    rng = random.Random(0)
+    return [
+        BurnerWallet(
+            public_key=Pubkey(os.urandom(32)),
+            keypair=None,
+            created_at=now - rng.randrange(2 * MAX_AGE_HOURS * 3600),
+            usage_count=rng.randrange(2 * MAX_USES),
+            status=WalletStatus.ACTIVE
+        )
+        for _ in range(WALLETS)
+    ]
+
+
+def main():
+    """Run benchmark"""
+    logging.disable(logging.INFO)
+    wallets = build()
+    strategy = RotationStrategy(max_uses=MAX_USES, max_age_hours=MAX_AGE_HOURS)
+    
+    start = time.perf_counter()
+    for wallet in wallets:
+        strategy.track(wallet)
+    print(f"tracking {WALLETS} wallets: {(time.perf_counter() - start) * 1e3:.1f} ms (one-off)")
+    
+    print(f"{'k':>6} {'sort (ms)':>10} {'heap (ms)':>10} {'speedup':>8}")
+    for k in (1, 10, 100, 1000):
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            expected = strategy.select_rotation_candidates(wallets, k)
+        sort = (time.perf_counter() - start) / ROUNDS
+        
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            selected = strategy.top_candidates(k)
+        heap = (time.perf_counter() - start) / ROUNDS
+        
+        assert [w.public_key for w in selected] == [w.public_key for w in expected]
+        print(f"{k:>6} {sort * 1e3:>10.2f} {heap * 1e3:>10.3f} {sort / heap:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
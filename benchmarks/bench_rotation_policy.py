@@ -0,0 +1,94 @@
+"""
+Benchmark: per-wallet rotation check, hard-coded checks vs compiled policy
+
+Run from the repository root:
+    python -m benchmarks.bench_rotation_policy
+"""
+
+import logging
+import os
+import random
+import time
+from typing import Optional
+from solders.pubkey import Pubkey
+from src.burner_swarm.pool_manager import BurnerWallet, WalletStatus
+from src.burner_swarm.rotation_strategy import RotationStrategy
+
+WALLETS = 100_000
+MAX_USES = 5
+MAX_AGE_HOURS = 24
+
+
+def build() -> list:
+    """Active wallets with mixed usage counts, ages and balances"""
+    now = int(time.time())
+    rng = random.Random(0)
+    return [
+        BurnerWallet(
+            public_key=Pubkey(os.urandom(32)),
+            keypair=None,
+            created_at=now - rng.randrange(2 * MAX_AGE_HOURS * 3600),
+            last_used=now - rng.randrange(4 * 3600),
+            usage_count=rng.randrange(2 * MAX_USES),
+            status=WalletStatus.ACTIVE,
+            balance_lamports=rng.randrange(10_000_000)
+        )
+        for _ in range(WALLETS)
+    ]
+
+
+def previous_should_rotate(wallet: BurnerWallet, now: Optional[float] = None) -> bool:
+    """Previous RotationStrategy.should_rotate: two hard-coded checks"""
+    logger = logging.getLogger("bench")
+    if wallet.should_retire(MAX_USES):
+        logger.debug(f"Wallet {wallet.public_key} should rotate: usage count {wallet.usage_count} >= {MAX_USES}")
+        return True
+    if wallet.is_expired(MAX_AGE_HOURS, now):
+        logger.debug(f"Wallet {wallet.public_key} should rotate: expired")
+        return True
+    return False
+
+
+def per_wallet_ns(check, wallets, now) -> float:
+    """Average nanoseconds per check(wallet, now) call"""
+    start = time.perf_counter()
+    for wallet in wallets:
+        check(wallet, now)
+    return (time.perf_counter() - start) / len(wallets) * 1e9
+
+
+def main():
+    """Run benchmark"""
+    logging.disable(logging.INFO)
+    wallets = build()
+    now = time.time()
+    
+    two_rules = RotationStrategy(max_uses=MAX_USES, max_age_hours=MAX_AGE_HOURS)
+    four_rules = RotationStrategy(
+        max_uses=MAX_USES,
+        max_age_hours=MAX_AGE_HOURS,
+        max_idle_hours=2,
+        min_balance_sol=0.005
+    )
+    assert all(previous_should_rotate(w, now) == two_rules.should_rotate(w, now) for w in wallets)
+    
+    print(f"{'check':<36} {'ns/wallet':>10}")
+    rows = [
+        ("previous (usage, age)", previous_should_rotate),
+        ("should_rotate (usage, age)", two_rules.should_rotate),
+        ("compiled predicate (usage, age)", two_rules.policy.should_rotate),
+        ("should_rotate (4 rules)", four_rules.should_rotate),
+        ("compiled predicate (4 rules)", four_rules.policy.should_rotate),
+    ]
+    for name, check in rows:
+        print(f"{name:<36} {per_wallet_ns(check, wallets, now):>10.0f}")
+    
+    sample = wallets[:10_000]
+    start = time.perf_counter()
+    for wallet in sample:
+        four_rules.get_rotation_recommendation(wallet)
+    print(f"{'recommendation (4 rules)':<36} {(time.perf_counter() - start) / len(sample) * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: wallet lookup, three string-keyed pools vs unified byte-keyed index
+
+Run from the repository root:
+    python -m benchmarks.bench_wallet_index
+"""
+
+import logging
+import os
+import random
+import time
+from solders.pubkey import Pubkey
+from src.burner_swarm.pool_manager import PoolManager, BurnerWallet
+
+WALLETS = 1_000_000
+LOOKUPS = 200_000
+
+
+def legacy_get_wallet(active_pool, reserve_pool, retired_pool, public_key):
+    """Previous PoolManager.get_wallet: probe three dicts keyed by str(pubkey)"""
+    key = str(public_key)
+    
+    if key in active_pool:
+        return active_pool[key]
+    elif key in reserve_pool:
+        return reserve_pool[key]
+    elif key in retired_pool:
+        return retired_pool[key]
+    
+    return None
+
+
+def main():
+    """Run benchmark"""
+    logging.disable(logging.INFO)
+    now = int(time.time())
+    print(f"Building {WALLETS} wallets...")
+    wallets = [
+        BurnerWallet(public_key=Pubkey(os.urandom(32)), keypair=None, created_at=now)
+        for _ in range(WALLETS)
+    ]
+    
+    # Split evenly across reserve, active and retired
+    pool_manager = PoolManager(min_reserve_size=0, retired_cache_size=WALLETS, retired_ttl=None)
+    active_pool, reserve_pool, retired_pool = {}, {}, {}
+    for i, wallet in enumerate(wallets):
+        pool_manager.add_to_reserve(wallet)
+        if i % 3 == 0:
+            pool_manager.retire_wallet(wallet)
+            retired_pool[str(wallet.public_key)] = wallet
+        elif i % 3 == 1:
+            pool_manager.activate_wallet(wallet)
+            active_pool[str(wallet.public_key)] = wallet
+        else:
+            reserve_pool[str(wallet.public_key)] = wallet
+    
+    # Lookups hit every status; a tenth miss entirely
+    keys = [wallet.public_key for wallet in random.sample(wallets, LOOKUPS)]
+    keys[::10] = [Pubkey(os.urandom(32)) for _ in keys[::10]]
+    
+    start = time.perf_counter()
+    for public_key in keys:
+        legacy_get_wallet(active_pool, reserve_pool, retired_pool, public_key)
+    legacy = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for public_key in keys:
+        pool_manager.get_wallet(public_key)
+    unified = time.perf_counter() - start
+    
+    print(f"{'lookup':>10} {'ns/op':>8}")
+    print(f"{'3 x str':>10} {legacy / LOOKUPS * 1e9:>8.0f}")
+    print(f"{'unified':>10} {unified / LOOKUPS * 1e9:>8.0f}")
+    print(f"speedup: {legacy / unified:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
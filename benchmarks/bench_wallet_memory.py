@@ -0,0 +1,125 @@
+"""
+Benchmark: memory per wallet, dict-based dataclass vs slotted BurnerWallet
+
+Run from the repository root:
+    python -m benchmarks.bench_wallet_memory
+"""
+
+import gc
+import logging
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from src.burner_swarm.pool_manager import BurnerWallet, WalletStatus
+from src.utils.encryption import encrypt_keys_raw, unpack_ciphertext
+
+WALLETS = 100_000
+
+
+@dataclass
+class LegacyBurnerWallet:
+    """Previous representation: plain dataclass, datetimes and nested dict"""
+    public_key: Pubkey
+    keypair: Optional[Keypair]
+    created_at: datetime
+    last_used: Optional[datetime] = None
+    usage_count: int = 0
+    status: WalletStatus = WalletStatus.RESERVE
+    encrypted_private_key: Optional[dict] = None
+
+
+def measure(build) -> float:
+    """Build wallets and return traced bytes per wallet"""
+    gc.collect()
+    tracemalloc.start()
+    wallets = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del wallets
+    return current / WALLETS
+
+
+def main():
+    """Run benchmark"""
+    logging.disable(logging.INFO)
+    print(f"Preparing {WALLETS} encrypted keys...")
+    keypairs = [Keypair() for _ in range(WALLETS)]
+    pubkey_bytes = [bytes(keypair.pubkey()) for keypair in keypairs]
+    ciphertexts = encrypt_keys_raw([bytes(keypair) for keypair in keypairs])
+    del keypairs
+    now = time.time()
+    
+    # Reserve wallets as loaded from a store: encrypted key only, distinct timestamps
+    def build_legacy():
+        return [
+            LegacyBurnerWallet(
+                public_key=Pubkey.from_bytes(public_key),
+                keypair=None,
+                created_at=datetime.utcfromtimestamp(now - i),
+                last_used=datetime.utcfromtimestamp(now - i),
+                usage_count=1,
+                encrypted_private_key={
+                    "public_key": str(Pubkey.from_bytes(public_key)),
+                    "encrypted_private_key": unpack_ciphertext(ciphertext),
+                    "created_at": None
+                }
+            )
+            for i, (public_key, ciphertext) in enumerate(zip(pubkey_bytes, ciphertexts))
+        ]
+    
+    def build_slotted():
+        return [
+            BurnerWallet(
+                public_key=Pubkey.from_bytes(public_key),
+                keypair=None,
+                created_at=now - i,
+                last_used=now - i,
+                usage_count=1,
+                encrypted_private_key=bytes(bytearray(ciphertext))  # Own copy, as when loaded
+            )
+            for i, (public_key, ciphertext) in enumerate(zip(pubkey_bytes, ciphertexts))
+        ]
+    
+    # Retired wallets: key material already cleared
+    def build_legacy_retired():
+        return [
+            LegacyBurnerWallet(
+                public_key=Pubkey.from_bytes(public_key),
+                keypair=None,
+                created_at=datetime.utcfromtimestamp(now - i),
+                last_used=datetime.utcfromtimestamp(now - i),
+                usage_count=1,
+                status=WalletStatus.RETIRED
+            )
+            for i, public_key in enumerate(pubkey_bytes)
+        ]
+    
+    def build_slotted_retired():
+        return [
+            BurnerWallet(
+                public_key=Pubkey.from_bytes(public_key),
+                keypair=None,
+                created_at=now - i,
+                last_used=now - i,
+                usage_count=1,
+                status=WalletStatus.RETIRED
+            )
+            for i, public_key in enumerate(pubkey_bytes)
+        ]
+    
+    print(f"{'pool':>10} {'before (B/wallet)':>18} {'after (B/wallet)':>17} {'saved':>7}")
+    for name, before, after in (
+        ("reserve", build_legacy, build_slotted),
+        ("retired", build_legacy_retired, build_slotted_retired),
+    ):
+        legacy = measure(before)
+        slotted = measure(after)
+        print(f"{name:>10} {legacy:>18.0f} {slotted:>17.0f} {1 - slotted / legacy:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,9 @@ from typing import Optional, List
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from ..burner_swarm.burner_swarm_fabric import BurnerSwarmFabric
+from ..burner_swarm.checkout_queue import PoolExhaustedError
+from ..burner_swarm.wallet_store import create_wallet_store
+from ..burner_swarm.tombstones import TombstoneLog
 from ..config.settings import Settings
 import base64
 
@@ -21,7 +24,54 @@ fabric = BurnerSwarmFabric(
     min_reserve_size=Settings.MIN_RESERVE_SIZE,
     max_active_size=Settings.MAX_ACTIVE_SIZE,
     max_uses=Settings.MAX_USES,
-    max_age_hours=Settings.MAX_AGE_HOURS
+    max_age_hours=Settings.MAX_AGE_HOURS,
+    max_idle_hours=Settings.MAX_IDLE_HOURS or None,
+    min_balance_sol=Settings.MIN_BALANCE_SOL or None,
+    reserve_low_watermark=Settings.RESERVE_LOW_WATERMARK,
+    reserve_high_watermark=Settings.RESERVE_HIGH_WATERMARK,
+    replenish_batch_size=Settings.REPLENISH_BATCH_SIZE,
+    replenish_interval=Settings.REPLENISH_INTERVAL,
+    adaptive_reserve=Settings.ADAPTIVE_RESERVE,
+    reserve_target_max=Settings.RESERVE_TARGET_MAX,
+    reserve_rate_window=Settings.RESERVE_RATE_WINDOW,
+    reserve_rate_alpha=Settings.RESERVE_RATE_ALPHA,
+    reserve_lead_time=Settings.RESERVE_LEAD_TIME,
+    generation_workers=Settings.GENERATION_WORKERS,
+    parallel_threshold=Settings.GENERATION_PARALLEL_THRESHOLD,
+    funding_commitment=Settings.FUNDING_COMMITMENT or None,
+    confirmation_poll_interval=Settings.CONFIRMATION_POLL_INTERVAL,
+    confirmation_timeout=Settings.CONFIRMATION_TIMEOUT,
+    blockhash_ttl=Settings.BLOCKHASH_TTL,
+    blockhash_refresh_interval=Settings.BLOCKHASH_REFRESH_INTERVAL,
+    blockhash_background_refresh=Settings.BLOCKHASH_BACKGROUND_REFRESH,
+    rpc_max_connections=Settings.RPC_MAX_CONNECTIONS,
+    rpc_max_keepalive_connections=Settings.RPC_MAX_KEEPALIVE_CONNECTIONS,
+    rpc_keepalive_expiry=Settings.RPC_KEEPALIVE_EXPIRY,
+    rpc_timeout=Settings.RPC_TIMEOUT,
+    rpc_urls=Settings.SOLANA_RPC_URLS or None,
+    rpc_failure_threshold=Settings.RPC_FAILURE_THRESHOLD,
+    rpc_breaker_cooldown=Settings.RPC_BREAKER_COOLDOWN,
+    wallet_store=create_wallet_store(
+        Settings.WALLET_STORE_BACKEND,
+        Settings.WALLET_STORE_PATH,
+        batch_size=Settings.WALLET_STORE_BATCH_SIZE,
+        flush_interval=Settings.WALLET_STORE_FLUSH_INTERVAL,
+        compact_threshold=Settings.JOURNAL_COMPACT_THRESHOLD,
+        shared=Settings.SHARED_POOL,
+        lease_ttl=Settings.LEASE_TTL
+    ),
+    retired_cache_size=Settings.RETIRED_CACHE_SIZE,
+    retired_ttl=Settings.RETIRED_TTL,
+    tombstone_log=TombstoneLog(
+        Settings.RETIRED_TOMBSTONE_PATH,
+        flush_interval=Settings.RETIRED_TOMBSTONE_FLUSH_INTERVAL,
+        compact_interval=Settings.RETIRED_TOMBSTONE_COMPACT_INTERVAL,
+        retention=Settings.RETIRED_TOMBSTONE_RETENTION or None
+    ) if Settings.RETIRED_TOMBSTONE_PATH else None,
+    expiry_sweep_batch_size=Settings.EXPIRY_SWEEP_BATCH_SIZE,
+    expiry_sweep_max_interval=Settings.EXPIRY_SWEEP_MAX_INTERVAL,
+    lease_heartbeat_interval=Settings.LEASE_HEARTBEAT_INTERVAL,
+    checkout_timeout=Settings.CHECKOUT_TIMEOUT
 )
 
 
@@ -38,6 +88,7 @@ class GetBurnerSwarmRequest(BaseModel):
     auto_fund: bool = Field(False, description="Automatically fund wallets")
     funding_amount: Optional[float] = Field(None, ge=0.0, description="Amount to fund per wallet")
     source_wallet_keypair: Optional[str] = Field(None, description="Base64 encoded source wallet keypair")
+    concurrent: bool = Field(False, description="Fund wallets in batched transfers with per-wallet results")
 
 
 class WalletResponse(BaseModel):
@@ -46,6 +97,8 @@ class WalletResponse(BaseModel):
     created_at: str
     usage_count: int
     status: str
+    funding_signature: Optional[str] = None
+    funding_error: Optional[str] = None
 
 
 class FundWalletRequest(BaseModel):
@@ -55,6 +108,11 @@ class FundWalletRequest(BaseModel):
     source_wallet_keypair: str = Field(..., description="Base64 encoded source wallet keypair")
 
 
+class GetBalancesRequest(BaseModel):
+    """Request model for bulk balance lookup"""
+    public_keys: Optional[List[str]] = Field(None, description="Wallet public keys (all active wallets if omitted)")
+
+
 def decode_keypair(keypair_str: str) -> Keypair:
     """Decode base64 keypair string"""
     try:
@@ -88,6 +146,8 @@ async def get_burner(request: GetBurnerRequest):
             usage_count=wallet.usage_count,
             status=wallet.status.value
         )
+    except PoolExhaustedError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -104,6 +164,25 @@ async def get_burner_swarm(request: GetBurnerSwarmRequest):
         if request.source_wallet_keypair:
             source_wallet = decode_keypair(request.source_wallet_keypair)
         
+        if request.concurrent and request.auto_fund and source_wallet and request.funding_amount:
+            results = await fabric.get_funded_swarm(
+                count=request.count,
+                source_wallet=source_wallet,
+                funding_amount=request.funding_amount
+            )
+            
+            return [
+                WalletResponse(
+                    public_key=str(r.wallet.public_key),
+                    created_at=r.wallet.created_at.isoformat(),
+                    usage_count=r.wallet.usage_count,
+                    status=r.wallet.status.value,
+                    funding_signature=r.signature,
+                    funding_error=r.error
+                )
+                for r in results
+            ]
+        
         wallets = await fabric.get_burner_swarm(
             count=request.count,
             auto_fund=request.auto_fund,
@@ -120,6 +199,8 @@ async def get_burner_swarm(request: GetBurnerSwarmRequest):
             )
             for w in wallets
         ]
+    except PoolExhaustedError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -136,7 +217,7 @@ async def fund_wallet(request: FundWalletRequest):
         public_key = Pubkey.from_string(request.public_key)
         
         # Get wallet from pool
-        wallet = fabric.pool_manager.get_wallet(public_key)
+        wallet = await fabric.get_wallet(public_key)
         if not wallet:
             raise HTTPException(status_code=404, detail="Wallet not found in pool")
         
@@ -163,7 +244,7 @@ async def get_balance(public_key: str):
     """Get balance of a wallet"""
     try:
         pubkey = Pubkey.from_string(public_key)
-        wallet = fabric.pool_manager.get_wallet(pubkey)
+        wallet = await fabric.get_wallet(pubkey)
         
         if not wallet:
             raise HTTPException(status_code=404, detail="Wallet not found in pool")
@@ -181,17 +262,59 @@ async def get_balance(public_key: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/balances")
+async def get_balances(request: GetBalancesRequest):
+    """Get balances of many wallets in bulk"""
+    try:
+        not_found = []
+        
+        if request.public_keys is None:
+            wallets = list(fabric.pool_manager.active_pool.values())
+        else:
+            wallets = []
+            for public_key in request.public_keys:
+                try:
+                    pubkey = Pubkey.from_string(public_key)
+                except ValueError:
+                    raise HTTPException(status_code=400, detail=f"Invalid public key: {public_key}")
+                
+                wallet = await fabric.get_wallet(pubkey)
+                if wallet:
+                    wallets.append(wallet)
+                else:
+                    not_found.append(public_key)
+        
+        balances = await fabric.get_wallet_balances(wallets)
+        
+        return {
+            "balances": [
+                {
+                    "public_key": str(public_key),
+                    "balance_sol": balance,
+                    "balance_lamports": int(balance * 1_000_000_000)
+                }
+                for public_key, balance in balances.items()
+            ],
+            "not_found": not_found
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/mark-used/{public_key}")
 async def mark_wallet_used(public_key: str):
     """Mark a wallet as used"""
     try:
         pubkey = Pubkey.from_string(public_key)
-        wallet = fabric.pool_manager.get_wallet(pubkey)
+        wallet = await fabric.get_wallet(pubkey)
         
         if not wallet:
             raise HTTPException(status_code=404, detail="Wallet not found in pool")
         
         fabric.mark_wallet_used(wallet)
+        await fabric.wait_durable()
         
         return {
             "success": True,
@@ -209,12 +332,13 @@ async def rotate_wallet(public_key: str):
     """Manually rotate a wallet"""
     try:
         pubkey = Pubkey.from_string(public_key)
-        wallet = fabric.pool_manager.get_wallet(pubkey)
+        wallet = await fabric.get_wallet(pubkey)
         
         if not wallet:
             raise HTTPException(status_code=404, detail="Wallet not found in pool")
         
         fabric.rotate_wallet(wallet)
+        await fabric.wait_durable()
         
         return {
             "success": True,
@@ -237,14 +361,25 @@ async def get_pool_stats():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/rpc-stats")
+async def get_rpc_stats():
+    """Get per-endpoint RPC and blockhash cache statistics"""
+    try:
+        return fabric.get_rpc_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/cleanup")
 async def cleanup_expired():
     """Clean up expired wallets"""
     try:
-        fabric.cleanup_expired_wallets()
+        retired = fabric.cleanup_expired_wallets()
+        await fabric.wait_durable()
         return {
             "success": True,
-            "message": "Cleanup completed"
+            "message": "Cleanup completed",
+            "retired": len(retired)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2,18 +2,29 @@
 FastAPI server for Burner Swarm
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .routes import router
+from .routes import router, fabric
 from ..config.settings import Settings
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start fabric background tasks on startup, stop them on shutdown"""
+    await fabric.start()
+    yield
+    await fabric.close()
+
+
 app = FastAPI(
     title="Evalys Burner Swarm",
     description="Disposable wallet management for Evalys ecosystem",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -7,18 +7,70 @@ Provides wallet generation, pool management, JIT funding, and rotation strategie
 
 from .wallet_generator import WalletGenerator
 from .pool_manager import PoolManager, BurnerWallet, WalletStatus
-from .funding_manager import FundingManager
+from .wallet_store import (
+    WalletStore,
+    SQLiteWalletStore,
+    SharedWalletStore,
+    SharedSQLiteWalletStore,
+    create_wallet_store
+)
+from .journal import JournalWalletStore
+from .tombstones import TombstoneLog
+from .funding_manager import FundingManager, BatchFundingError
+from .confirmation_tracker import (
+    ConfirmationTracker,
+    ConfirmationTimeoutError,
+    TransactionFailedError
+)
+from .blockhash_cache import BlockhashCache
+from .rpc_pool import RpcConnectionPool
+from .rpc_router import RpcRouter
 from .rotation_strategy import RotationStrategy
-from .burner_swarm_fabric import BurnerSwarmFabric
+from .rotation_policy import RotationPolicy, RotationRule, register_rule
+from .replenisher import ReserveReplenisher
+from .expiry_sweeper import ExpirySweeper
+from .lease_keeper import LeaseKeeper
+from .background_loop import BackgroundLoop
+from .checkout_queue import CheckoutQueue, PoolExhaustedError
+from .reserve_sizing import ReserveSizer
+from .parallel_generator import ParallelWalletGenerator
+from .burner_swarm_fabric import BurnerSwarmFabric, SwarmFundingResult, SwarmFundingError
 
 __all__ = [
     "WalletGenerator",
     "PoolManager",
     "BurnerWallet",
     "WalletStatus",
+    "WalletStore",
+    "SQLiteWalletStore",
+    "SharedWalletStore",
+    "SharedSQLiteWalletStore",
+    "create_wallet_store",
+    "JournalWalletStore",
+    "TombstoneLog",
     "FundingManager",
+    "BatchFundingError",
+    "ConfirmationTracker",
+    "ConfirmationTimeoutError",
+    "TransactionFailedError",
+    "BlockhashCache",
+    "RpcConnectionPool",
+    "RpcRouter",
     "RotationStrategy",
+    "RotationPolicy",
+    "RotationRule",
+    "register_rule",
+    "ReserveReplenisher",
+    "ExpirySweeper",
+    "LeaseKeeper",
+    "BackgroundLoop",
+    "CheckoutQueue",
+    "PoolExhaustedError",
+    "ReserveSizer",
+    "ParallelWalletGenerator",
     "BurnerSwarmFabric",
+    "SwarmFundingResult",
+    "SwarmFundingError",
 ]
 
 __version__ = "0.1.0"
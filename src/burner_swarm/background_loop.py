@@ -0,0 +1,103 @@
+"""
+Background Loop
+
+Shared start/stop/wake-up plumbing for the fabric's background tasks.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BackgroundLoop:
+    """
+    Runs a step coroutine repeatedly in a background task
+    
+    The first step runs as soon as the loop starts. After each step the
+    loop waits for notify() or the seconds returned by delay(), whichever
+    comes first (a delay of None waits for notify() only). Step errors are
+    logged and the loop carries on until stop().
+    """
+    
+    def __init__(
+        self,
+        step: Callable[[], Awaitable[object]],
+        delay: Callable[[], Optional[float]],
+        name: str = "Background step"
+    ):
+        """
+        Initialize background loop
+        
+        Args:
+            step: Coroutine function run once per iteration
+            delay: Callable returning seconds to wait before the next step
+            name: Step description used in error logs
+        """
+        self._step = step
+        self._delay = delay
+        self.name = name
+        
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running"""
+        return self._task is not None and not self._task.done()
+    
+    def notify(self):
+        """Run the next step without waiting out the delay"""
+        self._wakeup.set()
+    
+    async def _wait(self, timeout: Optional[float]):
+        """Wait for notify() or the timeout"""
+        # asyncio.wait, unlike wait_for on Python < 3.12, never swallows
+        # a cancellation that races with the event being set
+        waiter = asyncio.ensure_future(self._wakeup.wait())
+        try:
+            await asyncio.wait({waiter}, timeout=timeout)
+        finally:
+            waiter.cancel()
+    
+    async def _run(self):
+        """Background loop"""
+        while True:
+            self._wakeup.clear()
+            try:
+                await self._step()
+            except Exception as e:
+                logger.error(f"{self.name} failed: {e}")
+            await self._wait(self._delay())
+    
+    def start(self) -> bool:
+        """
+        Start the background task (no-op if already running)
+        
+        Returns:
+            True if the task was started
+        """
+        if self.running:
+            return False
+        
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return True
+    
+    async def stop(self) -> bool:
+        """
+        Cancel the background task and wait for it to finish
+        
+        Returns:
+            True if a task was stopped
+        """
+        if self._task is None:
+            return False
+        
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        return True
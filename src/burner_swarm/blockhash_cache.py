@@ -0,0 +1,184 @@
+"""
+Blockhash Cache
+
+Shares one recent blockhash across concurrent fundings and refreshes it
+in the background before it expires.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Tuple
+from solders.hash import Hash
+from .background_loop import BackgroundLoop
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Approximate slot duration in seconds
+SLOT_SECONDS = 0.4
+
+
+@dataclass
+class CachedBlockhash:
+    """
+    Cached blockhash entry
+    
+    Attributes:
+        blockhash: Recent blockhash
+        last_valid_block_height: Last block height at which the blockhash is valid
+        fetched_at: Monotonic fetch time
+        expires_at: Monotonic time after which the entry is stale
+    """
+    blockhash: Hash
+    last_valid_block_height: int
+    fetched_at: float
+    expires_at: float
+
+
+class BlockhashCache:
+    """
+    TTL cache for the latest blockhash with optional background refresh
+    
+    An entry goes stale after ttl seconds, or earlier when the blockhash is
+    within refresh_margin_blocks of its last valid block height.
+    """
+    
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[Tuple[Hash, int, int]]],
+        ttl: float = 20.0,
+        refresh_interval: float = 5.0,
+        refresh_margin_blocks: int = 75
+    ):
+        """
+        Initialize blockhash cache
+        
+        Args:
+            fetch: Coroutine returning (blockhash, last_valid_block_height, current_block_height)
+            ttl: Maximum age of a cached blockhash in seconds
+            refresh_interval: Maximum seconds between background refreshes
+            refresh_margin_blocks: Refresh when fewer blocks of validity remain
+        """
+        self._fetch = fetch
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+        self.refresh_margin_blocks = refresh_margin_blocks
+        
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        
+        self._entry: Optional[CachedBlockhash] = None
+        self._lock = asyncio.Lock()
+        self._refresh_delay = refresh_interval
+        self._loop = BackgroundLoop(
+            self._background_refresh,
+            lambda: self._refresh_delay,
+            name="Blockhash refresh"
+        )
+    
+    def _fresh_entry(self, now: float) -> Optional[CachedBlockhash]:
+        """Get the cached entry if it is usable"""
+        entry = self._entry
+        return entry if entry is not None and now < entry.expires_at else None
+    
+    async def refresh(self) -> CachedBlockhash:
+        """
+        Fetch a new blockhash and replace the cached entry
+        
+        Returns:
+            New cache entry
+        """
+        blockhash, last_valid_block_height, block_height = await self._fetch()
+        now = time.monotonic()
+        
+        remaining_blocks = last_valid_block_height - block_height - self.refresh_margin_blocks
+        validity = min(self.ttl, max(0.0, remaining_blocks * SLOT_SECONDS))
+        
+        self._entry = CachedBlockhash(
+            blockhash=blockhash,
+            last_valid_block_height=last_valid_block_height,
+            fetched_at=now,
+            expires_at=now + validity
+        )
+        self.refreshes += 1
+        
+        logger.debug(f"Refreshed blockhash {blockhash} (valid for {validity:.1f}s)")
+        return self._entry
+    
+    async def get_entry(self) -> CachedBlockhash:
+        """
+        Get a fresh cache entry, fetching only if stale
+        
+        Returns:
+            Cache entry
+        """
+        entry = self._fresh_entry(time.monotonic())
+        if entry is not None:
+            self.hits += 1
+            return entry
+        
+        async with self._lock:
+            # Another caller may have refreshed while we waited
+            entry = self._fresh_entry(time.monotonic())
+            if entry is not None:
+                self.hits += 1
+                return entry
+            
+            self.misses += 1
+            return await self.refresh()
+    
+    async def get(self) -> Hash:
+        """
+        Get a recent blockhash
+        
+        Returns:
+            Recent blockhash
+        """
+        return (await self.get_entry()).blockhash
+    
+    def invalidate(self):
+        """Drop the cached blockhash (e.g. after a blockhash-not-found error)"""
+        self._entry = None
+    
+    async def _background_refresh(self):
+        """Refresh step of the background loop; schedules the next one before expiry"""
+        self._refresh_delay = self.refresh_interval  # Retry after a full interval on failure
+        async with self._lock:
+            entry = await self.refresh()
+        self._refresh_delay = max(0.1, min(self.refresh_interval, entry.expires_at - time.monotonic()))
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background refresher is running"""
+        return self._loop.running
+    
+    def start(self):
+        """Start background refresh"""
+        if self._loop.start():
+            logger.info("Blockhash refresher started")
+    
+    async def stop(self):
+        """Stop background refresh"""
+        if await self._loop.stop():
+            logger.info("Blockhash refresher stopped")
+    
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics
+        
+        Returns:
+            Dictionary with hit/miss counters
+        """
+        age = None
+        if self._entry is not None:
+            age = time.monotonic() - self._entry.fetched_at
+        
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "age_seconds": age,
+            "last_valid_block_height": self._entry.last_valid_block_height if self._entry else None
+        }
@@ -4,17 +4,64 @@ Burner Swarm Fabric
 Main interface for managing burner wallet swarms.
 """
 
-from typing import Optional, List
+import asyncio
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
+from solana.rpc.commitment import Commitment
+from .background_loop import BackgroundLoop
 from .pool_manager import PoolManager, BurnerWallet, WalletStatus
-from .funding_manager import FundingManager
+from .funding_manager import FundingManager, BatchFundingError
 from .rotation_strategy import RotationStrategy
+from .replenisher import ReserveReplenisher
+from .expiry_sweeper import ExpirySweeper
+from .lease_keeper import LeaseKeeper
+from .checkout_queue import CheckoutQueue
+from .reserve_sizing import ReserveSizer
+from .parallel_generator import ParallelWalletGenerator
+from .wallet_store import WalletStore
+from .tombstones import TombstoneLog
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class SwarmFundingResult:
+    """
+    Funding result for a single swarm wallet
+    
+    Attributes:
+        wallet: Funded (or attempted) wallet
+        signature: Transaction signature on success
+        error: Error message on failure
+    """
+    wallet: BurnerWallet
+    signature: Optional[str] = None
+    error: Optional[str] = None
+    
+    @property
+    def success(self) -> bool:
+        """Whether funding succeeded"""
+        return self.error is None
+
+
+class SwarmFundingError(Exception):
+    """
+    Raised when some wallets of a concurrently funded swarm were not funded
+    
+    Attributes:
+        results: Per-wallet funding results (failed wallets are retired)
+    """
+    
+    def __init__(self, results: List[SwarmFundingResult]):
+        self.results = results
+        failed = sum(1 for result in results if not result.success)
+        super().__init__(f"{failed} of {len(results)} swarm fundings failed")
+
+
 class BurnerSwarmFabric:
     """
     Main interface for burner swarm management
@@ -32,7 +79,41 @@ class BurnerSwarmFabric:
         min_reserve_size: int = 5,
         max_active_size: int = 10,
         max_uses: int = 1,
-        max_age_hours: int = 24
+        max_age_hours: int = 24,
+        max_idle_hours: Optional[float] = None,
+        min_balance_sol: Optional[float] = None,
+        reserve_low_watermark: Optional[int] = None,
+        reserve_high_watermark: Optional[int] = None,
+        replenish_batch_size: int = 10,
+        replenish_interval: float = 1.0,
+        adaptive_reserve: bool = False,
+        reserve_target_max: int = 100,
+        reserve_rate_window: float = 10.0,
+        reserve_rate_alpha: float = 0.3,
+        reserve_lead_time: float = 30.0,
+        generation_workers: int = 0,
+        parallel_threshold: int = 100,
+        funding_commitment: Optional[str] = None,
+        confirmation_poll_interval: float = 0.5,
+        confirmation_timeout: float = 60.0,
+        blockhash_ttl: float = 20.0,
+        blockhash_refresh_interval: float = 5.0,
+        blockhash_background_refresh: bool = False,
+        rpc_max_connections: int = 20,
+        rpc_max_keepalive_connections: int = 10,
+        rpc_keepalive_expiry: float = 30.0,
+        rpc_timeout: float = 10.0,
+        rpc_urls: Optional[List[str]] = None,
+        rpc_failure_threshold: int = 5,
+        rpc_breaker_cooldown: float = 30.0,
+        wallet_store: Optional[WalletStore] = None,
+        retired_cache_size: int = 1000,
+        retired_ttl: Optional[float] = 3600.0,
+        tombstone_log: Optional[TombstoneLog] = None,
+        expiry_sweep_batch_size: int = 100,
+        expiry_sweep_max_interval: float = 60.0,
+        lease_heartbeat_interval: float = 10.0,
+        checkout_timeout: float = 10.0
     ):
         """
         Initialize burner swarm fabric
@@ -43,49 +124,297 @@ class BurnerSwarmFabric:
             max_active_size: Maximum active pool size
             max_uses: Maximum uses per wallet
             max_age_hours: Maximum age in hours
+            max_idle_hours: Rotate wallets unused for this many hours (None disables)
+            min_balance_sol: Rotate used wallets drained below this balance (None disables)
+            reserve_low_watermark: Refill reserve below this size (default: min_reserve_size)
+            reserve_high_watermark: Refill reserve up to this size (default: low watermark)
+            replenish_batch_size: Maximum wallets generated per refill batch
+            replenish_interval: Seconds between background reserve checks
+            adaptive_reserve: Size the reserve from the checkout rate (between the
+                low watermark and reserve_target_max)
+            reserve_target_max: Upper bound of the adaptive reserve target
+            reserve_rate_window: Seconds per checkout-rate window
+            reserve_rate_alpha: EWMA smoothing factor per window
+            reserve_lead_time: Seconds of forecast checkouts the reserve should cover
+            generation_workers: Worker processes for large refills (0 disables)
+            parallel_threshold: Minimum batch size generated in worker processes
+            funding_commitment: Commitment fundings wait for ("processed", "confirmed"
+                or "finalized"; None returns once sent)
+            confirmation_poll_interval: Seconds between batched signature status polls
+            confirmation_timeout: Seconds to wait for a funding confirmation
+            blockhash_ttl: Maximum age of a cached blockhash in seconds
+            blockhash_refresh_interval: Seconds between background blockhash refreshes
+            blockhash_background_refresh: Refresh blockhash in the background after start()
+            rpc_max_connections: Maximum concurrent RPC connections
+            rpc_max_keepalive_connections: Maximum idle keep-alive RPC connections
+            rpc_keepalive_expiry: Idle keep-alive connection expiry in seconds
+            rpc_timeout: Per-request RPC timeout in seconds
+            rpc_urls: Multiple RPC endpoints to route across (overrides rpc_url)
+            rpc_failure_threshold: Consecutive failures that open an endpoint's circuit
+            rpc_breaker_cooldown: Seconds an open circuit stays open
+            wallet_store: Optional persistent wallet store (pools survive restarts)
+            retired_cache_size: Maximum retired wallets kept in memory
+            retired_ttl: Seconds a retired wallet stays in memory (None disables)
+            tombstone_log: Optional on-disk log for retired wallets evicted from memory
+            expiry_sweep_batch_size: Maximum wallets the expiry sweeper retires per loop step
+            expiry_sweep_max_interval: Maximum seconds between expiry sweeps
+            lease_heartbeat_interval: Seconds between checkout lease renewals (shared store)
+            checkout_timeout: Seconds get_burner waits for the replenisher when the reserve is empty
         """
+        parallel_generator = None
+        if generation_workers > 0:
+            parallel_generator = ParallelWalletGenerator(workers=generation_workers)
+        
         self.pool_manager = PoolManager(
             min_reserve_size=min_reserve_size,
-            max_active_size=max_active_size
+            max_active_size=max_active_size,
+            parallel_generator=parallel_generator,
+            parallel_threshold=parallel_threshold,
+            store=wallet_store,
+            retired_cache_size=retired_cache_size,
+            retired_ttl=retired_ttl,
+            tombstones=tombstone_log
         )
         
-        self.funding_manager = FundingManager(rpc_url=rpc_url)
+        self.funding_manager = FundingManager(
+            rpc_url=rpc_url,
+            blockhash_ttl=blockhash_ttl,
+            blockhash_refresh_interval=blockhash_refresh_interval,
+            rpc_max_connections=rpc_max_connections,
+            rpc_max_keepalive_connections=rpc_max_keepalive_connections,
+            rpc_keepalive_expiry=rpc_keepalive_expiry,
+            rpc_timeout=rpc_timeout,
+            rpc_urls=rpc_urls,
+            rpc_failure_threshold=rpc_failure_threshold,
+            rpc_breaker_cooldown=rpc_breaker_cooldown,
+            confirmation_poll_interval=confirmation_poll_interval,
+            confirmation_timeout=confirmation_timeout
+        )
+        self.funding_commitment = Commitment(funding_commitment) if funding_commitment else None
+        self.blockhash_background_refresh = blockhash_background_refresh
         self.rotation_strategy = RotationStrategy(
             max_uses=max_uses,
+            max_age_hours=max_age_hours,
+            max_idle_hours=max_idle_hours,
+            min_balance_sol=min_balance_sol
+        )
+        for wallet in self.pool_manager.active_pool.values():
+            self.rotation_strategy.track(wallet)
+        
+        # Wallet generation is CPU-bound, keep it off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="burner-refill")
+        self._refill_task: Optional[asyncio.Task] = None
+        self._flush_loop = BackgroundLoop(
+            self._flush_store,
+            lambda: wallet_store.flush_interval if wallet_store is not None else None,
+            name="Wallet store flush"
+        )
+        self._tombstone_loop = BackgroundLoop(
+            self._maintain_tombstones,
+            lambda: tombstone_log.flush_interval if tombstone_log is not None else None,
+            name="Tombstone maintenance"
+        )
+        
+        # Checkouts on an empty reserve queue for the replenisher
+        self.checkout_queue = CheckoutQueue(
+            self.pool_manager,
+            timeout=checkout_timeout,
+            poll_interval=replenish_interval,
+            on_wait=self._schedule_refill
+        )
+        
+        low_watermark = min_reserve_size if reserve_low_watermark is None else reserve_low_watermark
+        high_watermark = low_watermark if reserve_high_watermark is None else reserve_high_watermark
+        
+        # Checkout rate is always tracked; the replenisher follows it if adaptive
+        self.adaptive_reserve = adaptive_reserve
+        self.reserve_sizer = ReserveSizer(
+            min_size=low_watermark,
+            max_size=max(low_watermark, reserve_target_max),
+            window=reserve_rate_window,
+            alpha=reserve_rate_alpha,
+            lead_time=reserve_lead_time,
             max_age_hours=max_age_hours
         )
         
+        self.replenisher = ReserveReplenisher(
+            self.pool_manager,
+            executor=self._executor,
+            low_watermark=low_watermark,
+            high_watermark=high_watermark,
+            batch_size=replenish_batch_size,
+            interval=replenish_interval,
+            demand=lambda: self.checkout_queue.waiting,
+            on_added=self._on_reserve_added,
+            sizer=self.reserve_sizer if adaptive_reserve else None
+        )
+        
+        self.expiry_sweeper = ExpirySweeper(
+            self.pool_manager,
+            max_age_hours=max_age_hours,
+            batch_size=expiry_sweep_batch_size,
+            max_interval=expiry_sweep_max_interval,
+            on_retired=self._on_wallets_retired
+        )
+        
+        # Checkout leases on a shared store
+        self.lease_keeper: Optional[LeaseKeeper] = None
+        if self.pool_manager.shared:
+            self.lease_keeper = LeaseKeeper(
+                self.pool_manager,
+                interval=lease_heartbeat_interval,
+                on_lost=self._on_leases_lost
+            )
+        
         # Initialize reserve pool
         self.pool_manager.maintain_reserve_pool()
         
         logger.info("BurnerSwarmFabric initialized")
     
+    async def start(self):
+        """Start background tasks (reserve replenisher, expiry sweeper, lease keeper, blockhash refresher)"""
+        self.replenisher.start()
+        self.expiry_sweeper.start()
+        if self.lease_keeper is not None:
+            self.lease_keeper.start()
+        store = self.pool_manager.store
+        if store is not None and store.flush_interval:
+            self._flush_loop.start()
+        if self.pool_manager.tombstones is not None:
+            self._tombstone_loop.start()
+        if self.blockhash_background_refresh:
+            self.funding_manager.start_blockhash_refresher()
+        logger.info("BurnerSwarmFabric started")
+    
+    async def stop(self):
+        """Stop background tasks"""
+        await self.replenisher.stop()
+        await self.expiry_sweeper.stop()
+        if self.lease_keeper is not None:
+            await self.lease_keeper.stop()
+        await self.funding_manager.blockhash_cache.stop()
+        await self.funding_manager.confirmations.stop()
+        
+        if await self._flush_loop.stop():
+            self.pool_manager.flush()
+        await self._tombstone_loop.stop()
+        
+        if self._refill_task is not None and not self._refill_task.done():
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except asyncio.CancelledError:
+                pass
+        self._refill_task = None
+        
+        logger.info("BurnerSwarmFabric stopped")
+    
+    async def _flush_store(self):
+        """Flush buffered wallet store writes (periodic)"""
+        self.pool_manager.flush()
+    
+    async def _maintain_tombstones(self):
+        """Spill stale retired wallets and flush/compact the tombstone log off the loop (periodic)"""
+        self.pool_manager.evict_retired()
+        await asyncio.get_running_loop().run_in_executor(None, self.pool_manager.tombstones.maintain)
+    
+    def _on_reserve_added(self, added: int):
+        """Serve queued checkouts from a batch the replenisher just added"""
+        self.checkout_queue.serve()
+    
+    async def get_wallet(self, public_key: Pubkey) -> Optional[BurnerWallet]:
+        """
+        Get wallet from any pool
+        
+        Tombstone reads for retired wallets evicted from memory run in an
+        executor thread; keys the tombstone index rules out return without
+        touching the disk.
+        
+        Args:
+            public_key: Wallet public key
+            
+        Returns:
+            Wallet if found, None otherwise
+        """
+        wallet = self.pool_manager.get_wallet(public_key, include_tombstones=False)
+        tombstones = self.pool_manager.tombstones
+        if wallet is None and tombstones is not None and tombstones.might_contain(public_key):
+            wallet = await asyncio.get_running_loop().run_in_executor(None, tombstones.find, public_key)
+        return wallet
+    
+    async def wait_durable(self):
+        """
+        Wait until committed checkouts and retirements are durable
+        
+        Runs the wait in an executor thread, so an asynchronous store's
+        group commit does not block the event loop.
+        """
+        if not self.pool_manager.durable:
+            await asyncio.get_running_loop().run_in_executor(None, self.pool_manager.wait_durable)
+    
+    async def replenish_reserve(self) -> int:
+        """
+        Refill reserve pool without blocking the event loop
+        
+        Wallets are generated and encrypted in the executor; only the final
+        insertion into the reserve pool happens on the event loop.
+        
+        Returns:
+            Number of wallets added to reserve
+        """
+        return await self.replenisher.replenish()
+    
+    def _schedule_refill(self):
+        """Schedule a reserve refill in the background"""
+        if self.replenisher.running:
+            self.replenisher.notify()
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync usage), refill inline
+            self.pool_manager.maintain_reserve_pool()
+            return
+        
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = loop.create_task(self.replenish_reserve())
+    
     async def get_burner(
         self,
         auto_fund: bool = False,
         source_wallet: Optional[Keypair] = None,
-        funding_amount: Optional[float] = None
+        funding_amount: Optional[float] = None,
+        timeout: Optional[float] = None
     ) -> BurnerWallet:
         """
         Get a burner wallet from the pool
         
+        If the reserve is empty, waits for the replenisher rather than
+        generating a wallet inline.
+        
         Args:
             auto_fund: Automatically fund the wallet
             source_wallet: Source wallet for funding
             funding_amount: Amount to fund (if auto_fund is True)
+            timeout: Seconds to wait for an empty reserve (default: checkout_timeout)
             
         Returns:
             BurnerWallet instance
+            
+        Raises:
+            PoolExhaustedError: If no wallet became available within the timeout
         """
-        # Get from reserve or generate new
-        wallet = self.pool_manager.get_from_reserve()
+        wallet = await self.checkout_queue.checkout(timeout)
+        self.reserve_sizer.record_checkout()
         
-        if wallet is None:
-            logger.info("Reserve pool empty, generating new wallet")
-            wallet = self.pool_manager.generate_wallet()
+        # Activate wallet; it is handed out only once the checkout is durable
+        wallet = self.pool_manager.activate_wallet(wallet, wait=False)
+        self.rotation_strategy.track(wallet)
+        await self.wait_durable()
         
-        # Activate wallet
-        wallet = self.pool_manager.activate_wallet(wallet)
+        # Maintain reserve pool in the background
+        self._schedule_refill()
         
         # Auto-fund if requested
         if auto_fund and source_wallet and funding_amount:
@@ -93,16 +422,15 @@ class BurnerSwarmFabric:
                 await self.funding_manager.fund_wallet_jit(
                     wallet.public_key,
                     source_wallet,
-                    funding_amount
+                    funding_amount,
+                    commitment=self.funding_commitment
                 )
                 logger.info(f"Auto-funded wallet {wallet.public_key} with {funding_amount} SOL")
             except Exception as e:
                 logger.error(f"Failed to auto-fund wallet: {e}")
+                await self._retire_unissued([wallet])
                 raise
         
-        # Maintain reserve pool
-        self.pool_manager.maintain_reserve_pool()
-        
         logger.debug(f"Retrieved burner wallet: {wallet.public_key}")
         return wallet
     
@@ -111,7 +439,8 @@ class BurnerSwarmFabric:
         count: int,
         auto_fund: bool = False,
         source_wallet: Optional[Keypair] = None,
-        funding_amount: Optional[float] = None
+        funding_amount: Optional[float] = None,
+        concurrent: bool = False
     ) -> List[BurnerWallet]:
         """
         Get multiple burner wallets (swarm)
@@ -121,37 +450,154 @@ class BurnerSwarmFabric:
             auto_fund: Automatically fund wallets
             source_wallet: Source wallet for funding
             funding_amount: Amount to fund per wallet
+            concurrent: Check out all wallets first, then fund them in batched
+                transfers (use get_funded_swarm() for per-wallet results)
             
         Returns:
             List of BurnerWallet instances
+            
+        Raises:
+            PoolExhaustedError: If a checkout timed out (wallets already
+                checked out for the swarm are retired)
+            SwarmFundingError: If a concurrent funding failed (the unfunded
+                wallets are retired; the funded ones stay in its results)
         """
-        wallets = []
+        if concurrent and auto_fund and source_wallet and funding_amount:
+            results = await self.get_funded_swarm(count, source_wallet, funding_amount)
+            unfunded = [result.wallet for result in results if not result.success]
+            if unfunded:
+                await self._retire_unissued(unfunded)
+                raise SwarmFundingError(results)
+            return [result.wallet for result in results]
         
-        for i in range(count):
-            wallet = await self.get_burner(
-                auto_fund=auto_fund,
-                source_wallet=source_wallet,
-                funding_amount=funding_amount
-            )
-            wallets.append(wallet)
+        wallets: List[BurnerWallet] = []
+        
+        try:
+            for _ in range(count):
+                wallet = await self.get_burner(
+                    auto_fund=auto_fund,
+                    source_wallet=source_wallet,
+                    funding_amount=funding_amount
+                )
+                wallets.append(wallet)
+        except BaseException:
+            await self._retire_unissued(wallets)
+            raise
         
         logger.info(f"Retrieved burner swarm of {count} wallets")
         return wallets
     
+    async def get_funded_swarm(
+        self,
+        count: int,
+        source_wallet: Keypair,
+        funding_amount: float
+    ) -> List[SwarmFundingResult]:
+        """
+        Get multiple burner wallets and fund them in batched transfers
+        
+        All wallets are checked out first, then funded together through
+        fund_wallets(). A failed transfer does not abort the others. If a
+        checkout (or funding as a whole) raises, the wallets already
+        checked out are retired rather than left active and unreturned.
+        
+        Args:
+            count: Number of wallets to get
+            source_wallet: Source wallet for funding
+            funding_amount: Amount to fund per wallet
+            
+        Returns:
+            List of per-wallet funding results
+            
+        Raises:
+            PoolExhaustedError: If a checkout timed out
+        """
+        wallets: List[BurnerWallet] = []
+        try:
+            for _ in range(count):
+                wallets.append(await self.get_burner())
+            results = await self.fund_wallets(wallets, source_wallet, funding_amount)
+        except BaseException:
+            await self._retire_unissued(wallets)
+            raise
+        
+        failed = sum(1 for result in results if not result.success)
+        logger.info(f"Retrieved funded burner swarm of {count} wallets ({failed} funding failures)")
+        return results
+    
+    async def fund_wallets(
+        self,
+        wallets: List[BurnerWallet],
+        source_wallet: Keypair,
+        funding_amount: float
+    ) -> List[SwarmFundingResult]:
+        """
+        Fund multiple wallets with multi-transfer transactions
+        
+        Each wallet gets the same just-in-time amount as fund_wallet_jit();
+        the transfers are packed and sent by FundingManager.fund_wallets_batch(),
+        which retries the recipients of a failed transaction one by one, so
+        each result reflects that wallet's own transfer.
+        
+        Args:
+            wallets: Wallets to fund
+            source_wallet: Source wallet for funding
+            funding_amount: Amount to fund per wallet
+            
+        Returns:
+            List of per-wallet funding results, in the order of wallets
+        """
+        if not wallets:
+            return []
+        
+        amount = await self.funding_manager.calculate_funding_amount(funding_amount)
+        signatures: Dict[Pubkey, str] = {}
+        failed: Dict[Pubkey, Exception] = {}
+        try:
+            signatures = await self.funding_manager.fund_wallets_batch(
+                {wallet.public_key: amount for wallet in wallets},
+                source_wallet,
+                commitment=self.funding_commitment
+            )
+        except BatchFundingError as e:
+            signatures = e.signatures
+            failed = e.failed
+        except Exception as e:
+            logger.error(f"Failed to auto-fund swarm of {len(wallets)} wallets: {e}")
+            failed = {wallet.public_key: e for wallet in wallets}
+        
+        results = []
+        for wallet in wallets:
+            signature = signatures.get(wallet.public_key)
+            if signature is not None:
+                logger.info(f"Auto-funded wallet {wallet.public_key} with {funding_amount} SOL")
+                results.append(SwarmFundingResult(wallet=wallet, signature=signature))
+            else:
+                error = failed.get(wallet.public_key, "not funded")
+                logger.error(f"Failed to auto-fund wallet {wallet.public_key}: {error}")
+                results.append(SwarmFundingResult(wallet=wallet, error=str(error)))
+        return results
+    
     def mark_wallet_used(self, wallet: BurnerWallet):
         """
         Mark wallet as used
         
+        A resulting rotation is committed without waiting; await
+        wait_durable() before reporting it.
+        
         Args:
             wallet: Wallet to mark
         """
-        wallet.mark_used()
+        self.pool_manager.mark_used(wallet)
         
         # Check if should rotate
         if self.rotation_strategy.should_rotate(wallet):
             logger.info(f"Rotating wallet {wallet.public_key} (usage: {wallet.usage_count})")
-            self.pool_manager.retire_wallet(wallet)
-            self.pool_manager.maintain_reserve_pool()
+            self.rotation_strategy.untrack(wallet)
+            self.pool_manager.retire_wallet(wallet, wait=False)
+            self._schedule_refill()
+        else:
+            self.rotation_strategy.record_use(wallet)
     
     async def fund_wallet(
         self,
@@ -173,7 +619,8 @@ class BurnerSwarmFabric:
         return await self.funding_manager.fund_wallet_jit(
             wallet.public_key,
             source_wallet,
-            amount_sol
+            amount_sol,
+            commitment=self.funding_commitment
         )
     
     async def get_wallet_balance(self, wallet: BurnerWallet) -> float:
@@ -186,36 +633,128 @@ class BurnerSwarmFabric:
         Returns:
             Balance in SOL
         """
-        return await self.funding_manager.get_balance(wallet.public_key)
+        balance = await self.funding_manager.get_balance(wallet.public_key)
+        self.rotation_strategy.record_balance(wallet, balance)
+        return balance
+    
+    async def get_wallet_balances(self, wallets: List[BurnerWallet]) -> Dict[Pubkey, float]:
+        """
+        Get balances of many wallets in bulk
+        
+        Args:
+            wallets: Wallets to check
+            
+        Returns:
+            Public key mapped to balance in SOL
+        """
+        balances = await self.funding_manager.get_balances([w.public_key for w in wallets])
+        for wallet in wallets:
+            balance = balances.get(wallet.public_key)
+            if balance is not None:
+                self.rotation_strategy.record_balance(wallet, balance)
+        return balances
     
     def rotate_wallet(self, wallet: BurnerWallet):
         """
         Manually rotate a wallet
         
+        The retirement is committed without waiting; await wait_durable()
+        before reporting it.
+        
         Args:
             wallet: Wallet to rotate
         """
-        self.pool_manager.retire_wallet(wallet)
-        self.pool_manager.maintain_reserve_pool()
+        self.rotation_strategy.untrack(wallet)
+        self.pool_manager.retire_wallet(wallet, wait=False)
+        self._schedule_refill()
         logger.info(f"Manually rotated wallet {wallet.public_key}")
     
-    def cleanup_expired_wallets(self):
-        """Clean up expired wallets"""
-        self.pool_manager.cleanup_expired_wallets(
-            max_age_hours=self.rotation_strategy.max_age_hours
+    async def _retire_unissued(self, wallets: List[BurnerWallet]):
+        """Retire checked-out wallets that a failed call never returned"""
+        if not wallets:
+            return
+        
+        for wallet in wallets:
+            self.rotation_strategy.untrack(wallet)
+            self.pool_manager.retire_wallet(wallet, wait=False)
+        await self.wait_durable()
+        self._schedule_refill()
+        logger.warning(f"Retired {len(wallets)} checked-out wallets after a failed swarm request")
+    
+    def get_rotation_candidates(self, count: int) -> List[BurnerWallet]:
+        """
+        Get the active wallets most in need of rotation
+        
+        Args:
+            count: Maximum number of wallets to return
+            
+        Returns:
+            List of wallets, most used (then oldest) first
+        """
+        return self.rotation_strategy.top_candidates(count)
+    
+    def _on_wallets_retired(self, retired: List[BurnerWallet]):
+        """Forget expired wallets, count unused ones as losses and refill the reserve"""
+        for wallet in retired:
+            self.rotation_strategy.untrack(wallet)
+        self.reserve_sizer.record_expired(sum(1 for wallet in retired if wallet.usage_count == 0))
+        self._schedule_refill()
+    
+    def _on_leases_lost(self, lost: List[BurnerWallet]):
+        """Forget wallets reclaimed by another instance"""
+        for wallet in lost:
+            self.rotation_strategy.untrack(wallet)
+    
+    def cleanup_expired_wallets(self) -> List[BurnerWallet]:
+        """
+        Clean up expired wallets
+        
+        Retirements are committed without waiting; await wait_durable()
+        before reporting them.
+        
+        Returns:
+            List of retired wallets
+        """
+        retired = self.pool_manager.cleanup_expired_wallets(
+            max_age_hours=self.rotation_strategy.max_age_hours,
+            wait=False
         )
+        for wallet in retired:
+            self.rotation_strategy.untrack(wallet)
+        self.reserve_sizer.record_expired(sum(1 for wallet in retired if wallet.usage_count == 0))
+        return retired
     
     def get_pool_stats(self) -> dict:
         """
         Get pool statistics
         
         Returns:
-            Dictionary with pool stats
+            Dictionary with pool stats (including expiry sweeper, checkout queue
+            and reserve sizing stats)
+        """
+        stats = self.pool_manager.get_pool_stats()
+        stats["expiry_sweeper"] = self.expiry_sweeper.get_stats()
+        stats["checkout"] = self.checkout_queue.get_stats()
+        stats["reserve_sizing"] = {"adaptive": self.adaptive_reserve, **self.reserve_sizer.get_stats()}
+        if self.lease_keeper is not None:
+            stats["leases"] = self.lease_keeper.get_stats()
+        return stats
+    
+    def get_rpc_stats(self) -> dict:
+        """
+        Get RPC statistics
+        
+        Returns:
+            Dictionary with per-endpoint, blockhash cache and confirmation stats
         """
-        return self.pool_manager.get_pool_stats()
+        return self.funding_manager.get_rpc_stats()
     
     async def close(self):
         """Close connections and cleanup"""
+        await self.stop()
+        self._executor.shutdown(wait=True)
+        self.pool_manager.close()
+        
         await self.funding_manager.disconnect()
         logger.info("BurnerSwarmFabric closed")
 
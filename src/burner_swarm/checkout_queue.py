@@ -0,0 +1,182 @@
+"""
+Checkout Queue
+
+Awaitable reserve checkout with backpressure: when the reserve is empty,
+callers queue for wallets from the replenisher instead of generating
+their own.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+from .pool_manager import PoolManager, BurnerWallet
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PoolExhaustedError(Exception):
+    """
+    Raised when no reserve wallet became available within the checkout timeout
+    
+    Attributes:
+        timeout: Seconds the checkout waited
+        waiting: Checkouts still queued when it gave up
+    """
+    
+    def __init__(self, timeout: float, waiting: int):
+        self.timeout = timeout
+        self.waiting = waiting
+        super().__init__(f"Wallet pool exhausted: no reserve wallet within {timeout}s ({waiting} checkouts waiting)")
+
+
+class CheckoutQueue:
+    """
+    FIFO queue of checkouts waiting for reserve wallets
+    
+    A checkout takes a reserve wallet immediately if nobody is queued;
+    otherwise it waits (up to a timeout) to be handed a wallet by serve(),
+    which the replenisher calls as it adds wallets. Waiters also re-check
+    every poll_interval, for shared stores refilled by other instances.
+    """
+    
+    def __init__(
+        self,
+        pool_manager: PoolManager,
+        timeout: float = 10.0,
+        poll_interval: float = 1.0,
+        on_wait: Optional[Callable[[], None]] = None
+    ):
+        """
+        Initialize checkout queue
+        
+        Args:
+            pool_manager: Pool manager to check out from
+            timeout: Default seconds a checkout waits before PoolExhaustedError
+            poll_interval: Seconds between reserve re-checks while waiting
+            on_wait: Optional callback requesting a refill while checkouts wait
+        """
+        self.pool_manager = pool_manager
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.on_wait = on_wait
+        
+        self._waiters: Deque[asyncio.Future[BurnerWallet]] = deque()
+        
+        # Stats
+        self.immediate = 0
+        self.waited = 0
+        self.timeouts = 0
+        self.max_waiting = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+    
+    @property
+    def waiting(self) -> int:
+        """Number of queued checkouts"""
+        return len(self._waiters)
+    
+    async def checkout(self, timeout: Optional[float] = None) -> BurnerWallet:
+        """
+        Check out a reserve wallet, waiting for one if the reserve is empty
+        
+        Args:
+            timeout: Seconds to wait (default: queue timeout)
+            
+        Returns:
+            Wallet taken from the reserve (not yet activated)
+            
+        Raises:
+            PoolExhaustedError: If no wallet became available in time
+        """
+        # Queued checkouts are served first
+        if not self._waiters:
+            wallet = self.pool_manager.get_from_reserve()
+            if wallet is not None:
+                self.immediate += 1
+                return wallet
+        
+        return await self._wait(self.timeout if timeout is None else timeout)
+    
+    async def _wait(self, timeout: float) -> BurnerWallet:
+        """Queue until serve() hands over a wallet or the timeout passes"""
+        waiter: asyncio.Future[BurnerWallet] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.max_waiting = max(self.max_waiting, len(self._waiters))
+        start = time.monotonic()
+        deadline = start + timeout
+        
+        try:
+            while not waiter.done():
+                if self.on_wait is not None:
+                    self.on_wait()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                await asyncio.wait({waiter}, timeout=min(remaining, self.poll_interval))
+                if not waiter.done():
+                    self.serve()
+        except BaseException:
+            # Cancelled: hand back a wallet that was already assigned
+            if waiter.done():
+                self.pool_manager.add_to_reserve(waiter.result())
+            else:
+                self._discard(waiter)
+            raise
+        
+        if not waiter.done():
+            self._discard(waiter)
+            self.timeouts += 1
+            logger.warning(f"Checkout timed out after {timeout}s ({len(self._waiters)} still waiting)")
+            raise PoolExhaustedError(timeout, len(self._waiters))
+        
+        wait = time.monotonic() - start
+        self.waited += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.last_wait = wait
+        return waiter.result()
+    
+    def _discard(self, waiter: asyncio.Future[BurnerWallet]):
+        """Remove an unserved waiter from the queue"""
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+    
+    def serve(self) -> int:
+        """
+        Hand reserve wallets to queued checkouts in arrival order
+        
+        Returns:
+            Number of checkouts served
+        """
+        served = 0
+        while self._waiters:
+            wallet = self.pool_manager.get_from_reserve()
+            if wallet is None:
+                break
+            self._waiters.popleft().set_result(wallet)
+            served += 1
+        return served
+    
+    def get_stats(self) -> dict:
+        """
+        Get checkout statistics
+        
+        Returns:
+            Dictionary with queue depth and wait times
+        """
+        return {
+            "waiting": len(self._waiters),
+            "max_waiting": self.max_waiting,
+            "immediate": self.immediate,
+            "waited": self.waited,
+            "timeouts": self.timeouts,
+            "avg_wait": self.total_wait / self.waited if self.waited else 0.0,
+            "max_wait": self.max_wait,
+            "last_wait": self.last_wait
+        }
@@ -0,0 +1,323 @@
+"""
+Confirmation Tracker
+
+Tracks in-flight transaction signatures and confirms them with batched
+getSignatureStatuses polling instead of one blocking wait per transaction.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Union
+from solders.signature import Signature
+from solana.rpc.commitment import Commitment, Confirmed, Finalized, Processed
+from .background_loop import BackgroundLoop
+from .rpc_router import RpcRouter
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Maximum signatures per getSignatureStatuses request
+MAX_SIGNATURE_STATUSES = 256
+
+# Same ordering as int(TransactionConfirmationStatus)
+_COMMITMENT_LEVELS = {Processed: 0, Confirmed: 1, Finalized: 2}
+
+
+class TransactionFailedError(Exception):
+    """
+    Raised when a tracked transaction landed with an error
+    
+    Attributes:
+        signature: Transaction signature
+        error: Transaction error reported by the RPC
+    """
+    
+    def __init__(self, signature: str, error):
+        self.signature = signature
+        self.error = error
+        super().__init__(f"Transaction {signature} failed: {error}")
+
+
+class ConfirmationTimeoutError(Exception):
+    """
+    Raised when a tracked transaction was not confirmed in time
+    
+    Attributes:
+        signature: Transaction signature
+        commitment: Commitment level that was awaited
+    """
+    
+    def __init__(self, signature: str, commitment: Commitment):
+        self.signature = signature
+        self.commitment = commitment
+        super().__init__(f"Transaction {signature} not {commitment} in time")
+
+
+class _Waiter:
+    """Future awaiting one commitment level of a signature"""
+    
+    __slots__ = ("future", "level", "commitment", "deadline")
+    
+    def __init__(self, future: asyncio.Future, commitment: Commitment, deadline: float):
+        self.future = future
+        self.level = _COMMITMENT_LEVELS[commitment]
+        self.commitment = commitment
+        self.deadline = deadline
+
+
+class ConfirmationTracker:
+    """
+    Confirms many transactions with a few polling requests
+    
+    track() registers a signature and returns a future; a background loop
+    polls getSignatureStatuses for every pending signature in chunks of
+    MAX_SIGNATURE_STATUSES every poll_interval seconds, and resolves each
+    future once its signature reaches the commitment that caller asked for.
+    Several callers may await the same signature at different levels.
+    """
+    
+    def __init__(
+        self,
+        rpc: RpcRouter,
+        poll_interval: float = 0.5,
+        timeout: float = 60.0,
+        batch_size: int = MAX_SIGNATURE_STATUSES
+    ):
+        """
+        Initialize confirmation tracker
+        
+        Args:
+            rpc: RPC router to poll
+            poll_interval: Seconds between status polls while signatures are pending
+            timeout: Default seconds to wait for a confirmation
+            batch_size: Signatures per getSignatureStatuses request
+        """
+        self.rpc = rpc
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.batch_size = min(batch_size, MAX_SIGNATURE_STATUSES)
+        
+        self._pending: Dict[Signature, List[_Waiter]] = {}
+        # Polls every poll_interval while signatures are pending, then idles until track()
+        self._loop = BackgroundLoop(
+            self.poll,
+            lambda: self.poll_interval if self._pending else None,
+            name="Confirmation poll"
+        )
+        
+        # Stats
+        self.tracked = 0
+        self.confirmed = 0
+        self.failed = 0
+        self.expired = 0
+        self.polls = 0
+        self.requests = 0
+        self.last_poll_size = 0
+        
+        logger.info(f"ConfirmationTracker initialized: poll_interval={poll_interval}s, timeout={timeout}s")
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running"""
+        return self._loop.running
+    
+    @property
+    def pending(self) -> int:
+        """Number of signatures awaiting confirmation"""
+        return len(self._pending)
+    
+    def track(
+        self,
+        signature: Union[str, Signature],
+        commitment: Commitment = Commitment(Confirmed),
+        timeout: Optional[float] = None
+    ) -> asyncio.Future:
+        """
+        Start tracking a signature (starts the poll loop if needed)
+        
+        Args:
+            signature: Transaction signature
+            commitment: Commitment level to resolve at
+            timeout: Seconds before the future fails (default: tracker timeout)
+            
+        Returns:
+            Future resolving to the signature status, or failing with
+            TransactionFailedError / ConfirmationTimeoutError
+        """
+        if commitment not in _COMMITMENT_LEVELS:
+            raise ValueError(f"Unsupported commitment: {commitment}")
+        if isinstance(signature, str):
+            signature = Signature.from_string(signature)
+        
+        future = asyncio.get_running_loop().create_future()
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        idle = not self._pending
+        self._pending.setdefault(signature, []).append(_Waiter(future, commitment, deadline))
+        self.tracked += 1
+        
+        # A busy loop picks the signature up on its next poll
+        if not self.start() and idle:
+            self._loop.notify()
+        return future
+    
+    async def confirm(
+        self,
+        signature: Union[str, Signature],
+        commitment: Commitment = Commitment(Confirmed),
+        timeout: Optional[float] = None
+    ):
+        """
+        Wait until a signature reaches a commitment level
+        
+        Args:
+            signature: Transaction signature
+            commitment: Commitment level to wait for
+            timeout: Seconds to wait (default: tracker timeout)
+            
+        Returns:
+            Signature status
+            
+        Raises:
+            TransactionFailedError: If the transaction landed with an error
+            ConfirmationTimeoutError: If it was not confirmed in time
+        """
+        return await self.track(signature, commitment, timeout)
+    
+    async def poll(self) -> int:
+        """
+        Fetch statuses of all pending signatures and resolve their futures
+        
+        Returns:
+            Number of futures resolved (confirmed, failed or expired)
+        """
+        self._prune()
+        if not self._pending:
+            return 0
+        
+        signatures = list(self._pending)
+        chunks = [
+            signatures[i:i + self.batch_size]
+            for i in range(0, len(signatures), self.batch_size)
+        ]
+        responses = await asyncio.gather(
+            *(self.rpc.request("get_signature_statuses", chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+        self.polls += 1
+        self.requests += len(chunks)
+        self.last_poll_size = len(signatures)
+        
+        resolved = 0
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, BaseException):
+                logger.warning(f"Signature status poll failed for {len(chunk)} signatures: {response}")
+                continue
+            for signature, status in zip(chunk, response.value):
+                if status is not None:
+                    resolved += self._resolve(signature, status)
+        
+        return resolved + self._expire(time.monotonic())
+    
+    def _resolve(self, signature: Signature, status) -> int:
+        """Settle the waiters a status satisfies"""
+        waiters = self._pending.get(signature)
+        if not waiters:
+            return 0
+        
+        if status.err is not None:
+            del self._pending[signature]
+            error = TransactionFailedError(str(signature), status.err)
+            for waiter in waiters:
+                if not waiter.future.done():
+                    waiter.future.set_exception(error)
+                    self.failed += 1
+            return len(waiters)
+        
+        # Statuses without a confirmation level are already rooted
+        level = 2 if status.confirmation_status is None else int(status.confirmation_status)
+        remaining = []
+        resolved = 0
+        for waiter in waiters:
+            if waiter.level <= level:
+                if not waiter.future.done():
+                    waiter.future.set_result(status)
+                    self.confirmed += 1
+                resolved += 1
+            else:
+                remaining.append(waiter)
+        
+        if remaining:
+            self._pending[signature] = remaining
+        else:
+            del self._pending[signature]
+        return resolved
+    
+    def _expire(self, now: float) -> int:
+        """Fail waiters past their deadline"""
+        expired = 0
+        for signature in list(self._pending):
+            waiters = self._pending[signature]
+            remaining = []
+            for waiter in waiters:
+                if waiter.deadline > now:
+                    remaining.append(waiter)
+                    continue
+                if not waiter.future.done():
+                    waiter.future.set_exception(ConfirmationTimeoutError(str(signature), waiter.commitment))
+                    self.expired += 1
+                expired += 1
+            if remaining:
+                self._pending[signature] = remaining
+            else:
+                del self._pending[signature]
+        return expired
+    
+    def _prune(self):
+        """Drop waiters whose caller went away (cancelled futures)"""
+        for signature in list(self._pending):
+            waiters = [w for w in self._pending[signature] if not w.future.done()]
+            if waiters:
+                self._pending[signature] = waiters
+            else:
+                del self._pending[signature]
+    
+    def start(self) -> bool:
+        """
+        Start background polling
+        
+        Returns:
+            True if polling was started (False if already running)
+        """
+        if not self._loop.start():
+            return False
+        logger.info("ConfirmationTracker started")
+        return True
+    
+    async def stop(self):
+        """Stop background polling (pending futures are cancelled)"""
+        if await self._loop.stop():
+            logger.info("ConfirmationTracker stopped")
+        
+        for waiters in self._pending.values():
+            for waiter in waiters:
+                waiter.future.cancel()
+        self._pending.clear()
+    
+    def get_stats(self) -> dict:
+        """
+        Get confirmation statistics
+        
+        Returns:
+            Dictionary with pending signatures and poll counters
+        """
+        return {
+            "running": self.running,
+            "pending": len(self._pending),
+            "tracked": self.tracked,
+            "confirmed": self.confirmed,
+            "failed": self.failed,
+            "expired": self.expired,
+            "polls": self.polls,
+            "requests": self.requests,
+            "last_poll_size": self.last_poll_size
+        }
@@ -0,0 +1,161 @@
+"""
+Expiry Sweeper
+
+Background task that retires expired wallets as their deadlines pass.
+"""
+
+import asyncio
+import time
+from typing import Callable, List, Optional
+from .background_loop import BackgroundLoop
+from .pool_manager import PoolManager, BurnerWallet
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds added to a deadline so the wallet is strictly past max age on wake-up
+DEADLINE_SLACK = 0.05
+
+
+class ExpirySweeper:
+    """
+    Retires expired wallets in bounded batches
+    
+    Sleeps until the next expiry deadline (at most max_interval), then
+    retires due wallets batch_size at a time, yielding to the event loop
+    between batches.
+    """
+    
+    def __init__(
+        self,
+        pool_manager: PoolManager,
+        max_age_hours: int = 24,
+        batch_size: int = 100,
+        max_interval: float = 60.0,
+        on_retired: Optional[Callable[[List[BurnerWallet]], None]] = None
+    ):
+        """
+        Initialize expiry sweeper
+        
+        Args:
+            pool_manager: Pool manager to sweep
+            max_age_hours: Maximum wallet age in hours
+            batch_size: Maximum wallets retired before yielding to the loop
+            max_interval: Maximum seconds between sweeps
+            on_retired: Optional callback receiving each sweep's retired wallets
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        
+        self.pool_manager = pool_manager
+        self.max_age_hours = max_age_hours
+        self.batch_size = batch_size
+        self.max_interval = max_interval
+        self.on_retired = on_retired
+        
+        # Stats
+        self.runs = 0
+        self.total_retired = 0
+        self.last_retired = 0
+        self.last_run_duration = 0.0
+        self.last_max_step_duration = 0.0
+        self.last_run_at: Optional[float] = None
+        
+        self._loop = BackgroundLoop(self.sweep, self.next_delay, name="Expiry sweep")
+        
+        logger.info(
+            f"ExpirySweeper initialized: max_age={max_age_hours}h, "
+            f"batch={batch_size}, max_interval={max_interval}s"
+        )
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running"""
+        return self._loop.running
+    
+    def next_delay(self) -> float:
+        """
+        Get seconds until the next sweep
+        
+        Returns:
+            Delay until the next expiry deadline, capped at max_interval
+        """
+        deadline = self.pool_manager.next_expiry(self.max_age_hours)
+        if deadline is None:
+            return self.max_interval
+        return min(max(0.0, deadline - time.time() + DEADLINE_SLACK), self.max_interval)
+    
+    async def sweep(self) -> int:
+        """
+        Retire all currently expired wallets in bounded batches
+        
+        Returns:
+            Number of wallets retired
+        """
+        start = time.perf_counter()
+        max_step = 0.0
+        retired: List[BurnerWallet] = []
+        
+        while True:
+            step_start = time.perf_counter()
+            batch = self.pool_manager.cleanup_expired_wallets(
+                self.max_age_hours,
+                limit=self.batch_size,
+                wait=False
+            )
+            max_step = max(max_step, time.perf_counter() - step_start)
+            retired.extend(batch)
+            
+            # Wait for the batch's retirements off the loop
+            if not self.pool_manager.durable:
+                await asyncio.get_running_loop().run_in_executor(None, self.pool_manager.wait_durable)
+            
+            if len(batch) < self.batch_size:
+                break
+            await asyncio.sleep(0)  # Let other tasks run between batches
+        
+        self.runs += 1
+        self.total_retired += len(retired)
+        self.last_retired = len(retired)
+        self.last_run_duration = time.perf_counter() - start
+        self.last_max_step_duration = max_step
+        self.last_run_at = time.time()
+        
+        if retired:
+            logger.info(f"Expiry sweep retired {len(retired)} wallets in {self.last_run_duration * 1000:.1f}ms")
+            if self.on_retired is not None:
+                self.on_retired(retired)
+        
+        return len(retired)
+    
+    def notify(self):
+        """Wake the background task to recompute its deadline"""
+        self._loop.notify()
+    
+    def start(self):
+        """Start background sweeping"""
+        if self._loop.start():
+            logger.info("ExpirySweeper started")
+    
+    async def stop(self):
+        """Stop background sweeping"""
+        if await self._loop.stop():
+            logger.info("ExpirySweeper stopped")
+    
+    def get_stats(self) -> dict:
+        """
+        Get sweeper statistics
+        
+        Returns:
+            Dictionary with run counters and last-run timings
+        """
+        return {
+            "running": self.running,
+            "runs": self.runs,
+            "total_retired": self.total_retired,
+            "last_retired": self.last_retired,
+            "last_run_duration": self.last_run_duration,
+            "last_max_step_duration": self.last_max_step_duration,
+            "last_run_at": self.last_run_at,
+            "next_expiry": self.pool_manager.next_expiry(self.max_age_hours)
+        }
@@ -4,49 +4,172 @@ Funding Manager
 Manages Just-In-Time (JIT) funding of burner wallets.
 """
 
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+from solders.hash import Hash
+from solders.instruction import Instruction
 from solders.keypair import Keypair
+from solders.message import Message
 from solders.pubkey import Pubkey
 from solders.rpc.responses import SendTransactionResp
 from solders.transaction import Transaction
 from solders.system_program import transfer, TransferParams
 from solders.compute_budget import set_compute_unit_price, set_compute_unit_limit
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Confirmed
+from solana.rpc.commitment import Commitment, Confirmed
 import asyncio
+from .blockhash_cache import BlockhashCache
+from .confirmation_tracker import ConfirmationTracker, ConfirmationTimeoutError
+from .rpc_router import RpcRouter
 from ..utils.logger import get_logger
 
+try:
+    from solana.rpc.models import DataSliceOpts, TxOpts
+except ImportError:  # solana < 0.40
+    from solana.rpc.types import DataSliceOpts, TxOpts
+
 logger = get_logger(__name__)
 
+LAMPORTS_PER_SOL = 1_000_000_000
+
+# Maximum serialized transaction size (bytes)
+PACKET_DATA_SIZE = 1232
+
+# Maximum accounts per getMultipleAccounts request
+MAX_MULTIPLE_ACCOUNTS = 100
+
+
+class BatchFundingError(Exception):
+    """
+    Raised when some transactions of a batch funding fail
+    
+    Attributes:
+        signatures: Signatures of recipients that were funded
+        failed: Recipients whose own transfer failed (after the one-by-one
+            retry of failed multi-transfer transactions), mapped to the error
+    """
+    
+    def __init__(self, signatures: Dict[Pubkey, str], failed: Dict[Pubkey, Exception]):
+        self.signatures = signatures
+        self.failed = failed
+        super().__init__(f"{len(failed)} of {len(signatures) + len(failed)} transfers failed")
+
 
 class FundingManager:
     """
     Manages JIT funding of burner wallets
     """
     
-    def __init__(self, rpc_url: str = "https://api.mainnet-beta.solana.com"):
+    def __init__(
+        self,
+        rpc_url: str = "https://api.mainnet-beta.solana.com",
+        blockhash_ttl: float = 20.0,
+        blockhash_refresh_interval: float = 5.0,
+        rpc_max_connections: int = 20,
+        rpc_max_keepalive_connections: int = 10,
+        rpc_keepalive_expiry: float = 30.0,
+        rpc_timeout: float = 10.0,
+        rpc_urls: Optional[List[str]] = None,
+        rpc_failure_threshold: int = 5,
+        rpc_breaker_cooldown: float = 30.0,
+        confirmation_poll_interval: float = 0.5,
+        confirmation_timeout: float = 60.0
+    ):
         """
         Initialize funding manager
         
         Args:
             rpc_url: Solana RPC endpoint URL
+            blockhash_ttl: Maximum age of a cached blockhash in seconds
+            blockhash_refresh_interval: Seconds between background blockhash refreshes
+            rpc_max_connections: Maximum concurrent RPC connections
+            rpc_max_keepalive_connections: Maximum idle keep-alive RPC connections
+            rpc_keepalive_expiry: Idle keep-alive connection expiry in seconds
+            rpc_timeout: Per-request RPC timeout in seconds
+            rpc_urls: Multiple RPC endpoints to route across (overrides rpc_url)
+            rpc_failure_threshold: Consecutive failures that open an endpoint's circuit
+            rpc_breaker_cooldown: Seconds an open circuit stays open
+            confirmation_poll_interval: Seconds between batched signature status polls
+            confirmation_timeout: Seconds to wait for a funding confirmation
         """
         self.rpc_url = rpc_url
-        self.client: Optional[AsyncClient] = None
-        logger.info(f"FundingManager initialized with RPC: {rpc_url}")
+        self.rpc_urls = list(rpc_urls) if rpc_urls else [rpc_url]
+        self.rpc = RpcRouter(
+            self.rpc_urls,
+            failure_threshold=rpc_failure_threshold,
+            breaker_cooldown=rpc_breaker_cooldown,
+            max_connections=rpc_max_connections,
+            max_keepalive_connections=rpc_max_keepalive_connections,
+            keepalive_expiry=rpc_keepalive_expiry,
+            timeout=rpc_timeout
+        )
+        self.blockhash_cache = BlockhashCache(
+            self._fetch_blockhash,
+            ttl=blockhash_ttl,
+            refresh_interval=blockhash_refresh_interval
+        )
+        self.confirmations = ConfirmationTracker(
+            self.rpc,
+            poll_interval=confirmation_poll_interval,
+            timeout=confirmation_timeout
+        )
+        logger.info(f"FundingManager initialized with RPC: {', '.join(self.rpc_urls)}")
+    
+    @property
+    def client(self) -> Optional[AsyncClient]:
+        """RPC client of the preferred endpoint (None until connected)"""
+        return self.rpc.primary.pool.client
     
     async def connect(self):
         """Connect to Solana RPC"""
-        if self.client is None:
-            self.client = AsyncClient(self.rpc_url)
-            logger.debug("Connected to Solana RPC")
+        for state in self.rpc.endpoints:
+            state.pool.get_client()
     
     async def disconnect(self):
         """Disconnect from Solana RPC"""
-        if self.client:
-            await self.client.close()
-            self.client = None
-            logger.debug("Disconnected from Solana RPC")
+        await self.blockhash_cache.stop()
+        await self.confirmations.stop()
+        await self.rpc.close()
+    
+    def get_rpc_stats(self) -> dict:
+        """
+        Get per-endpoint RPC, blockhash cache and confirmation statistics
+        
+        Returns:
+            Dictionary with RPC statistics
+        """
+        return {
+            "endpoints": self.rpc.get_stats(),
+            "blockhash_cache": self.blockhash_cache.get_stats(),
+            "confirmations": self.confirmations.get_stats()
+        }
+    
+    async def _fetch_blockhash(self) -> Tuple[Hash, int, int]:
+        """Fetch latest blockhash and current block height"""
+        await self.connect()
+        
+        blockhash_resp, height_resp = await asyncio.gather(
+            self.rpc.request("get_latest_blockhash", commitment=Confirmed),
+            self.rpc.request("get_block_height", commitment=Confirmed)
+        )
+        
+        return (
+            blockhash_resp.value.blockhash,
+            blockhash_resp.value.last_valid_block_height,
+            height_resp.value
+        )
+    
+    async def get_recent_blockhash(self) -> Hash:
+        """
+        Get a recent blockhash (shared across concurrent fundings)
+        
+        Returns:
+            Recent blockhash
+        """
+        return await self.blockhash_cache.get()
+    
+    def start_blockhash_refresher(self):
+        """Start background blockhash refresh"""
+        self.blockhash_cache.start()
     
     async def get_balance(self, public_key: Pubkey) -> float:
         """
@@ -61,14 +184,60 @@ class FundingManager:
         await self.connect()
         
         try:
-            response = await self.client.get_balance(public_key, commitment=Confirmed)
+            response = await self.rpc.request("get_balance", public_key, commitment=Confirmed)
             lamports = response.value
-            sol_balance = lamports / 1_000_000_000  # Convert lamports to SOL
+            sol_balance = lamports / LAMPORTS_PER_SOL  # Convert lamports to SOL
             return sol_balance
         except Exception as e:
             logger.error(f"Error getting balance for {public_key}: {e}")
             raise
     
+    async def get_balances(self, public_keys: List[Pubkey]) -> Dict[Pubkey, float]:
+        """
+        Get SOL balances of many wallets with getMultipleAccounts
+        
+        Keys are requested in chunks of MAX_MULTIPLE_ACCOUNTS, concurrently.
+        Accounts that do not exist yet have a balance of 0.
+        
+        Args:
+            public_keys: Wallet public keys
+            
+        Returns:
+            Public key mapped to balance in SOL
+        """
+        if not public_keys:
+            return {}
+        
+        await self.connect()
+        
+        chunks = [
+            public_keys[i:i + MAX_MULTIPLE_ACCOUNTS]
+            for i in range(0, len(public_keys), MAX_MULTIPLE_ACCOUNTS)
+        ]
+        
+        try:
+            responses = await asyncio.gather(*(
+                self.rpc.request(
+                    "get_multiple_accounts",
+                    chunk,
+                    commitment=Confirmed,
+                    data_slice=DataSliceOpts(offset=0, length=0)  # Lamports only
+                )
+                for chunk in chunks
+            ))
+        except Exception as e:
+            logger.error(f"Error getting balances for {len(public_keys)} wallets: {e}")
+            raise
+        
+        balances: Dict[Pubkey, float] = {}
+        for chunk, response in zip(chunks, responses):
+            for public_key, account in zip(chunk, response.value):
+                lamports = account.lamports if account is not None else 0
+                balances[public_key] = lamports / LAMPORTS_PER_SOL
+        
+        logger.debug(f"Fetched {len(balances)} balances in {len(chunks)} requests")
+        return balances
+    
     async def calculate_funding_amount(
         self,
         required_amount: float,
@@ -93,7 +262,8 @@ class FundingManager:
         burner_wallet: Pubkey,
         source_wallet: Keypair,
         amount_sol: float,
-        priority_fee: Optional[int] = None
+        priority_fee: Optional[int] = None,
+        commitment: Optional[Commitment] = None
     ) -> str:
         """
         Fund a burner wallet from source wallet
@@ -103,45 +273,37 @@ class FundingManager:
             source_wallet: Source wallet keypair
             amount_sol: Amount to send in SOL
             priority_fee: Optional priority fee in microlamports
+            commitment: Wait until the transfer reaches this commitment
+                (None returns as soon as it is sent)
             
         Returns:
             Transaction signature
+            
+        Raises:
+            TransactionFailedError: If the transfer landed with an error
+            ConfirmationTimeoutError: If it was not confirmed in time
         """
         await self.connect()
         
         try:
             # Convert SOL to lamports
-            lamports = int(amount_sol * 1_000_000_000)
+            lamports = int(amount_sol * LAMPORTS_PER_SOL)
             
             # Get recent blockhash
-            blockhash_resp = await self.client.get_latest_blockhash(commitment=Confirmed)
-            recent_blockhash = blockhash_resp.value.blockhash
-            
-            # Create transfer instruction
-            transfer_ix = transfer(
-                TransferParams(
-                    from_pubkey=source_wallet.pubkey(),
-                    to_pubkey=burner_wallet,
-                    lamports=lamports
-                )
-            )
-            
-            # Build transaction
-            transaction = Transaction()
-            transaction.add(transfer_ix)
+            recent_blockhash = await self.get_recent_blockhash()
             
-            # Add priority fee if specified
-            if priority_fee:
-                transaction.add(set_compute_unit_price(priority_fee))
-                transaction.add(set_compute_unit_limit(200_000))
-            
-            # Sign and send
-            transaction.sign([source_wallet], recent_blockhash)
+            # Build and sign transaction
+            transaction = self._build_transfer_transaction(
+                source_wallet,
+                [(burner_wallet, lamports)],
+                recent_blockhash,
+                priority_fee
+            )
             
-            response = await self.client.send_transaction(
+            response = await self.rpc.request(
+                "send_transaction",
                 transaction,
-                source_wallet,
-                commitment=Confirmed
+                opts=TxOpts(preflight_commitment=Commitment(Confirmed))
             )
             
             signature = str(response.value)
@@ -150,18 +312,233 @@ class FundingManager:
                 f"Signature: {signature}"
             )
             
-            return signature
-            
         except Exception as e:
+            if "blockhash" in str(e).lower():
+                self.blockhash_cache.invalidate()
             logger.error(f"Error funding wallet {burner_wallet}: {e}")
             raise
+        
+        if commitment is not None:
+            try:
+                await self.confirmations.confirm(signature, commitment)
+            except Exception as e:
+                logger.error(f"Funding of {burner_wallet} not confirmed: {e}")
+                raise
+        
+        return signature
+    
+    @staticmethod
+    def _transfer_instructions(
+        source: Pubkey,
+        transfers: List[Tuple[Pubkey, int]],
+        priority_fee: Optional[int] = None
+    ) -> List[Instruction]:
+        """Build compute budget and System Program transfer instructions"""
+        instructions = []
+        
+        # Add priority fee if specified
+        if priority_fee:
+            instructions.append(set_compute_unit_limit(200_000))
+            instructions.append(set_compute_unit_price(priority_fee))
+        
+        for to_pubkey, lamports in transfers:
+            instructions.append(
+                transfer(
+                    TransferParams(
+                        from_pubkey=source,
+                        to_pubkey=to_pubkey,
+                        lamports=lamports
+                    )
+                )
+            )
+        
+        return instructions
+    
+    def _build_transfer_transaction(
+        self,
+        source_wallet: Keypair,
+        transfers: List[Tuple[Pubkey, int]],
+        recent_blockhash: Hash,
+        priority_fee: Optional[int] = None
+    ) -> Transaction:
+        """
+        Build a signed transaction with one transfer per recipient
+        
+        Args:
+            source_wallet: Source wallet keypair (fee payer and signer)
+            transfers: List of (recipient, lamports)
+            recent_blockhash: Recent blockhash
+            priority_fee: Optional priority fee in microlamports
+            
+        Returns:
+            Signed transaction
+        """
+        instructions = self._transfer_instructions(source_wallet.pubkey(), transfers, priority_fee)
+        message = Message.new_with_blockhash(instructions, source_wallet.pubkey(), recent_blockhash)
+        return Transaction([source_wallet], message, recent_blockhash)
+    
+    def pack_transfers(
+        self,
+        source: Pubkey,
+        transfers: List[Tuple[Pubkey, int]],
+        priority_fee: Optional[int] = None
+    ) -> List[List[Tuple[Pubkey, int]]]:
+        """
+        Split transfers into the fewest transactions that fit the size limit
+        
+        Args:
+            source: Source wallet public key
+            transfers: List of (recipient, lamports)
+            priority_fee: Optional priority fee in microlamports
+            
+        Returns:
+            List of transfer groups, one per transaction
+        """
+        groups: List[List[Tuple[Pubkey, int]]] = []
+        current: List[Tuple[Pubkey, int]] = []
+        
+        for item in transfers:
+            candidate = current + [item]
+            message = Message.new_with_blockhash(
+                self._transfer_instructions(source, candidate, priority_fee),
+                source,
+                Hash.default()
+            )
+            # Signature count (compact-u16) + one 64-byte signature + message
+            size = 1 + 64 + len(bytes(message))
+            
+            if size > PACKET_DATA_SIZE and current:
+                groups.append(current)
+                current = [item]
+            else:
+                current = candidate
+        
+        if current:
+            groups.append(current)
+        
+        return groups
+    
+    async def fund_wallets_batch(
+        self,
+        amounts: Dict[Pubkey, float],
+        source_wallet: Keypair,
+        priority_fee: Optional[int] = None,
+        commitment: Optional[Commitment] = None
+    ) -> Dict[Pubkey, str]:
+        """
+        Fund many wallets from one source with multi-transfer transactions
+        
+        Transfers are packed into as few transactions as the size limit
+        allows; all transactions share one recent blockhash and are sent
+        concurrently. A failed multi-transfer transaction fails all of its
+        recipients, so they are retried once with one transaction each;
+        only recipients whose own transfer failed end up in the error.
+        Transfers that timed out waiting for confirmation are not retried
+        (they may still land).
+        
+        Args:
+            amounts: Recipient public key mapped to amount in SOL
+            source_wallet: Source wallet keypair
+            priority_fee: Optional priority fee in microlamports
+            commitment: Wait until every transaction reaches this commitment
+                (None returns as soon as they are sent)
+            
+        Returns:
+            Recipient public key mapped to transaction signature
+            
+        Raises:
+            BatchFundingError: If any recipient could not be funded (carries
+                partial results)
+        """
+        if not amounts:
+            return {}
+        
+        await self.connect()
+        
+        transfers = [
+            (public_key, int(amount_sol * LAMPORTS_PER_SOL))
+            for public_key, amount_sol in amounts.items()
+        ]
+        groups = self.pack_transfers(source_wallet.pubkey(), transfers, priority_fee)
+        
+        signatures, failed = await self._send_transfers(groups, source_wallet, priority_fee, commitment)
+        
+        retry = [
+            [(public_key, lamports)]
+            for group in groups if len(group) > 1
+            for public_key, lamports in group
+            if public_key in failed and not isinstance(failed[public_key], ConfirmationTimeoutError)
+        ]
+        if retry:
+            logger.warning(f"Retrying {len(retry)} transfers of failed batch transactions one by one")
+            retried, failed_again = await self._send_transfers(retry, source_wallet, priority_fee, commitment)
+            for public_key, signature in retried.items():
+                signatures[public_key] = signature
+                del failed[public_key]
+            failed.update(failed_again)
+        
+        logger.info(
+            f"Funded {len(signatures)}/{len(transfers)} wallets in "
+            f"{len(groups) + len(retry)} transactions"
+        )
+        
+        if failed:
+            logger.error(f"Batch funding failed for {len(failed)} wallets")
+            raise BatchFundingError(signatures, failed)
+        
+        return signatures
+    
+    async def _send_transfers(
+        self,
+        groups: List[List[Tuple[Pubkey, int]]],
+        source_wallet: Keypair,
+        priority_fee: Optional[int],
+        commitment: Optional[Commitment]
+    ) -> Tuple[Dict[Pubkey, str], Dict[Pubkey, Exception]]:
+        """Send one transaction per group (and confirm them), splitting results by recipient"""
+        recent_blockhash = await self.get_recent_blockhash()
+        
+        async def send(group: List[Tuple[Pubkey, int]]) -> str:
+            transaction = self._build_transfer_transaction(
+                source_wallet,
+                group,
+                recent_blockhash,
+                priority_fee
+            )
+            response = await self.rpc.request(
+                "send_transaction",
+                transaction,
+                opts=TxOpts(preflight_commitment=Commitment(Confirmed))
+            )
+            signature = str(response.value)
+            if commitment is not None:
+                await self.confirmations.confirm(signature, commitment)
+            return signature
+        
+        results = await asyncio.gather(*(send(group) for group in groups), return_exceptions=True)
+        
+        signatures: Dict[Pubkey, str] = {}
+        failed: Dict[Pubkey, Exception] = {}
+        for group, result in zip(groups, results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result  # Cancellation is not a transfer failure
+            for public_key, _ in group:
+                if isinstance(result, Exception):
+                    failed[public_key] = result
+                else:
+                    signatures[public_key] = result
+        
+        if any("blockhash" in str(e).lower() for e in failed.values()):
+            self.blockhash_cache.invalidate()
+        return signatures, failed
     
     async def fund_wallet_jit(
         self,
         burner_wallet: Pubkey,
         source_wallet: Keypair,
         required_amount: float,
-        priority_fee: Optional[int] = None
+        priority_fee: Optional[int] = None,
+        commitment: Optional[Commitment] = None
     ) -> str:
         """
         Fund wallet Just-In-Time with exact amount needed
@@ -171,6 +548,7 @@ class FundingManager:
             source_wallet: Source wallet
             required_amount: Amount needed for transaction
             priority_fee: Optional priority fee
+            commitment: Wait until the transfer reaches this commitment
             
         Returns:
             Transaction signature
@@ -183,7 +561,8 @@ class FundingManager:
             burner_wallet,
             source_wallet,
             funding_amount,
-            priority_fee
+            priority_fee,
+            commitment
         )
     
     async def check_funding_status(self, public_key: Pubkey) -> dict:
@@ -201,7 +580,7 @@ class FundingManager:
         return {
             "public_key": str(public_key),
             "balance_sol": balance,
-            "balance_lamports": int(balance * 1_000_000_000),
+            "balance_lamports": int(balance * LAMPORTS_PER_SOL),
             "is_funded": balance > 0
         }
 
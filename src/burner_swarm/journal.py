@@ -0,0 +1,306 @@
+"""
+Wallet Journal
+
+Append-only write-ahead journal of pool state transitions with periodic
+compaction into snapshots. State is rebuilt at startup by loading the
+latest snapshot and replaying the journal tail.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from .pool_manager import BurnerWallet, WalletStatus
+from .wallet_store import WalletStore, wallet_to_record, wallet_from_record
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+JOURNAL_FILE = "journal.log"
+SNAPSHOT_FILE = "snapshot.json"
+
+
+class JournalWalletStore(WalletStore):
+    """
+    Wallet store backed by a group-committed write-ahead journal
+    
+    save() only enqueues a transition; a writer thread appends everything
+    queued since its last commit and issues a single fsync per batch.
+    commit() enqueues the same way but hands back the entry's sequence
+    number, so callers can wait (off the event loop) for the group commit
+    that covers it. Each journal entry holds only the fields that changed.
+    """
+    
+    def __init__(self, directory: str = "burner_swarm_journal", compact_threshold: int = 10000):
+        """
+        Initialize journal store and recover state from disk
+        
+        Args:
+            directory: Directory holding the journal and snapshot files
+            compact_threshold: Journal entries that trigger a snapshot
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.directory / JOURNAL_FILE
+        self.snapshot_path = self.directory / SNAPSHOT_FILE
+        self.compact_threshold = compact_threshold
+        
+        # Current state of non-retired wallets, keyed by public key
+        self._state: Dict[str, dict] = {}
+        self._seq = 0
+        self._snapshot_seq = 0
+        self._journal_entries = 0
+        
+        # Counters
+        self.appends = 0
+        self.commits = 0
+        self.compactions = 0
+        
+        self._recover()
+        
+        self._cond = threading.Condition()
+        self._queue: List[dict] = []
+        self._durable_seq = self._seq
+        self._closing = False
+        self._error: Optional[BaseException] = None
+        
+        self._file = open(self.journal_path, "a", encoding="utf-8")
+        self._writer = threading.Thread(target=self._run_writer, name="wallet-journal", daemon=True)
+        self._writer.start()
+        
+        logger.info(f"JournalWalletStore initialized: {directory} ({len(self._state)} wallets recovered)")
+    
+    def _apply(self, entry: dict):
+        """Apply a journal entry to the in-memory state"""
+        key = entry["public_key"]
+        if entry.get("status") == WalletStatus.RETIRED.value:
+            self._state.pop(key, None)
+            return
+        
+        record = self._state.setdefault(key, {})
+        record.update({k: v for k, v in entry.items() if k != "seq"})
+    
+    def _recover(self):
+        """Rebuild state from snapshot plus journal tail"""
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            self._state = snapshot["wallets"]
+            self._snapshot_seq = self._seq = snapshot["seq"]
+        
+        if not self.journal_path.exists():
+            return
+        
+        valid_bytes = 0
+        replayed = 0
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete entry")
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn write from a crash: drop it and everything after
+                    logger.warning(f"Discarding torn journal tail at byte {valid_bytes}")
+                    break
+                
+                valid_bytes += len(line)
+                self._journal_entries += 1
+                if entry["seq"] <= self._snapshot_seq:
+                    continue  # Already in snapshot
+                
+                self._apply(entry)
+                self._seq = entry["seq"]
+                replayed += 1
+        
+        if valid_bytes < self.journal_path.stat().st_size:
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(valid_bytes)
+        
+        logger.debug(f"Replayed {replayed} journal entries after snapshot seq {self._snapshot_seq}")
+    
+    def save(self, wallet: BurnerWallet):
+        """
+        Enqueue a wallet state transition
+        
+        Args:
+            wallet: Wallet whose state changed
+        """
+        self._enqueue(wallet)
+    
+    def commit(self, wallet: BurnerWallet, wait: bool = True) -> Optional[int]:
+        """
+        Enqueue a wallet status transition and wait for its group commit
+        
+        Args:
+            wallet: Wallet whose status changed
+            wait: Block until the transition is durable
+            
+        Returns:
+            Sequence number to pass to wait_durable() if wait is False, else None
+        """
+        seq = self._enqueue(wallet)
+        if not wait:
+            return seq
+        self.wait_durable(seq)
+        return None
+    
+    def _enqueue(self, wallet: BurnerWallet) -> int:
+        """
+        Queue a journal entry with the fields that changed
+        
+        Args:
+            wallet: Wallet whose state changed
+            
+        Returns:
+            Sequence number that covers the wallet's current state
+        """
+        record = wallet_to_record(wallet)
+        key = record["public_key"]
+        
+        with self._cond:
+            if self._error is not None:
+                raise RuntimeError("Journal writer failed") from self._error
+            
+            # Unchanged state may still sit in the queue, so cover it with the latest seq
+            previous = self._state.get(key)
+            if previous is None:
+                if record["status"] == WalletStatus.RETIRED.value:
+                    return self._seq  # Never persisted, nothing to record
+                entry = dict(record)
+            else:
+                entry = {k: v for k, v in record.items() if previous.get(k) != v}
+                if not entry:
+                    return self._seq
+                entry["public_key"] = key
+            
+            self._seq += 1
+            entry["seq"] = self._seq
+            self._apply(entry)
+            self._queue.append(entry)
+            self.appends += 1
+            self._cond.notify_all()
+            return self._seq
+    
+    def _run_writer(self):
+        """Writer thread: group-commit queued entries"""
+        while True:
+            with self._cond:
+                while not self._queue and not self._closing:
+                    self._cond.wait()
+                if not self._queue and self._closing:
+                    return
+                batch = self._queue
+                self._queue = []
+            
+            try:
+                self._file.write("".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in batch))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._journal_entries += len(batch)
+                
+                if self._journal_entries >= self.compact_threshold:
+                    self._compact()
+            except BaseException as e:
+                logger.error(f"Journal write failed: {e}")
+                with self._cond:
+                    self._error = e
+                    self._cond.notify_all()
+                return
+            
+            with self._cond:
+                self._durable_seq = batch[-1]["seq"]
+                self.commits += 1
+                self._cond.notify_all()
+    
+    def _compact(self):
+        """Write a snapshot of current state and start a fresh journal (writer thread)"""
+        with self._cond:
+            seq = self._seq
+            wallets = {key: dict(record) for key, record in self._state.items()}
+        
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"seq": seq, "wallets": wallets}, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        
+        # Entries up to seq are in the snapshot; replay skips them if truncation is lost
+        self._file.close()
+        self._file = open(self.journal_path, "w", encoding="utf-8")
+        os.fsync(self._file.fileno())
+        
+        self._snapshot_seq = seq
+        self._journal_entries = 0
+        self.compactions += 1
+        logger.debug(f"Compacted journal into snapshot at seq {seq} ({len(wallets)} wallets)")
+    
+    def is_durable(self, ticket: int) -> bool:
+        """
+        Check without blocking whether the journal is committed up to a sequence number
+        
+        Args:
+            ticket: Sequence number returned by commit()
+            
+        Returns:
+            True once the entry is durable
+        """
+        return self._durable_seq >= ticket
+    
+    def wait_durable(self, ticket: int):
+        """
+        Block until the journal is committed up to a sequence number
+        
+        Args:
+            ticket: Sequence number returned by commit()
+        """
+        with self._cond:
+            while self._durable_seq < ticket and self._error is None:
+                self._cond.wait()
+            if self._durable_seq < ticket:
+                raise RuntimeError("Journal writer failed") from self._error
+    
+    def flush(self):
+        """Block until every enqueued transition is durable"""
+        with self._cond:
+            target = self._seq
+        self.wait_durable(target)
+    
+    def load(self) -> List[BurnerWallet]:
+        """
+        Load all reserve and active wallets
+        
+        Returns:
+            List of wallets (keypairs not decrypted)
+        """
+        with self._cond:
+            records = [dict(record) for record in self._state.values()]
+        
+        records.sort(key=lambda record: record["created_at"])
+        return [wallet_from_record(record) for record in records]
+    
+    def close(self):
+        """Commit pending transitions and stop the writer"""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._writer.join()
+        self._file.close()
+    
+    def get_stats(self) -> dict:
+        """
+        Get journal statistics
+        
+        Returns:
+            Dictionary with append/commit counters
+        """
+        return {
+            "appends": self.appends,
+            "commits": self.commits,
+            "compactions": self.compactions,
+            "seq": self._seq,
+            "durable_seq": self._durable_seq,
+            "snapshot_seq": self._snapshot_seq
+        }
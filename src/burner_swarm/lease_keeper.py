@@ -0,0 +1,107 @@
+"""
+Lease Keeper
+
+Background task that heartbeats checkout leases on a shared wallet store
+and reclaims leases other instances let expire.
+"""
+
+import time
+from typing import Callable, List, Optional
+from .background_loop import BackgroundLoop
+from .pool_manager import PoolManager, BurnerWallet
+from .wallet_store import SharedWalletStore
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LeaseKeeper:
+    """
+    Renews this instance's leases and reclaims expired ones
+    
+    Every interval seconds, renews the lease on each active wallet this
+    instance checked out, then retires wallets whose lease expired
+    (e.g. their instance crashed). interval should be well below the
+    store's lease TTL.
+    """
+    
+    def __init__(
+        self,
+        pool_manager: PoolManager,
+        interval: float = 10.0,
+        on_lost: Optional[Callable[[List[BurnerWallet]], None]] = None
+    ):
+        """
+        Initialize lease keeper
+        
+        Args:
+            pool_manager: Pool manager with a shared store
+            interval: Seconds between heartbeats
+            on_lost: Optional callback receiving wallets whose lease was lost
+        """
+        if pool_manager.shared_store is None:
+            raise ValueError("LeaseKeeper requires a shared wallet store")
+        
+        self.pool_manager = pool_manager
+        self.store: SharedWalletStore = pool_manager.shared_store
+        self.interval = interval
+        self.on_lost = on_lost
+        
+        # Stats
+        self.heartbeats = 0
+        self.lost = 0
+        self.reclaimed = 0
+        self.last_heartbeat_at: Optional[float] = None
+        
+        self._loop = BackgroundLoop(self._heartbeat, lambda: self.interval, name="Lease heartbeat")
+        
+        logger.info(f"LeaseKeeper initialized: interval={interval}s, owner={self.store.owner}")
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running"""
+        return self._loop.running
+    
+    def heartbeat(self):
+        """Renew own leases and reclaim expired ones"""
+        lost = self.pool_manager.renew_leases()
+        reclaimed = self.pool_manager.reclaim_expired_leases()
+        
+        self.heartbeats += 1
+        self.lost += len(lost)
+        self.reclaimed += reclaimed
+        self.last_heartbeat_at = time.time()
+        
+        if lost and self.on_lost is not None:
+            self.on_lost(lost)
+    
+    async def _heartbeat(self):
+        """Heartbeat step of the background loop"""
+        self.heartbeat()
+    
+    def start(self):
+        """Start background heartbeats"""
+        if self._loop.start():
+            logger.info("LeaseKeeper started")
+    
+    async def stop(self):
+        """Stop background heartbeats"""
+        if await self._loop.stop():
+            logger.info("LeaseKeeper stopped")
+    
+    def get_stats(self) -> dict:
+        """
+        Get lease keeper statistics
+        
+        Returns:
+            Dictionary with heartbeat and reclaim counters
+        """
+        return {
+            "running": self.running,
+            "owner": self.store.owner,
+            "lease_ttl": self.store.lease_ttl,
+            "heartbeats": self.heartbeats,
+            "lost": self.lost,
+            "reclaimed": self.reclaimed,
+            "last_heartbeat_at": self.last_heartbeat_at
+        }
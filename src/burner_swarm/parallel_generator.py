@@ -0,0 +1,119 @@
+"""
+Parallel Wallet Generator
+
+Fans keypair generation and encryption out across worker processes.
+Workers return only public keys and encrypted private keys, so plaintext
+key material never crosses the process boundary.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from ..utils.encryption import encrypt_keys_raw
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _generate_encrypted_batch(count: int, password: Optional[str] = None) -> List[Tuple[bytes, bytes]]:
+    """
+    Generate and encrypt keypairs (runs in worker process)
+    
+    Args:
+        count: Number of keypairs to generate
+        password: Optional password for encryption
+        
+    Returns:
+        List of (public key bytes, binary ciphertext) tuples
+    """
+    keypairs = [Keypair() for _ in range(count)]
+    ciphertexts = encrypt_keys_raw([bytes(keypair) for keypair in keypairs], password)
+    
+    return [
+        (bytes(keypair.pubkey()), ciphertext)
+        for keypair, ciphertext in zip(keypairs, ciphertexts)
+    ]
+
+
+class ParallelWalletGenerator:
+    """
+    Generates encrypted wallets across a pool of worker processes
+    """
+    
+    def __init__(
+        self,
+        workers: int = 2,
+        chunk_size: int = 100,
+        password: Optional[str] = None
+    ):
+        """
+        Initialize parallel wallet generator
+        
+        Args:
+            workers: Number of worker processes
+            chunk_size: Maximum wallets generated per worker task
+            password: Optional password for encryption
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.password = password
+        self.generated_count = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        
+        logger.info(f"ParallelWalletGenerator initialized: workers={workers}, chunk_size={chunk_size}")
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create worker pool on first use"""
+        if self._executor is None:
+            # Spawn avoids forking a process that may hold threads/locks
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+    
+    def generate_encrypted(self, count: int) -> List[Tuple[Pubkey, bytes]]:
+        """
+        Generate encrypted wallets in parallel
+        
+        Args:
+            count: Number of wallets to generate
+            
+        Returns:
+            List of (public key, binary ciphertext) tuples
+        """
+        if count <= 0:
+            return []
+        
+        # Split evenly across workers, capped by chunk size
+        per_task = min(self.chunk_size, -(-count // self.workers))
+        chunks = [per_task] * (count // per_task)
+        if count % per_task:
+            chunks.append(count % per_task)
+        
+        executor = self._get_executor()
+        futures = [executor.submit(_generate_encrypted_batch, size, self.password) for size in chunks]
+        
+        records: List[Tuple[Pubkey, bytes]] = []
+        for future in futures:
+            records.extend(
+                (Pubkey.from_bytes(public_key), encrypted)
+                for public_key, encrypted in future.result()
+            )
+        
+        self.generated_count += len(records)
+        logger.debug(f"Generated {len(records)} wallets across {len(chunks)} worker tasks")
+        return records
+    
+    def close(self):
+        """Shut down worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
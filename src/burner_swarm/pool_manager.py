@@ -4,15 +4,23 @@ Pool Manager
 Manages pools of burner wallets: active, reserve, and retired.
 """
 
+import heapq
+import time
+from collections.abc import Mapping, ValuesView
 from enum import Enum
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union, overload
+from datetime import datetime, timezone
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from .wallet_generator import WalletGenerator
+from .parallel_generator import ParallelWalletGenerator
+from ..utils.encryption import pack_ciphertext, unpack_ciphertext
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from .wallet_store import SharedWalletStore, WalletStore
+    from .tombstones import TombstoneLog
+
 logger = get_logger(__name__)
 
 
@@ -23,45 +31,169 @@ class WalletStatus(str, Enum):
     RETIRED = "retired"
 
 
-@dataclass
+@overload
+def to_epoch(value: None) -> None: ...
+@overload
+def to_epoch(value: Union[datetime, int, float]) -> int: ...
+
+
+def to_epoch(value: Union[datetime, int, float, None]) -> Optional[int]:
+    """Convert naive UTC datetime (or epoch number) to integer epoch seconds"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return int(value.replace(tzinfo=timezone.utc).timestamp())
+    return int(value)
+
+
+@overload
+def from_epoch(value: None) -> None: ...
+@overload
+def from_epoch(value: int) -> datetime: ...
+
+
+def from_epoch(value: Optional[int]) -> Optional[datetime]:
+    """Convert epoch seconds to naive UTC datetime"""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+
+
 class BurnerWallet:
     """
     Burner wallet data structure
     
+    Slotted, with integer epoch timestamps and the private key held as a
+    binary ciphertext, to keep per-wallet memory small in large pools.
+    created_at, last_used and encrypted_private_key remain available as
+    datetime / dictionary views.
+    
     Attributes:
         public_key: Wallet public key
-        keypair: Keypair instance (in memory, encrypted when stored)
-        created_at: Creation timestamp
-        last_used: Last usage timestamp
+        keypair: Keypair instance (None until decrypted on activation if
+            generated by worker processes or loaded from a store)
+        created_ts: Creation time (epoch seconds)
+        last_used_ts: Last usage time (epoch seconds)
         usage_count: Number of times used
         status: Current status
-        encrypted_private_key: Encrypted private key (for storage)
+        ciphertext: Encrypted private key (binary Fernet token, for storage)
+        retired_ts: Retirement time (epoch seconds)
+        balance_lamports: Last known balance (not persisted, None if unknown)
     """
-    public_key: Pubkey
-    keypair: Keypair
-    created_at: datetime
-    last_used: Optional[datetime] = None
-    usage_count: int = 0
-    status: WalletStatus = WalletStatus.RESERVE
-    encrypted_private_key: Optional[dict] = None
+    
+    __slots__ = (
+        "public_key",
+        "keypair",
+        "created_ts",
+        "last_used_ts",
+        "usage_count",
+        "status",
+        "ciphertext",
+        "retired_ts",
+        "balance_lamports",
+    )
+    
+    def __init__(
+        self,
+        public_key: Pubkey,
+        keypair: Optional[Keypair],
+        created_at: Union[datetime, int, float],
+        last_used: Union[datetime, int, float, None] = None,
+        usage_count: int = 0,
+        status: WalletStatus = WalletStatus.RESERVE,
+        encrypted_private_key: Union[bytes, dict, None] = None,
+        retired_at: Union[datetime, int, float, None] = None,
+        balance_lamports: Optional[int] = None
+    ):
+        """
+        Initialize burner wallet
+        
+        Args:
+            public_key: Wallet public key
+            keypair: Keypair instance (or None)
+            created_at: Creation time (naive UTC datetime or epoch seconds)
+            last_used: Last usage time (naive UTC datetime or epoch seconds)
+            usage_count: Number of times used
+            status: Current status
+            encrypted_private_key: Binary ciphertext or encrypt_keypair() dictionary
+            retired_at: Retirement time (naive UTC datetime or epoch seconds)
+            balance_lamports: Last known balance in lamports
+        """
+        self.public_key = public_key
+        self.keypair = keypair
+        self.created_ts = to_epoch(created_at)
+        self.last_used_ts = to_epoch(last_used)
+        self.usage_count = usage_count
+        self.status = status
+        self.encrypted_private_key = encrypted_private_key
+        self.retired_ts = to_epoch(retired_at)
+        self.balance_lamports = balance_lamports
+    
+    @property
+    def created_at(self) -> datetime:
+        """Creation timestamp (naive UTC)"""
+        return from_epoch(self.created_ts)
+    
+    @created_at.setter
+    def created_at(self, value: Union[datetime, int, float]):
+        self.created_ts = to_epoch(value)
+    
+    @property
+    def last_used(self) -> Optional[datetime]:
+        """Last usage timestamp (naive UTC)"""
+        return from_epoch(self.last_used_ts)
+    
+    @last_used.setter
+    def last_used(self, value: Union[datetime, int, float, None]):
+        self.last_used_ts = to_epoch(value)
+    
+    @property
+    def retired_at(self) -> Optional[datetime]:
+        """Retirement timestamp (naive UTC)"""
+        return from_epoch(self.retired_ts)
+    
+    @property
+    def encrypted_private_key(self) -> Optional[dict]:
+        """Encrypted private key in the WalletGenerator.encrypt_keypair() format"""
+        if self.ciphertext is None:
+            return None
+        return {
+            "public_key": str(self.public_key),
+            "encrypted_private_key": unpack_ciphertext(self.ciphertext),
+            "created_at": None
+        }
+    
+    @encrypted_private_key.setter
+    def encrypted_private_key(self, value: Union[bytes, dict, None]):
+        if isinstance(value, dict):
+            value = pack_ciphertext(value["encrypted_private_key"])
+        self.ciphertext = value
+    
+    def __repr__(self) -> str:
+        return (
+            f"BurnerWallet(public_key={self.public_key}, status={self.status.value}, "
+            f"usage_count={self.usage_count}, created_ts={self.created_ts})"
+        )
     
     def mark_used(self):
         """Mark wallet as used"""
-        self.last_used = datetime.utcnow()
+        self.last_used_ts = int(time.time())
         self.usage_count += 1
     
-    def is_expired(self, max_age_hours: int = 24) -> bool:
+    def is_expired(self, max_age_hours: int = 24, now: Optional[float] = None) -> bool:
         """
         Check if wallet is expired based on age
         
         Args:
             max_age_hours: Maximum age in hours
+            now: Current epoch seconds (read from the clock if None)
             
         Returns:
             True if expired
         """
-        age = datetime.utcnow() - self.created_at
-        return age > timedelta(hours=max_age_hours)
+        if now is None:
+            now = time.time()
+        return now - self.created_ts > max_age_hours * 3600
     
     def should_retire(self, max_uses: int = 1) -> bool:
         """
@@ -76,16 +208,71 @@ class BurnerWallet:
         return self.usage_count >= max_uses
 
 
+class _PoolView(Mapping[str, BurnerWallet]):
+    """
+    Read-only view of one status pool keyed by base58 public key
+    
+    Kept for callers of the former active_pool/reserve_pool/retired_pool
+    dictionaries; PoolManager itself indexes wallets by raw key bytes.
+    """
+    
+    def __init__(self, wallets: Dict[bytes, BurnerWallet], members: Dict[bytes, None]):
+        self._wallets = wallets
+        self._members = members
+    
+    def __getitem__(self, key: str) -> BurnerWallet:
+        try:
+            raw = bytes(Pubkey.from_string(key))
+        except ValueError:
+            raise KeyError(key) from None
+        if raw not in self._members:
+            raise KeyError(key)
+        return self._wallets[raw]
+    
+    def __iter__(self) -> Iterator[str]:
+        return (str(self._wallets[raw].public_key) for raw in list(self._members))
+    
+    def __len__(self) -> int:
+        return len(self._members)
+    
+    def values(self) -> ValuesView[BurnerWallet]:
+        return _PoolValues(self)
+
+
+class _PoolValues(ValuesView[BurnerWallet]):
+    """Values of a _PoolView, iterated without re-parsing base58 keys"""
+    
+    def __init__(self, view: _PoolView):
+        super().__init__(view)
+        self._view = view
+    
+    def __iter__(self) -> Iterator[BurnerWallet]:
+        view = self._view
+        return (view._wallets[raw] for raw in list(view._members))
+
+
 class PoolManager:
     """
     Manages pools of burner wallets
+    
+    With a shared store (store.shared) the store itself is the pool: reserve
+    wallets live only in the store and are checked out atomically, lookups
+    fall back to the store, and pool sizes are read from it, so several
+    processes can serve one pool. In-memory state then holds just the
+    wallets this process checked out or retired.
     """
     
     def __init__(
         self,
         min_reserve_size: int = 5,
         max_active_size: int = 10,
-        wallet_generator: Optional[WalletGenerator] = None
+        wallet_generator: Optional[WalletGenerator] = None,
+        parallel_generator: Optional[ParallelWalletGenerator] = None,
+        parallel_threshold: int = 100,
+        store: Optional["WalletStore"] = None,
+        retired_cache_size: int = 1000,
+        retired_ttl: Optional[float] = 3600.0,
+        tombstones: Optional["TombstoneLog"] = None
     ):
         """
         Initialize pool manager
@@ -94,21 +281,154 @@ class PoolManager:
             min_reserve_size: Minimum number of wallets in reserve pool
             max_active_size: Maximum number of wallets in active pool
             wallet_generator: Wallet generator instance
+            parallel_generator: Optional multi-process generator for large batches
+            parallel_threshold: Minimum batch size sent to the parallel generator
+            store: Optional persistent wallet store (reserve/active pools are
+                restored from it on startup, or served from it if shared)
+            retired_cache_size: Maximum retired wallets kept in memory
+            retired_ttl: Seconds a retired wallet stays in memory (None disables)
+            tombstones: Optional on-disk log receiving retired wallets evicted
+                from memory (evicted entries are dropped without one)
         """
         self.min_reserve_size = min_reserve_size
         self.max_active_size = max_active_size
         self.generator = wallet_generator or WalletGenerator()
+        self.parallel_generator = parallel_generator
+        self.parallel_threshold = parallel_threshold
+        
+        # Single index of in-memory wallets keyed by raw public key bytes,
+        # with per-status membership (dicts used as insertion-ordered sets)
+        self._wallets: Dict[bytes, BurnerWallet] = {}
+        self._active: Dict[bytes, None] = {}
+        self._reserve: Dict[bytes, None] = {}
+        # Retired wallets are bounded (retirement order) and spill to tombstones
+        self._retired: Dict[bytes, None] = {}
+        self._members: Dict[WalletStatus, Dict[bytes, None]] = {
+            WalletStatus.ACTIVE: self._active,
+            WalletStatus.RESERVE: self._reserve,
+            WalletStatus.RETIRED: self._retired,
+        }
         
-        # Pools
-        self.active_pool: Dict[str, BurnerWallet] = {}
-        self.reserve_pool: Dict[str, BurnerWallet] = {}
-        self.retired_pool: Dict[str, BurnerWallet] = {}
+        # Min-heap of (created_ts, key) for reserve/active wallets; entries
+        # for wallets that left those pools are discarded lazily
+        self._expiry_heap: List[Tuple[int, bytes]] = []
+        self.retired_cache_size = retired_cache_size
+        self.retired_ttl = retired_ttl
+        self.tombstones = tombstones
+        self.retired_count = tombstones.total() if tombstones is not None else 0
+        self.spilled_count = 0
+        
+        from .wallet_store import SharedWalletStore
+        
+        self.store = store
+        # Shared-only operations (checkout, leases, counts) go through this reference
+        self.shared_store: Optional[SharedWalletStore] = store if isinstance(store, SharedWalletStore) else None
+        self.shared = self.shared_store is not None
+        # Latest commit ticket whose durability was not waited for
+        self._unsynced: Optional[int] = None
+        if store is not None and not self.shared:
+            self._warm_start()
         
         logger.info(
             f"PoolManager initialized: min_reserve={min_reserve_size}, "
             f"max_active={max_active_size}"
         )
     
+    @property
+    def active_pool(self) -> _PoolView:
+        """Active wallets keyed by base58 public key (read-only view)"""
+        return _PoolView(self._wallets, self._active)
+    
+    @property
+    def reserve_pool(self) -> _PoolView:
+        """Reserve wallets keyed by base58 public key (read-only view)"""
+        return _PoolView(self._wallets, self._reserve)
+    
+    @property
+    def retired_pool(self) -> _PoolView:
+        """In-memory retired wallets keyed by base58 public key (read-only view)"""
+        return _PoolView(self._wallets, self._retired)
+    
+    def _set_status(self, wallet: BurnerWallet, status: WalletStatus) -> bytes:
+        """
+        Index wallet under a new status
+        
+        Args:
+            wallet: Wallet to move
+            status: New status
+            
+        Returns:
+            Index key (raw public key bytes)
+        """
+        key = bytes(wallet.public_key)
+        live = key in self._active or key in self._reserve
+        self._members[wallet.status].pop(key, None)
+        self._members[status][key] = None
+        wallet.status = status
+        self._wallets[key] = wallet
+        
+        if not live and status != WalletStatus.RETIRED:
+            self._track_expiry(wallet.created_ts, key)
+        return key
+    
+    def _track_expiry(self, created_ts: int, key: bytes):
+        """Add a wallet to the expiry heap, compacting it if stale entries dominate"""
+        heap = self._expiry_heap
+        heapq.heappush(heap, (created_ts, key))
+        
+        if len(heap) > 2 * (len(self._active) + len(self._reserve)) + 1024:
+            self._expiry_heap = [
+                (self._wallets[key].created_ts, key)
+                for members in (self._active, self._reserve)
+                for key in members
+            ]
+            heapq.heapify(self._expiry_heap)
+    
+    def _warm_start(self):
+        """Restore reserve and active pools from the store"""
+        for wallet in self.store.load():
+            if wallet.status == WalletStatus.ACTIVE:
+                wallet.keypair = self.generator.decrypt_keypair_raw(wallet.ciphertext)
+            self._set_status(wallet, wallet.status)
+        
+        logger.info(
+            f"Restored {len(self._reserve)} reserve and "
+            f"{len(self._active)} active wallets from store"
+        )
+    
+    def _persist(self, wallet: BurnerWallet):
+        """Save wallet state to the store (if any), possibly buffered"""
+        if self.store is not None:
+            self.store.save(wallet)
+    
+    def _commit(self, wallet: BurnerWallet, wait: bool = True):
+        """Write a status transition to the store (if any); without wait, wait_durable() must follow"""
+        if self.store is not None:
+            ticket = self.store.commit(wallet, wait=wait)
+            if ticket is not None:
+                self._unsynced = ticket
+    
+    @property
+    def durable(self) -> bool:
+        """Whether every committed status transition is durable"""
+        return self._unsynced is None or self.store is None or self.store.is_durable(self._unsynced)
+    
+    def wait_durable(self):
+        """
+        Block until status transitions committed with wait=False are durable
+        
+        Safe to run in an executor thread, to keep the event loop free while
+        an asynchronous store (journal) group-commits.
+        """
+        ticket = self._unsynced
+        if ticket is not None and self.store is not None:
+            self.store.wait_durable(ticket)
+    
+    def flush(self):
+        """Flush buffered store writes"""
+        if self.store is not None:
+            self.store.flush()
+    
     def generate_wallet(self) -> BurnerWallet:
         """
         Generate a new burner wallet
@@ -122,16 +442,60 @@ class PoolManager:
         wallet = BurnerWallet(
             public_key=public_key,
             keypair=keypair,
-            created_at=datetime.utcnow(),
-            status=WalletStatus.RESERVE
+            created_at=time.time(),
+            status=WalletStatus.RESERVE,
+            encrypted_private_key=self.generator.encrypt_keypair_raw(keypair)  # For storage
         )
         
-        # Encrypt for storage
-        wallet.encrypted_private_key = self.generator.encrypt_keypair(keypair)
-        
         logger.debug(f"Generated new wallet: {public_key}")
         return wallet
     
+    def generate_batch(self, count: int) -> List[BurnerWallet]:
+        """
+        Generate multiple burner wallets in one pass
+        
+        Shares key derivation, timestamp and logging across the batch.
+        
+        Args:
+            count: Number of wallets to generate
+            
+        Returns:
+            List of new BurnerWallet instances
+        """
+        if count <= 0:
+            return []
+        
+        created_at = int(time.time())
+        
+        if self.parallel_generator is not None and count >= self.parallel_threshold:
+            # Keypairs stay encrypted until the wallet is activated
+            wallets = [
+                BurnerWallet(
+                    public_key=public_key,
+                    keypair=None,
+                    created_at=created_at,
+                    status=WalletStatus.RESERVE,
+                    encrypted_private_key=encrypted
+                )
+                for public_key, encrypted in self.parallel_generator.generate_encrypted(count)
+            ]
+            logger.debug(f"Generated batch of {count} wallets in worker processes")
+            return wallets
+        
+        wallets = [
+            BurnerWallet(
+                public_key=keypair.pubkey(),
+                keypair=keypair,
+                created_at=created_at,
+                status=WalletStatus.RESERVE,
+                encrypted_private_key=encrypted
+            )
+            for keypair, encrypted in self.generator.generate_batch_raw(count)
+        ]
+        
+        logger.debug(f"Generated batch of {count} wallets")
+        return wallets
+    
     def add_to_reserve(self, wallet: Optional[BurnerWallet] = None) -> BurnerWallet:
         """
         Add wallet to reserve pool
@@ -145,8 +509,14 @@ class PoolManager:
         if wallet is None:
             wallet = self.generate_wallet()
         
-        wallet.status = WalletStatus.RESERVE
-        self.reserve_pool[str(wallet.public_key)] = wallet
+        if self.shared:
+            # Any process may check it out, so only the store holds it
+            wallet.status = WalletStatus.RESERVE
+            self._persist(wallet)
+            return wallet
+        
+        self._set_status(wallet, WalletStatus.RESERVE)
+        self._persist(wallet)
         
         logger.debug(f"Added wallet to reserve: {wallet.public_key}")
         return wallet
@@ -158,28 +528,41 @@ class PoolManager:
         Returns:
             Wallet from reserve or None if empty
         """
-        if not self.reserve_pool:
+        if self.shared_store is not None:
+            wallet = self.shared_store.checkout()
+            if wallet is not None:
+                logger.debug(f"Checked out wallet from shared reserve: {wallet.public_key}")
+            return wallet
+        
+        reserve = self._reserve
+        if not reserve:
             return None
         
         # Get first available wallet
-        wallet = next(iter(self.reserve_pool.values()))
-        del self.reserve_pool[str(wallet.public_key)]
+        key = next(iter(reserve))
+        del reserve[key]
+        wallet = self._wallets.pop(key)
         
         logger.debug(f"Retrieved wallet from reserve: {wallet.public_key}")
         return wallet
     
-    def activate_wallet(self, wallet: BurnerWallet) -> BurnerWallet:
+    def activate_wallet(self, wallet: BurnerWallet, wait: bool = True) -> BurnerWallet:
         """
         Move wallet to active pool
         
         Args:
             wallet: Wallet to activate
+            wait: Block until the store has made the transition durable
+                (if False, call wait_durable() before handing the wallet out)
             
         Returns:
             Activated wallet
         """
-        wallet.status = WalletStatus.ACTIVE
-        self.active_pool[str(wallet.public_key)] = wallet
+        if wallet.keypair is None and wallet.ciphertext is not None:
+            wallet.keypair = self.generator.decrypt_keypair_raw(wallet.ciphertext)
+        
+        self._set_status(wallet, WalletStatus.ACTIVE)
+        self._commit(wallet, wait)
         
         logger.debug(f"Activated wallet: {wallet.public_key}")
         return wallet
@@ -194,98 +577,340 @@ class PoolManager:
         Returns:
             Active wallet or None
         """
+        active = self._active
         if public_key:
-            return self.active_pool.get(str(public_key))
+            key = bytes(public_key)
+            return self._wallets[key] if key in active else None
         
-        if not self.active_pool:
+        if not active:
             return None
         
         # Return first available
-        return next(iter(self.active_pool.values()))
+        return self._wallets[next(iter(active))]
     
-    def retire_wallet(self, wallet: BurnerWallet):
+    def retire_wallet(self, wallet: BurnerWallet, wait: bool = True):
         """
         Move wallet to retired pool
         
         Args:
             wallet: Wallet to retire
+            wait: Block until the store has made the transition durable
+                (if False, call wait_durable() later)
         """
-        # Remove from current pool
-        key = str(wallet.public_key)
-        if key in self.active_pool:
-            del self.active_pool[key]
-        elif key in self.reserve_pool:
-            del self.reserve_pool[key]
-        
-        # Add to retired
-        wallet.status = WalletStatus.RETIRED
-        self.retired_pool[key] = wallet
+        # Move to retired (newest end)
+        if wallet.status != WalletStatus.RETIRED:
+            self.retired_count += 1
+        self._set_status(wallet, WalletStatus.RETIRED)
+        wallet.retired_ts = int(time.time())
         
         # Clear sensitive data (keep only public key for tracking)
         wallet.keypair = None  # Clear from memory
-        wallet.encrypted_private_key = None
+        wallet.ciphertext = None
+        self._commit(wallet, wait)
+        
+        self._evict_retired(wallet.retired_ts)
         
         logger.info(f"Retired wallet: {wallet.public_key}")
     
-    def get_wallet(self, public_key: Pubkey) -> Optional[BurnerWallet]:
+    def evict_retired(self):
+        """Spill retired wallets past the retired TTL (run periodically between retirements)"""
+        self._evict_retired(int(time.time()))
+    
+    def _evict_retired(self, now: int):
+        """
+        Spill retired wallets beyond the memory cap or TTL to tombstones
+        
+        Entries are evicted oldest-retired first.
+        
+        Args:
+            now: Current epoch seconds
+        """
+        retired = self._retired
+        evicted = []
+        while retired:
+            key = next(iter(retired))
+            oldest = self._wallets[key]
+            over_capacity = len(retired) > self.retired_cache_size
+            stale = (
+                self.retired_ttl is not None
+                and oldest.retired_ts is not None
+                and now - oldest.retired_ts > self.retired_ttl
+            )
+            if not (over_capacity or stale):
+                break
+            
+            del retired[key]
+            del self._wallets[key]
+            evicted.append(oldest)
+        
+        self._spill(evicted)
+    
+    def _spill(self, wallets: List[BurnerWallet]):
+        """Write retired wallets to the tombstone log (if any)"""
+        if not wallets:
+            return
+        
+        if self.tombstones is not None:
+            self.tombstones.append(wallets)
+        self.spilled_count += len(wallets)
+        logger.debug(f"Spilled {len(wallets)} retired wallets from memory")
+    
+    def mark_used(self, wallet: BurnerWallet):
+        """
+        Record a wallet use
+        
+        Args:
+            wallet: Wallet that was used
+        """
+        if self.shared_store is not None:
+            # Atomic increment: other processes may use the same wallet
+            wallet.usage_count, wallet.last_used_ts = self.shared_store.record_use(wallet.public_key, int(time.time()))
+            return
+        
+        wallet.mark_used()
+        self._persist(wallet)
+    
+    def get_wallet(self, public_key: Pubkey, include_tombstones: bool = True) -> Optional[BurnerWallet]:
         """
         Get wallet from any pool
         
+        Retired wallets no longer held in memory are looked up in the
+        tombstone log and returned as stubs carrying retired_at. With a
+        shared store, wallets held by other processes are read from it.
+        
         Args:
             public_key: Wallet public key
+            include_tombstones: Fall back to the tombstone log (disk read)
             
         Returns:
             Wallet if found, None otherwise
         """
-        key = str(public_key)
+        key = bytes(public_key)
+        
+        if self.shared_store is not None:
+            return self._get_shared(self.shared_store, key, public_key, include_tombstones)
         
-        if key in self.active_pool:
-            return self.active_pool[key]
-        elif key in self.reserve_pool:
-            return self.reserve_pool[key]
-        elif key in self.retired_pool:
-            return self.retired_pool[key]
+        wallet = self._wallets.get(key)
+        if wallet is not None:
+            return wallet
+        
+        if include_tombstones and self.tombstones is not None:
+            return self.tombstones.find(public_key)
         
         return None
     
+    def _get_shared(
+        self,
+        store: "SharedWalletStore",
+        key: bytes,
+        public_key: Pubkey,
+        include_tombstones: bool
+    ) -> Optional[BurnerWallet]:
+        """Look up a wallet in the shared store, syncing any local copy"""
+        stored = store.get(public_key)
+        local = self._wallets.get(key)
+        
+        if stored is None:
+            if local is not None:
+                return local
+            if include_tombstones and self.tombstones is not None:
+                return self.tombstones.find(public_key)
+            return None
+        
+        if local is None:
+            return stored
+        
+        # Another process may have used or retired our copy
+        local.usage_count = stored.usage_count
+        local.last_used_ts = stored.last_used_ts
+        if stored.status == WalletStatus.RETIRED and local.status != WalletStatus.RETIRED:
+            self.retire_wallet(local)
+        return local
+    
+    def _forget(self, key: bytes) -> BurnerWallet:
+        """Drop a wallet from memory without persisting (another instance owns it now)"""
+        wallet = self._wallets.pop(key)
+        self._members[wallet.status].pop(key, None)
+        wallet.keypair = None
+        return wallet
+    
+    def renew_leases(self) -> List[BurnerWallet]:
+        """
+        Renew checkout leases on this instance's active wallets (shared store)
+        
+        Wallets whose lease was reclaimed by another instance are dropped
+        from memory.
+        
+        Returns:
+            List of wallets whose lease was lost
+        """
+        if self.shared_store is None or not self._active:
+            return []
+        
+        active = list(self._active)
+        renewed = self.shared_store.renew_leases([self._wallets[key].public_key for key in active])
+        lost = [
+            self._forget(key)
+            for key in active
+            if str(self._wallets[key].public_key) not in renewed
+        ]
+        
+        if lost:
+            logger.warning(f"Lost leases on {len(lost)} active wallets")
+        return lost
+    
+    def reclaim_expired_leases(self) -> int:
+        """
+        Retire wallets whose checkout lease expired (shared store)
+        
+        Returns:
+            Number of wallets retired
+        """
+        if self.shared_store is None:
+            return 0
+        return self.shared_store.reclaim_expired_leases()
+    
+    def reserve_size(self) -> int:
+        """
+        Get number of reserve wallets (across processes with a shared store)
+        
+        Returns:
+            Reserve pool size
+        """
+        if self.shared_store is not None:
+            return self.shared_store.count_by_status()[WalletStatus.RESERVE]
+        return len(self._reserve)
+    
+    def reserve_deficit(self) -> int:
+        """
+        Get number of wallets needed to bring reserve pool to minimum size
+        
+        Returns:
+            Number of missing reserve wallets (0 if reserve is full)
+        """
+        return max(0, self.min_reserve_size - self.reserve_size())
+    
+    def claim_refill(self, target: int, limit: int) -> int:
+        """
+        Get how many wallets to add towards a reserve target
+        
+        With a shared store the count is claimed under the store's write
+        lock, so instances refilling together stop at the target; call
+        release_refill() once the wallets are in reserve.
+        
+        Args:
+            target: Reserve size to fill up to
+            limit: Maximum wallets to add now
+            
+        Returns:
+            Number of wallets to generate (0 if none)
+        """
+        if self.shared_store is not None:
+            return self.shared_store.claim_reserve(target, limit)
+        return max(0, min(limit, target - len(self._reserve)))
+    
+    def release_refill(self):
+        """Release a refill claimed with claim_refill() (shared store)"""
+        if self.shared_store is not None:
+            self.shared_store.release_reserve_claim()
+    
     def maintain_reserve_pool(self):
         """
         Maintain reserve pool size by generating new wallets if needed
         """
-        current_size = len(self.reserve_pool)
+        current_size = self.reserve_size()
+        needed = self.claim_refill(self.min_reserve_size, self.min_reserve_size)
         
-        if current_size < self.min_reserve_size:
-            needed = self.min_reserve_size - current_size
+        if needed:
             logger.info(f"Reserve pool below minimum ({current_size}/{self.min_reserve_size}), generating {needed} wallets")
             
-            for _ in range(needed):
-                self.add_to_reserve()
+            try:
+                for wallet in self.generate_batch(needed):
+                    self.add_to_reserve(wallet)
+            finally:
+                self.release_refill()
+    
+    def _skip_stale_expiry(self):
+        """Discard heap entries at the top for wallets no longer in reserve/active"""
+        heap = self._expiry_heap
+        while heap and heap[0][1] not in self._active and heap[0][1] not in self._reserve:
+            heapq.heappop(heap)
     
-    def cleanup_expired_wallets(self, max_age_hours: int = 24):
+    def next_expiry(self, max_age_hours: int = 24) -> Optional[float]:
         """
-        Clean up expired wallets from all pools
+        Get the time the oldest reserve/active wallet expires
         
         Args:
             max_age_hours: Maximum age in hours
+            
+        Returns:
+            Epoch seconds of the next expiry, or None if pools are empty
         """
-        expired = []
+        self._skip_stale_expiry()
+        if not self._expiry_heap:
+            return None
+        return self._expiry_heap[0][0] + max_age_hours * 3600
+    
+    def cleanup_expired_wallets(
+        self,
+        max_age_hours: int = 24,
+        limit: Optional[int] = None,
+        wait: bool = True
+    ) -> List[BurnerWallet]:
+        """
+        Clean up expired wallets from all pools
         
-        # Check active pool
-        for wallet in list(self.active_pool.values()):
-            if wallet.is_expired(max_age_hours):
-                expired.append(wallet)
+        Pops only expired entries off the expiry heap, so cost scales with
+        the number of expired wallets rather than pool size.
         
-        # Check reserve pool
-        for wallet in list(self.reserve_pool.values()):
-            if wallet.is_expired(max_age_hours):
-                expired.append(wallet)
+        Args:
+            max_age_hours: Maximum age in hours
+            limit: Maximum wallets to retire (None for all expired)
+            wait: Block until the retirements are durable (one wait per call)
+            
+        Returns:
+            List of retired wallets
+        """
+        cutoff = time.time() - max_age_hours * 3600
+        heap = self._expiry_heap
+        expired: List[BurnerWallet] = []
+        
+        while heap and heap[0][0] < cutoff and (limit is None or len(expired) < limit):
+            _, key = heapq.heappop(heap)
+            if key not in self._active and key not in self._reserve:
+                continue  # Stale entry: wallet retired or checked out
+            
+            # Retire immediately so duplicate entries for the key become stale
+            wallet = self._wallets[key]
+            self.retire_wallet(wallet, wait=False)
+            expired.append(wallet)
+        
+        if wait:
+            self.wait_durable()
         
-        # Retire expired wallets
-        for wallet in expired:
-            self.retire_wallet(wallet)
+        if self.shared_store is not None and (limit is None or len(expired) < limit):
+            # Shared reserve and other processes' wallets
+            remaining = None if limit is None else limit - len(expired)
+            shared_expired = self.shared_store.retire_expired(cutoff, remaining)
+            self.retired_count += len(shared_expired)
+            expired.extend(shared_expired)
         
         if expired:
             logger.info(f"Retired {len(expired)} expired wallets")
+        
+        return expired
+    
+    def close(self):
+        """Release generator resources (worker processes), flush the store and spill retired wallets"""
+        if self.parallel_generator is not None:
+            self.parallel_generator.close()
+        if self.store is not None:
+            self.store.close()
+        if self.tombstones is not None:
+            retired = self._retired
+            self._spill([self._wallets.pop(key) for key in retired])
+            retired.clear()
+            self.tombstones.close()
     
     def get_pool_stats(self) -> dict:
         """
@@ -294,10 +919,23 @@ class PoolManager:
         Returns:
             Dictionary with pool statistics
         """
+        if self.shared_store is not None:
+            counts = self.shared_store.count_by_status()
+            active = counts[WalletStatus.ACTIVE]
+            reserve = counts[WalletStatus.RESERVE]
+            retired = counts[WalletStatus.RETIRED]
+        else:
+            active = len(self._active)
+            reserve = len(self._reserve)
+            retired = self.retired_count
+        
         return {
-            "active": len(self.active_pool),
-            "reserve": len(self.reserve_pool),
-            "retired": len(self.retired_pool),
-            "total": len(self.active_pool) + len(self.reserve_pool) + len(self.retired_pool)
+            "active": active,
+            "reserve": reserve,
+            "retired": retired,
+            "retired_in_memory": len(self._retired),
+            "retired_spilled": self.spilled_count,
+            "total": active + reserve + retired,
+            "shared": self.shared
         }
 
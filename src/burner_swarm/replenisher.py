@@ -0,0 +1,151 @@
+"""
+Reserve Replenisher
+
+Background task that keeps the reserve pool between low/high watermarks.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable, Optional, Tuple
+from .background_loop import BackgroundLoop
+from .pool_manager import PoolManager
+from .reserve_sizing import ReserveSizer
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ReserveReplenisher:
+    """
+    Refills the reserve pool in batches off the event loop
+    
+    When the reserve falls below the low watermark it is refilled up to the
+    high watermark, generating at most batch_size wallets per executor call.
+    Queued checkouts (demand) raise both watermarks, so waiting callers are
+    served from the refill rather than generating wallets themselves. With a
+    ReserveSizer, the low watermark follows its adaptive target and the high
+    watermark keeps the configured gap above it.
+    """
+    
+    def __init__(
+        self,
+        pool_manager: PoolManager,
+        executor: Optional[Executor] = None,
+        low_watermark: int = 5,
+        high_watermark: int = 10,
+        batch_size: int = 10,
+        interval: float = 1.0,
+        demand: Optional[Callable[[], int]] = None,
+        on_added: Optional[Callable[[int], None]] = None,
+        sizer: Optional[ReserveSizer] = None
+    ):
+        """
+        Initialize reserve replenisher
+        
+        Args:
+            pool_manager: Pool manager to replenish
+            executor: Executor for wallet generation (default loop executor if None)
+            low_watermark: Refill when reserve drops below this size
+            high_watermark: Refill up to this size
+            batch_size: Maximum wallets generated per executor call
+            interval: Seconds between periodic checks
+            demand: Optional callable returning the number of queued checkouts
+            on_added: Optional callback receiving the size of each added batch
+            sizer: Optional adaptive sizer overriding the low watermark
+        """
+        if high_watermark < low_watermark:
+            raise ValueError("high_watermark must be >= low_watermark")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        
+        self.pool_manager = pool_manager
+        self.executor = executor
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.batch_size = batch_size
+        self.interval = interval
+        self.demand = demand
+        self.on_added = on_added
+        self.sizer = sizer
+        
+        self._lock = asyncio.Lock()
+        self._loop = BackgroundLoop(self.replenish, lambda: self.interval, name="Reserve replenishment")
+        
+        logger.info(
+            f"ReserveReplenisher initialized: low={low_watermark}, "
+            f"high={high_watermark}, batch={batch_size}"
+        )
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running"""
+        return self._loop.running
+    
+    def _demand(self) -> int:
+        """Number of queued checkouts"""
+        return self.demand() if self.demand is not None else 0
+    
+    def watermarks(self) -> Tuple[int, int]:
+        """
+        Get the current refill watermarks
+        
+        Returns:
+            (low, high) reserve sizes
+        """
+        if self.sizer is None:
+            return self.low_watermark, self.high_watermark
+        
+        low = self.sizer.target()
+        return low, low + self.high_watermark - self.low_watermark
+    
+    def needs_refill(self) -> bool:
+        """Check if reserve is below the low watermark (plus queued checkouts)"""
+        return self.pool_manager.reserve_size() < self.watermarks()[0] + self._demand()
+    
+    async def replenish(self) -> int:
+        """
+        Refill reserve up to the high watermark if below the low watermark
+        
+        Returns:
+            Number of wallets added to reserve
+        """
+        async with self._lock:
+            if not self.needs_refill():
+                return 0
+            
+            loop = asyncio.get_running_loop()
+            high_watermark = self.watermarks()[1]
+            added = 0
+            
+            while True:
+                # Claimed so replenishers of other instances sharing the pool stop at the same target
+                count = self.pool_manager.claim_refill(high_watermark + self._demand(), self.batch_size)
+                if count <= 0:
+                    break
+                
+                try:
+                    wallets = await loop.run_in_executor(self.executor, self.pool_manager.generate_batch, count)
+                    for wallet in wallets:
+                        self.pool_manager.add_to_reserve(wallet)
+                finally:
+                    self.pool_manager.release_refill()
+                added += len(wallets)
+                if self.on_added is not None:
+                    self.on_added(len(wallets))
+            
+            logger.debug(f"Replenished reserve pool with {added} wallets")
+            return added
+    
+    def notify(self):
+        """Wake the background task to check the reserve"""
+        self._loop.notify()
+    
+    def start(self):
+        """Start background replenishment"""
+        if self._loop.start():
+            logger.info("ReserveReplenisher started")
+    
+    async def stop(self):
+        """Stop background replenishment"""
+        if await self._loop.stop():
+            logger.info("ReserveReplenisher stopped")
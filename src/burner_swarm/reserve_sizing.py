@@ -0,0 +1,177 @@
+"""
+Reserve Sizing
+
+Adaptive reserve target driven by the observed checkout rate.
+"""
+
+import math
+import time
+from typing import Optional
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _RateTracker:
+    """EWMA of an event rate over fixed windows"""
+    
+    def __init__(self, window: float, alpha: float, now: float):
+        self.window = window
+        self.alpha = alpha
+        self.ewma = 0.0
+        self.count = 0
+        self.window_start = now
+    
+    def roll(self, now: float):
+        """Fold completed windows into the EWMA (empty windows decay it)"""
+        elapsed = int((now - self.window_start) / self.window)
+        if elapsed < 1:
+            return
+        
+        self.ewma += self.alpha * (self.count / self.window - self.ewma)
+        self.ewma *= (1 - self.alpha) ** (elapsed - 1)
+        self.count = 0
+        self.window_start += elapsed * self.window
+    
+    def add(self, count: int, now: float):
+        """Record events"""
+        self.roll(now)
+        self.count += count
+    
+    def rate(self, now: float) -> float:
+        """Forecast events per second (EWMA, or the current window if already higher)"""
+        self.roll(now)
+        return max(self.ewma, self.count / self.window)
+
+
+class ReserveSizer:
+    """
+    Resizes the reserve target from the checkout rate
+    
+    Checkouts are counted in windows of window seconds and smoothed with an
+    EWMA. The target covers the forecast checkouts over lead_time (roughly
+    how long a refill takes to catch up), clamped to [min_size, max_size].
+    
+    Wallets that expire unused are counted as losses: the target shrinks by
+    the observed waste ratio, and never exceeds what the forecast rate
+    would consume within a wallet's lifetime.
+    """
+    
+    def __init__(
+        self,
+        min_size: int = 5,
+        max_size: int = 100,
+        window: float = 10.0,
+        alpha: float = 0.3,
+        lead_time: float = 30.0,
+        max_age_hours: Optional[float] = 24
+    ):
+        """
+        Initialize reserve sizer
+        
+        Args:
+            min_size: Lower bound of the reserve target
+            max_size: Upper bound of the reserve target
+            window: Seconds per rate window
+            alpha: EWMA smoothing factor per window (0-1, higher reacts faster)
+            lead_time: Seconds of forecast checkouts the reserve should cover
+            max_age_hours: Wallet lifetime (None disables the lifetime cap)
+        """
+        if max_size < min_size:
+            raise ValueError("max_size must be >= min_size")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        
+        self.min_size = min_size
+        self.max_size = max_size
+        self.lead_time = lead_time
+        self.max_age_hours = max_age_hours
+        
+        now = time.monotonic()
+        self._checkouts = _RateTracker(window, alpha, now)
+        self._expired = _RateTracker(window, alpha, now)
+        self.total_checkouts = 0
+        self.total_expired = 0
+        
+        logger.info(
+            f"ReserveSizer initialized: bounds=[{min_size}, {max_size}], "
+            f"window={window}s, lead_time={lead_time}s"
+        )
+    
+    def record_checkout(self, count: int = 1, now: Optional[float] = None):
+        """
+        Record wallets checked out of the reserve
+        
+        Args:
+            count: Number of wallets
+            now: Monotonic seconds (read from the clock if None)
+        """
+        self._checkouts.add(count, time.monotonic() if now is None else now)
+        self.total_checkouts += count
+    
+    def record_expired(self, count: int, now: Optional[float] = None):
+        """
+        Record wallets that expired without being used
+        
+        Args:
+            count: Number of wallets
+            now: Monotonic seconds (read from the clock if None)
+        """
+        if count:
+            self._expired.add(count, time.monotonic() if now is None else now)
+            self.total_expired += count
+    
+    def forecast(self, now: Optional[float] = None) -> float:
+        """
+        Get the forecast checkout rate
+        
+        Args:
+            now: Monotonic seconds (read from the clock if None)
+            
+        Returns:
+            Checkouts per second
+        """
+        return self._checkouts.rate(time.monotonic() if now is None else now)
+    
+    def target(self, now: Optional[float] = None) -> int:
+        """
+        Get the current reserve target
+        
+        Args:
+            now: Monotonic seconds (read from the clock if None)
+            
+        Returns:
+            Reserve size between min_size and max_size
+        """
+        if now is None:
+            now = time.monotonic()
+        rate = self._checkouts.rate(now)
+        expiry_rate = self._expired.rate(now)
+        
+        wanted = rate * self.lead_time
+        if expiry_rate > 0:
+            wanted *= rate / (rate + expiry_rate)  # Share of generated wallets actually used
+        if self.max_age_hours is not None:
+            wanted = min(wanted, rate * self.max_age_hours * 3600)
+        
+        return max(self.min_size, min(self.max_size, math.ceil(wanted)))
+    
+    def get_stats(self) -> dict:
+        """
+        Get sizing statistics
+        
+        Returns:
+            Dictionary with the current target and rate forecasts
+        """
+        now = time.monotonic()
+        rate = self.forecast(now)
+        return {
+            "target": self.target(now),
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "checkout_rate": rate,
+            "forecast": rate * self.lead_time,
+            "expiry_loss_rate": self._expired.rate(now),
+            "total_checkouts": self.total_checkouts,
+            "total_expired": self.total_expired
+        }
@@ -0,0 +1,180 @@
+"""
+Rotation Policy
+
+Declarative rotation rules (usage, age, idle time, drained balance)
+compiled once into a single per-wallet predicate.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from .pool_manager import BurnerWallet
+from .funding_manager import LAMPORTS_PER_SOL
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+Check = Callable[[BurnerWallet, float], bool]
+
+
+@dataclass
+class RotationRule:
+    """
+    Single rotation rule
+    
+    Attributes:
+        name: Rule name
+        threshold: Configured threshold
+        check: Predicate (wallet, now) -> True if the wallet should rotate
+        reason: Human-readable reason (wallet, now) -> str for a matching wallet
+        deadline: Epoch seconds at which a wallet starts matching, for
+            time-based rules (None otherwise)
+    """
+    name: str
+    threshold: float
+    check: Check
+    reason: Callable[[BurnerWallet, float], str]
+    deadline: Optional[Callable[[BurnerWallet], float]] = None
+
+
+def usage_rule(max_uses: float) -> RotationRule:
+    """Rotate once usage_count reaches max_uses"""
+    return RotationRule(
+        name="usage",
+        threshold=max_uses,
+        check=lambda w, now: w.usage_count >= max_uses,
+        reason=lambda w, now: f"Usage count ({w.usage_count}) >= max ({max_uses})"
+    )
+
+
+def age_rule(max_age_hours: float) -> RotationRule:
+    """Rotate wallets older than max_age_hours"""
+    max_age = max_age_hours * 3600
+    return RotationRule(
+        name="age",
+        threshold=max_age_hours,
+        check=lambda w, now: now - w.created_ts > max_age,
+        reason=lambda w, now: f"Age ({(now - w.created_ts) / 3600:.1f}h) >= max ({max_age_hours}h)",
+        deadline=lambda w: w.created_ts + max_age
+    )
+
+
+def idle_rule(max_idle_hours: float) -> RotationRule:
+    """Rotate wallets unused (since last use or creation) for max_idle_hours"""
+    max_idle = max_idle_hours * 3600
+    return RotationRule(
+        name="idle",
+        threshold=max_idle_hours,
+        check=lambda w, now: now - (w.last_used_ts or w.created_ts) > max_idle,
+        reason=lambda w, now: (
+            f"Idle ({(now - (w.last_used_ts or w.created_ts)) / 3600:.1f}h) >= max ({max_idle_hours}h)"
+        ),
+        deadline=lambda w: (w.last_used_ts or w.created_ts) + max_idle
+    )
+
+
+def balance_rule(min_balance_sol: float) -> RotationRule:
+    """Rotate used wallets whose last known balance drained below min_balance_sol"""
+    min_lamports = int(min_balance_sol * LAMPORTS_PER_SOL)
+    return RotationRule(
+        name="balance",
+        threshold=min_balance_sol,
+        check=lambda w, now: (
+            w.usage_count > 0 and w.balance_lamports is not None and w.balance_lamports < min_lamports
+        ),
+        reason=lambda w, now: (
+            f"Balance ({(w.balance_lamports or 0) / LAMPORTS_PER_SOL:.9g} SOL) < min ({min_balance_sol} SOL)"
+        )
+    )
+
+
+RULES: Dict[str, Callable[[float], RotationRule]] = {
+    "usage": usage_rule,
+    "age": age_rule,
+    "idle": idle_rule,
+    "balance": balance_rule,
+}
+
+
+def register_rule(name: str, factory: Callable[[float], RotationRule]):
+    """
+    Register a custom rule factory
+    
+    Args:
+        name: Rule name used in policy configuration
+        factory: Callable building the rule from its threshold
+    """
+    RULES[name] = factory
+
+
+def _either(first: Check, second: Check) -> Check:
+    """Combine two predicates with short-circuit or"""
+    return lambda w, now: first(w, now) or second(w, now)
+
+
+class RotationPolicy:
+    """
+    Set of rotation rules compiled into one predicate
+    
+    Rules are declared as a name -> threshold mapping, e.g.
+    {"usage": 1, "age": 24, "idle": 2, "balance": 0.001}, and compiled once;
+    should_rotate() then costs one chained call per enabled rule.
+    """
+    
+    def __init__(self, rules: Dict[str, float]):
+        """
+        Initialize rotation policy
+        
+        Args:
+            rules: Rule name mapped to threshold (see RULES)
+        """
+        unknown = [name for name in rules if name not in RULES]
+        if unknown:
+            raise ValueError(f"Unknown rotation rules: {', '.join(unknown)}")
+        
+        self.rules: List[RotationRule] = [RULES[name](threshold) for name, threshold in rules.items()]
+        self.should_rotate: Check = self._compile()
+        self._deadlines = [rule.deadline for rule in self.rules if rule.deadline is not None]
+        
+        logger.info(f"RotationPolicy compiled: {self.thresholds}")
+    
+    @property
+    def thresholds(self) -> Dict[str, float]:
+        """Rule name mapped to threshold"""
+        return {rule.name: rule.threshold for rule in self.rules}
+    
+    def _compile(self) -> Check:
+        """Fold rule checks into a single predicate"""
+        if not self.rules:
+            return lambda w, now: False
+        
+        predicate = self.rules[-1].check
+        for rule in reversed(self.rules[:-1]):
+            predicate = _either(rule.check, predicate)
+        return predicate
+    
+    def evaluate(self, wallet: BurnerWallet, now: float) -> List[str]:
+        """
+        Evaluate every rule against a wallet
+        
+        Args:
+            wallet: Wallet to check
+            now: Current epoch seconds
+            
+        Returns:
+            Reasons of matching rules (empty if the wallet should not rotate)
+        """
+        return [rule.reason(wallet, now) for rule in self.rules if rule.check(wallet, now)]
+    
+    def next_deadline(self, wallet: BurnerWallet) -> Optional[float]:
+        """
+        Get the earliest time a time-based rule starts matching
+        
+        Args:
+            wallet: Wallet to check
+            
+        Returns:
+            Epoch seconds, or None without time-based rules
+        """
+        if not self._deadlines:
+            return None
+        return min(deadline(wallet) for deadline in self._deadlines)
@@ -4,17 +4,33 @@ Rotation Strategy
 Implements wallet rotation strategies to prevent pattern detection.
 """
 
-from typing import Optional, List
-from datetime import datetime, timedelta
+import heapq
+import time
+from typing import Dict, Optional, List, Tuple
 from .pool_manager import BurnerWallet, WalletStatus
+from .rotation_policy import RotationPolicy
+from .funding_manager import LAMPORTS_PER_SOL
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Heap entries: (-usage_count, created_ts, version, key) and (expiry_ts, version, key)
+_Candidate = Tuple[int, int, int, bytes]
+_Deadline = Tuple[float, int, bytes]
+
 
 class RotationStrategy:
     """
     Manages wallet rotation strategies
+    
+    Rotation rules are compiled into a RotationPolicy; should_rotate() and
+    get_rotation_recommendation() both evaluate that one policy.
+    
+    Tracked (active) wallets are kept in two heaps so top-k rotation
+    candidates come back in O(k log n): a candidate heap ordered by
+    (usage count, age) for wallets that should rotate, and a deadline heap
+    of not-yet-expired wallets that are promoted once their age limit
+    passes. Entries are versioned and invalidated lazily.
     """
     
     def __init__(
@@ -22,7 +38,10 @@ class RotationStrategy:
         max_uses: int = 1,
         max_age_hours: int = 24,
         rotation_on_time: bool = True,
-        rotation_on_use: bool = True
+        rotation_on_use: bool = True,
+        max_idle_hours: Optional[float] = None,
+        min_balance_sol: Optional[float] = None,
+        policy: Optional[RotationPolicy] = None
     ):
         """
         Initialize rotation strategy
@@ -32,38 +51,52 @@ class RotationStrategy:
             max_age_hours: Maximum age in hours before rotation
             rotation_on_time: Rotate based on time
             rotation_on_use: Rotate based on usage count
+            max_idle_hours: Rotate wallets unused for this many hours (None disables)
+            min_balance_sol: Rotate used wallets drained below this balance (None disables)
+            policy: Explicit rotation policy (overrides the rule arguments above)
         """
         self.max_uses = max_uses
         self.max_age_hours = max_age_hours
         self.rotation_on_time = rotation_on_time
         self.rotation_on_use = rotation_on_use
         
+        if policy is None:
+            rules: Dict[str, float] = {}
+            if rotation_on_use:
+                rules["usage"] = max_uses
+            if rotation_on_time:
+                rules["age"] = max_age_hours
+            if max_idle_hours:
+                rules["idle"] = max_idle_hours
+            if min_balance_sol:
+                rules["balance"] = min_balance_sol
+            policy = RotationPolicy(rules)
+        self.policy = policy
+        self._should_rotate = policy.should_rotate
+        
+        # Tracked wallets: key -> (wallet, version)
+        self._tracked: Dict[bytes, Tuple[BurnerWallet, int]] = {}
+        self._version = 0
+        self._candidates: List[_Candidate] = []
+        self._deadlines: List[_Deadline] = []
+        
         logger.info(
             f"RotationStrategy initialized: max_uses={max_uses}, "
             f"max_age_hours={max_age_hours}"
         )
     
-    def should_rotate(self, wallet: BurnerWallet) -> bool:
+    def should_rotate(self, wallet: BurnerWallet, now: Optional[float] = None) -> bool:
         """
         Determine if wallet should be rotated
         
         Args:
             wallet: Wallet to check
+            now: Current epoch seconds (read from the clock if None)
             
         Returns:
             True if should rotate
         """
-        # Check usage-based rotation
-        if self.rotation_on_use and wallet.should_retire(self.max_uses):
-            logger.debug(f"Wallet {wallet.public_key} should rotate: usage count {wallet.usage_count} >= {self.max_uses}")
-            return True
-        
-        # Check time-based rotation
-        if self.rotation_on_time and wallet.is_expired(self.max_age_hours):
-            logger.debug(f"Wallet {wallet.public_key} should rotate: expired")
-            return True
-        
-        return False
+        return self._should_rotate(wallet, time.time() if now is None else now)
     
     def select_rotation_candidates(
         self,
@@ -80,19 +113,131 @@ class RotationStrategy:
         Returns:
             List of wallets that should be rotated
         """
-        candidates = [w for w in wallets if self.should_rotate(w)]
+        now = time.time()
+        should_rotate = self._should_rotate
+        candidates = [w for w in wallets if should_rotate(w, now)]
         
         # Sort by priority (most used or oldest first)
-        candidates.sort(
-            key=lambda w: (w.usage_count, (datetime.utcnow() - w.created_at).total_seconds()),
-            reverse=True
-        )
+        candidates.sort(key=lambda w: (w.usage_count, -w.created_ts), reverse=True)
         
         if count:
             return candidates[:count]
         
         return candidates
     
+    def _index(self, wallet: BurnerWallet, now: float):
+        """Push a fresh entry for a wallet, invalidating its previous ones"""
+        key = bytes(wallet.public_key)
+        self._version += 1
+        self._tracked[key] = (wallet, self._version)
+        
+        if self._should_rotate(wallet, now):
+            candidate: _Candidate = (-wallet.usage_count, wallet.created_ts, self._version, key)
+            heapq.heappush(self._candidates, candidate)
+        else:
+            deadline = self.policy.next_deadline(wallet)
+            if deadline is not None:
+                entry: _Deadline = (deadline, self._version, key)
+                heapq.heappush(self._deadlines, entry)
+        
+        self._maybe_compact()
+    
+    def _is_current(self, key: bytes, version: int) -> bool:
+        """Check a heap entry still describes a tracked active wallet"""
+        tracked = self._tracked.get(key)
+        if tracked is None or tracked[1] != version:
+            return False
+        if tracked[0].status != WalletStatus.ACTIVE:
+            del self._tracked[key]  # Retired without untrack()
+            return False
+        return True
+    
+    def _maybe_compact(self):
+        """Rebuild heaps once stale entries outnumber tracked wallets"""
+        if len(self._candidates) + len(self._deadlines) <= 2 * len(self._tracked) + 1024:
+            return
+        
+        tracked = self._tracked
+        self._candidates = [entry for entry in self._candidates if tracked.get(entry[3], (None, None))[1] == entry[2]]
+        self._deadlines = [entry for entry in self._deadlines if tracked.get(entry[2], (None, None))[1] == entry[1]]
+        heapq.heapify(self._candidates)
+        heapq.heapify(self._deadlines)
+    
+    def track(self, wallet: BurnerWallet):
+        """
+        Start tracking an activated wallet
+        
+        Args:
+            wallet: Active wallet
+        """
+        self._index(wallet, time.time())
+    
+    def record_use(self, wallet: BurnerWallet):
+        """
+        Re-prioritize a tracked wallet after its usage count changed
+        
+        Args:
+            wallet: Wallet that was used
+        """
+        self._index(wallet, time.time())
+    
+    def record_balance(self, wallet: BurnerWallet, balance_sol: float):
+        """
+        Record a wallet's fetched balance (re-prioritizing it if tracked)
+        
+        Args:
+            wallet: Wallet that was checked
+            balance_sol: Balance in SOL
+        """
+        wallet.balance_lamports = int(balance_sol * LAMPORTS_PER_SOL)
+        if bytes(wallet.public_key) in self._tracked:
+            self._index(wallet, time.time())
+    
+    def untrack(self, wallet: BurnerWallet):
+        """
+        Stop tracking a wallet (e.g. on retirement)
+        
+        Args:
+            wallet: Wallet to forget
+        """
+        self._tracked.pop(bytes(wallet.public_key), None)
+    
+    def top_candidates(self, k: int, now: Optional[float] = None) -> List[BurnerWallet]:
+        """
+        Get the top k tracked wallets that should rotate
+        
+        Same order as select_rotation_candidates (most used, then oldest).
+        
+        Args:
+            k: Maximum number of wallets to return
+            now: Current epoch seconds (read from the clock if None)
+            
+        Returns:
+            List of wallets that should be rotated
+        """
+        if now is None:
+            now = time.time()
+        
+        # Promote wallets whose time-based deadline has passed
+        while self._deadlines and self._deadlines[0][0] < now:
+            _, version, key = heapq.heappop(self._deadlines)
+            if self._is_current(key, version):
+                wallet = self._tracked[key][0]
+                candidate: _Candidate = (-wallet.usage_count, wallet.created_ts, version, key)
+                heapq.heappush(self._candidates, candidate)
+        
+        selected: List[_Candidate] = []
+        while self._candidates and len(selected) < k:
+            entry = heapq.heappop(self._candidates)
+            if self._is_current(entry[3], entry[2]):
+                selected.append(entry)
+        
+        # Selected wallets remain candidates until rotated
+        for entry in selected:
+            heapq.heappush(self._candidates, entry)
+        
+        return [self._tracked[entry[3]][0] for entry in selected]
+    
     def get_rotation_recommendation(self, wallet: BurnerWallet) -> dict:
         """
         Get rotation recommendation for a wallet
@@ -103,22 +248,16 @@ class RotationStrategy:
         Returns:
             Dictionary with rotation recommendation
         """
-        should_rotate = self.should_rotate(wallet)
-        reasons = []
-        
-        if self.rotation_on_use and wallet.usage_count >= self.max_uses:
-            reasons.append(f"Usage count ({wallet.usage_count}) >= max ({self.max_uses})")
-        
-        if self.rotation_on_time and wallet.is_expired(self.max_age_hours):
-            age_hours = (datetime.utcnow() - wallet.created_at).total_seconds() / 3600
-            reasons.append(f"Age ({age_hours:.1f}h) >= max ({self.max_age_hours}h)")
+        now = time.time()
+        reasons = self.policy.evaluate(wallet, now)
         
         return {
-            "should_rotate": should_rotate,
+            "should_rotate": bool(reasons),
             "reasons": reasons,
             "usage_count": wallet.usage_count,
-            "age_hours": (datetime.utcnow() - wallet.created_at).total_seconds() / 3600,
+            "age_hours": (now - wallet.created_ts) / 3600,
             "max_uses": self.max_uses,
-            "max_age_hours": self.max_age_hours
+            "max_age_hours": self.max_age_hours,
+            "rules": self.policy.thresholds
         }
 
@@ -0,0 +1,152 @@
+"""
+RPC Connection Pool
+
+Long-lived Solana RPC client with bounded connections, HTTP keep-alive
+and in-flight/queueing counters.
+"""
+
+import asyncio
+import inspect
+import time
+from typing import Any, Dict, Optional
+from solana.rpc.async_api import AsyncClient
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# AsyncClient takes connection limits from solana 0.40; older clients keep
+# httpx's defaults (the pool's semaphore still bounds in-flight requests)
+CLIENT_LIMIT_ARGS = "max_connections" in inspect.signature(AsyncClient.__init__).parameters
+
+
+class RpcConnectionPool:
+    """
+    Bounded pool of keep-alive connections to one RPC endpoint
+    
+    Requests beyond max_connections wait in a queue; the pool tracks how
+    many are in flight and how many are queued so it can be sized.
+    """
+    
+    def __init__(
+        self,
+        endpoint: str,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 10.0
+    ):
+        """
+        Initialize RPC connection pool
+        
+        Args:
+            endpoint: Solana RPC endpoint URL
+            max_connections: Maximum concurrent connections (and in-flight requests)
+            max_keepalive_connections: Maximum idle keep-alive connections
+            keepalive_expiry: Idle keep-alive connection expiry in seconds
+            timeout: Per-request timeout in seconds
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+        
+        self.endpoint = endpoint
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        
+        self.client: Optional[AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(max_connections)
+        
+        # Counters
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_in_flight = 0
+        self.peak_queued = 0
+        self.total_requests = 0
+        self.total_errors = 0
+        self.total_queue_time = 0.0
+    
+    def get_client(self) -> AsyncClient:
+        """
+        Get the underlying client, creating it on first use
+        
+        Returns:
+            AsyncClient instance
+        """
+        if self.client is None:
+            limits: Dict[str, Any] = {}
+            if CLIENT_LIMIT_ARGS:
+                limits = {
+                    "max_connections": self.max_connections,
+                    "max_keepalive_connections": self.max_keepalive_connections,
+                    "keepalive_expiry": self.keepalive_expiry
+                }
+            else:
+                logger.warning("Installed solana AsyncClient has no connection limit options, using httpx defaults")
+            self.client = AsyncClient(self.endpoint, timeout=self.timeout, **limits)
+            logger.debug(f"Connected to Solana RPC {self.endpoint}")
+        return self.client
+    
+    async def request(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call an AsyncClient method through the pool
+        
+        Args:
+            method: AsyncClient method name (e.g. "get_balance")
+            *args: Method positional arguments
+            **kwargs: Method keyword arguments
+            
+        Returns:
+            Method response
+        """
+        client = self.get_client()
+        
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+        queued_at = time.monotonic()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+        self.total_queue_time += time.monotonic() - queued_at
+        
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.total_requests += 1
+        try:
+            return await getattr(client, method)(*args, **kwargs)
+        except Exception:
+            self.total_errors += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+    
+    async def close(self):
+        """Close all connections"""
+        if self.client:
+            await self.client.close()
+            self.client = None
+            logger.debug(f"Disconnected from Solana RPC {self.endpoint}")
+    
+    def get_stats(self) -> dict:
+        """
+        Get pool statistics
+        
+        Returns:
+            Dictionary with in-flight and queueing counters
+        """
+        return {
+            "endpoint": self.endpoint,
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_in_flight": self.peak_in_flight,
+            "peak_queued": self.peak_queued,
+            "total_requests": self.total_requests,
+            "total_errors": self.total_errors,
+            "avg_queue_ms": (
+                self.total_queue_time / self.total_requests * 1000
+                if self.total_requests else 0.0
+            )
+        }
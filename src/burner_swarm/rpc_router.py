@@ -0,0 +1,233 @@
+"""
+RPC Router
+
+Routes Solana RPC requests across multiple endpoints using rolling
+latency and error rates, with failover for idempotent reads and a
+circuit breaker for endpoints that keep failing.
+"""
+
+import time
+from collections import deque
+from typing import Any, List, Optional
+from .rpc_pool import RpcConnectionPool
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Idempotent methods that may be retried on another endpoint
+READ_METHODS = frozenset({
+    "get_balance",
+    "get_multiple_accounts",
+    "get_latest_blockhash",
+    "get_block_height",
+    "get_signature_statuses",
+    "get_account_info",
+    "get_slot",
+})
+
+
+class EndpointState:
+    """
+    Rolling health of a single RPC endpoint
+    
+    Attributes:
+        pool: Connection pool for the endpoint
+        latency: Exponentially weighted moving average latency in seconds
+        outcomes: Recent request outcomes (True = success)
+        consecutive_failures: Failures since the last success
+        open_until: Monotonic time until which the circuit is open
+    """
+    
+    def __init__(self, pool: RpcConnectionPool, error_window: int):
+        self.pool = pool
+        self.latency: Optional[float] = None
+        self.outcomes: deque = deque(maxlen=error_window)
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.trips = 0
+    
+    @property
+    def endpoint(self) -> str:
+        """Endpoint URL"""
+        return self.pool.endpoint
+    
+    @property
+    def error_rate(self) -> float:
+        """Error rate over the rolling window"""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+    
+    def is_available(self, now: float) -> bool:
+        """Check if the circuit is closed (or half-open after cooldown)"""
+        return now >= self.open_until
+
+
+class RpcRouter:
+    """
+    Latency-aware router over multiple RPC endpoints
+    """
+    
+    def __init__(
+        self,
+        endpoints: List[str],
+        latency_alpha: float = 0.2,
+        error_window: int = 20,
+        failure_threshold: int = 5,
+        max_error_rate: float = 0.5,
+        breaker_cooldown: float = 30.0,
+        **pool_kwargs
+    ):
+        """
+        Initialize RPC router
+        
+        Args:
+            endpoints: RPC endpoint URLs (first is preferred until latencies are known)
+            latency_alpha: EWMA smoothing factor for latency
+            error_window: Number of recent requests used for the error rate
+            failure_threshold: Consecutive failures that trip the circuit breaker
+            max_error_rate: Rolling error rate that trips the circuit breaker
+            breaker_cooldown: Seconds an open circuit stays open
+            **pool_kwargs: Connection pool settings applied to every endpoint
+        """
+        if not endpoints:
+            raise ValueError("At least one RPC endpoint is required")
+        
+        self.latency_alpha = latency_alpha
+        self.failure_threshold = failure_threshold
+        self.max_error_rate = max_error_rate
+        self.breaker_cooldown = breaker_cooldown
+        self.error_window = error_window
+        
+        self.endpoints = [
+            EndpointState(RpcConnectionPool(endpoint, **pool_kwargs), error_window)
+            for endpoint in endpoints
+        ]
+        
+        logger.info(f"RpcRouter initialized with {len(endpoints)} endpoints")
+    
+    @property
+    def primary(self) -> EndpointState:
+        """Preferred endpoint"""
+        return self.ranked()[0]
+    
+    def ranked(self) -> List[EndpointState]:
+        """
+        Rank endpoints for the next request
+        
+        Available endpoints come first, fastest first; endpoints without a
+        latency sample yet are tried before measured ones so they get one.
+        Open circuits are kept last as a last resort.
+        
+        Returns:
+            Endpoints in preference order
+        """
+        now = time.monotonic()
+        
+        def key(state: EndpointState):
+            return (
+                not state.is_available(now),
+                state.latency is not None,
+                state.latency or 0.0
+            )
+        
+        return sorted(self.endpoints, key=key)
+    
+    def _record_success(self, state: EndpointState, latency: float):
+        """Update endpoint health after a successful request"""
+        if state.latency is None:
+            state.latency = latency
+        else:
+            state.latency += self.latency_alpha * (latency - state.latency)
+        
+        state.outcomes.append(True)
+        state.consecutive_failures = 0
+        state.open_until = 0.0
+    
+    def _record_failure(self, state: EndpointState, error: Exception):
+        """Update endpoint health after a failed request, tripping the breaker if needed"""
+        state.outcomes.append(False)
+        state.consecutive_failures += 1
+        
+        now = time.monotonic()
+        half_open = state.open_until and now >= state.open_until
+        too_many_errors = (
+            len(state.outcomes) >= self.error_window // 2
+            and state.error_rate >= self.max_error_rate
+        )
+        
+        if half_open or state.consecutive_failures >= self.failure_threshold or too_many_errors:
+            state.open_until = now + self.breaker_cooldown
+            state.trips += 1
+            logger.warning(
+                f"Circuit opened for {state.endpoint} for {self.breaker_cooldown}s: {error}"
+            )
+    
+    async def _call(self, state: EndpointState, method: str, *args, **kwargs) -> Any:
+        """Call one endpoint and record its health"""
+        start = time.monotonic()
+        try:
+            response = await state.pool.request(method, *args, **kwargs)
+        except Exception as e:
+            self._record_failure(state, e)
+            raise
+        
+        self._record_success(state, time.monotonic() - start)
+        return response
+    
+    async def request(self, method: str, *args, **kwargs) -> Any:
+        """
+        Route an AsyncClient method call
+        
+        Reads are retried on the next-best endpoint on failure; other
+        methods (e.g. send_transaction) go to the best endpoint only.
+        
+        Args:
+            method: AsyncClient method name
+            *args: Method positional arguments
+            **kwargs: Method keyword arguments
+            
+        Returns:
+            Method response
+            
+        Raises:
+            RuntimeError: If the router has no endpoints
+        """
+        candidates = self.ranked()
+        if not candidates:
+            raise RuntimeError(f"No RPC endpoint to route {method} to")
+        if method not in READ_METHODS:
+            return await self._call(candidates[0], method, *args, **kwargs)
+        
+        for state in candidates[:-1]:
+            try:
+                return await self._call(state, method, *args, **kwargs)
+            except Exception as e:
+                logger.debug(f"{method} failed on {state.endpoint}, trying next endpoint: {e}")
+        
+        # The last endpoint's error is the one raised
+        return await self._call(candidates[-1], method, *args, **kwargs)
+    
+    async def close(self):
+        """Close all endpoint connections"""
+        for state in self.endpoints:
+            await state.pool.close()
+    
+    def get_stats(self) -> List[dict]:
+        """
+        Get per-endpoint statistics
+        
+        Returns:
+            List of endpoint stats (connection pool counters plus health)
+        """
+        now = time.monotonic()
+        return [
+            {
+                **state.pool.get_stats(),
+                "latency_ms": state.latency * 1000 if state.latency is not None else None,
+                "error_rate": state.error_rate,
+                "circuit_open": not state.is_available(now),
+                "circuit_trips": state.trips
+            }
+            for state in self.endpoints
+        ]
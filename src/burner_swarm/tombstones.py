@@ -0,0 +1,329 @@
+"""
+Tombstone Log
+
+Compact on-disk log of retired wallets. Retired entries evicted from
+memory are appended as fixed-size records, so lookups can still report
+when a key was retired without keeping every dead wallet in memory.
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from solders.pubkey import Pubkey
+from .pool_manager import BurnerWallet, WalletStatus
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# public key, created_at, retired_at (epoch seconds), usage count
+RECORD = struct.Struct("<32sqqI")
+
+# Records read per block when scanning
+SCAN_BLOCK_RECORDS = 4096
+
+# Leading public key bytes used as the in-memory index key
+INDEX_PREFIX = 8
+
+
+def _prefix(key: bytes) -> int:
+    return int.from_bytes(key[:INDEX_PREFIX], "little")
+
+
+class TombstoneLog:
+    """
+    Append-only log of fixed-size retired wallet records
+    
+    Appends are buffered in memory and written by flush(), which the
+    fabric runs off the event loop every flush_interval seconds. An
+    in-memory index maps a public key prefix to its newest record, so
+    misses never touch the disk and hits read a single record. compact()
+    rewrites the file without records older than the retention period and
+    adds their number to a counter kept in a ".meta" file beside the log,
+    so total() still counts every retired wallet ever logged.
+    
+    The index holds one entry per record on disk (about 100 bytes each),
+    so its memory is bounded by the records within retention; with no
+    retention it grows with every retired wallet.
+    Lookups only reach the log for keys no longer held in memory.
+    """
+    
+    def __init__(
+        self,
+        path: str = "burner_swarm.tombstones",
+        flush_interval: float = 1.0,
+        compact_interval: float = 3600.0,
+        retention: Optional[float] = None
+    ):
+        """
+        Initialize tombstone log
+        
+        Args:
+            path: Log file path
+            flush_interval: Seconds between background flushes of appended records
+            compact_interval: Minimum seconds between compactions by maintain()
+            retention: Seconds a tombstone is kept after retirement (None keeps all)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.compact_interval = compact_interval
+        self.retention = retention
+        
+        # File lock serializes flush/compact/read; buffer lock guards appends
+        self._lock = threading.Lock()
+        self._buffer_lock = threading.Lock()
+        self._buffer: Dict[bytes, bytes] = {}
+        self._file = open(self.path, "a+b")
+        
+        # Drop a partially written trailing record
+        size = os.fstat(self._file.fileno()).st_size
+        if size % RECORD.size:
+            self._file.truncate(size - size % RECORD.size)
+        self._count = size // RECORD.size
+        self._meta_path = self.path.with_suffix(self.path.suffix + ".meta")
+        self.expired = self._load_expired()
+        self._index = self._build_index()
+        self._last_compact = time.monotonic()
+        self.compactions = 0
+        
+        logger.info(f"TombstoneLog initialized: {path} ({self._count} records)")
+    
+    def __len__(self) -> int:
+        return self._count + len(self._buffer)
+    
+    def total(self) -> int:
+        """
+        Count every wallet ever logged, including ones past retention
+        
+        Returns:
+            Records held plus records compacted away for age
+        """
+        return len(self) + self.expired
+    
+    def _load_expired(self) -> int:
+        """Read the expired-record counter from the meta file (0 if missing)"""
+        try:
+            return int(json.loads(self._meta_path.read_text())["expired"])
+        except FileNotFoundError:
+            return 0
+    
+    def _save_expired(self):
+        """Atomically write the expired-record counter to the meta file"""
+        tmp_path = self._meta_path.with_suffix(self._meta_path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"expired": self.expired}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._meta_path)
+    
+    def _build_index(self) -> Dict[int, int]:
+        """Map key prefixes to their newest record number"""
+        index: Dict[int, int] = {}
+        block_size = SCAN_BLOCK_RECORDS * RECORD.size
+        fd = self._file.fileno()
+        for start in range(0, self._count * RECORD.size, block_size):
+            block = os.pread(fd, block_size, start)
+            first = start // RECORD.size
+            for offset in range(0, len(block) - RECORD.size + 1, RECORD.size):
+                index[_prefix(block[offset:offset + INDEX_PREFIX])] = first + offset // RECORD.size
+        return index
+    
+    def append(self, wallets: Iterable[BurnerWallet]) -> int:
+        """
+        Buffer retired wallets for the next flush
+        
+        Args:
+            wallets: Retired wallets to record
+            
+        Returns:
+            Number of records buffered
+        """
+        records = {
+            bytes(wallet.public_key): RECORD.pack(
+                bytes(wallet.public_key),
+                wallet.created_ts,
+                wallet.retired_ts or 0,
+                wallet.usage_count
+            )
+            for wallet in wallets
+        }
+        if records:
+            with self._buffer_lock:
+                self._buffer.update(records)
+        return len(records)
+    
+    def might_contain(self, public_key: Pubkey) -> bool:
+        """
+        Check the in-memory index without touching the disk
+        
+        Args:
+            public_key: Wallet public key
+            
+        Returns:
+            False if the key has no tombstone, True if find() may return one
+        """
+        key = bytes(public_key)
+        return key in self._buffer or _prefix(key) in self._index
+    
+    def find(self, public_key: Pubkey) -> Optional[BurnerWallet]:
+        """
+        Find the most recent tombstone for a public key
+        
+        Args:
+            public_key: Wallet public key
+            
+        Returns:
+            Retired wallet stub (no key material) or None
+        """
+        key = bytes(public_key)
+        with self._buffer_lock:
+            record = self._buffer.get(key)
+        
+        if record is None:
+            number = self._index.get(_prefix(key))
+            if number is None:
+                return None
+            with self._lock:
+                record = os.pread(self._file.fileno(), RECORD.size, number * RECORD.size)
+                if record[:32] != key:
+                    record = self._scan(key)  # Another key shares the prefix
+            if record is None:
+                return None
+        
+        _, created_ts, retired_ts, usage_count = RECORD.unpack(record)
+        return BurnerWallet(
+            public_key=public_key,
+            keypair=None,
+            created_at=created_ts,
+            usage_count=usage_count,
+            status=WalletStatus.RETIRED,
+            retired_at=retired_ts
+        )
+    
+    def _scan(self, key: bytes) -> Optional[bytes]:
+        """Scan the file newest-first for a key (caller holds the file lock)"""
+        block_size = SCAN_BLOCK_RECORDS * RECORD.size
+        fd = self._file.fileno()
+        end = self._count * RECORD.size
+        while end > 0:
+            start = max(0, end - block_size)
+            block = os.pread(fd, end - start, start)
+            
+            # Newest records are at the end of each block
+            offset = len(block) - RECORD.size
+            while offset >= 0:
+                if block[offset:offset + 32] == key:
+                    return block[offset:offset + RECORD.size]
+                offset -= RECORD.size
+            
+            end = start
+        return None
+    
+    def flush(self) -> int:
+        """
+        Write buffered records to the file (blocking; run off the event loop)
+        
+        Returns:
+            Number of records written
+        """
+        with self._lock:
+            with self._buffer_lock:
+                records = dict(self._buffer)
+            if not records:
+                return 0
+            
+            self._file.write(b"".join(records.values()))
+            self._file.flush()
+            for number, key in enumerate(records, self._count):
+                self._index[_prefix(key)] = number
+            self._count += len(records)
+            
+            with self._buffer_lock:
+                for key, record in records.items():
+                    if self._buffer.get(key) is record:
+                        del self._buffer[key]
+        
+        return len(records)
+    
+    def compact(self, now: Optional[float] = None) -> int:
+        """
+        Rewrite the file keeping the newest record per key within retention
+        
+        Blocking; run off the event loop.
+        
+        Args:
+            now: Current epoch seconds (default: time.time())
+            
+        Returns:
+            Number of records dropped
+        """
+        if now is None:
+            now = time.time()
+        cutoff = None if self.retention is None else now - self.retention
+        self.flush()
+        
+        with self._lock:
+            fd = self._file.fileno()
+            newest: Dict[bytes, bytes] = {}
+            block_size = SCAN_BLOCK_RECORDS * RECORD.size
+            for start in range(0, self._count * RECORD.size, block_size):
+                block = os.pread(fd, block_size, start)
+                for offset in range(0, len(block) - RECORD.size + 1, RECORD.size):
+                    record = block[offset:offset + RECORD.size]
+                    newest.pop(record[:32], None)  # Keep file order by recency
+                    newest[record[:32]] = record
+            
+            kept = [
+                record for record in newest.values()
+                if cutoff is None or RECORD.unpack(record)[2] >= cutoff
+            ]
+            dropped = self._count - len(kept)
+            
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(b"".join(kept))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            
+            self._file.close()
+            self._file = open(self.path, "a+b")
+            self._count = len(kept)
+            self._index = {
+                _prefix(record[:INDEX_PREFIX]): number
+                for number, record in enumerate(kept)
+            }
+            # Duplicate records of one key are not counted as expired
+            if len(newest) > len(kept):
+                self.expired += len(newest) - len(kept)
+                self._save_expired()
+        
+        self._last_compact = time.monotonic()
+        self.compactions += 1
+        if dropped:
+            logger.info(f"Compacted tombstone log: dropped {dropped} records, kept {len(kept)}")
+        return dropped
+    
+    def maintain(self) -> int:
+        """
+        Flush buffered records and compact when compact_interval has passed
+        
+        Blocking; the fabric runs it in an executor every flush_interval.
+        
+        Returns:
+            Number of records written
+        """
+        written = self.flush()
+        if time.monotonic() - self._last_compact >= self.compact_interval:
+            self.compact()
+        return written
+    
+    def close(self):
+        """Flush buffered records and close the log file"""
+        self.flush()
+        with self._lock:
+            self._file.close()
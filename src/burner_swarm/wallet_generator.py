@@ -4,12 +4,12 @@ Wallet Generator
 Generates Solana keypairs for burner wallets with secure key management.
 """
 
-from typing import Optional
+from typing import List, Optional, Tuple
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 import secrets
 from ..utils.logger import get_logger
-from ..utils.encryption import encrypt_key, decrypt_key
+from ..utils.encryption import encrypt_key, encrypt_keys, decrypt_key, encrypt_keys_raw, decrypt_key_raw
 
 logger = get_logger(__name__)
 
@@ -36,6 +36,60 @@ class WalletGenerator:
         logger.debug(f"Generated keypair #{self.generated_count}: {keypair.pubkey()}")
         return keypair
     
+    def generate_batch(
+        self,
+        count: int,
+        password: Optional[str] = None
+    ) -> List[Tuple[Keypair, dict]]:
+        """
+        Generate and encrypt multiple keypairs in one pass
+        
+        Args:
+            count: Number of keypairs to generate
+            password: Optional password for encryption
+            
+        Returns:
+            List of (keypair, encrypted data) tuples
+        """
+        keypairs = [Keypair() for _ in range(count)]
+        encrypted_keys = encrypt_keys([bytes(keypair) for keypair in keypairs], password)
+        self.generated_count += count
+        
+        logger.debug(f"Generated batch of {count} keypairs (total: {self.generated_count})")
+        return [
+            (
+                keypair,
+                {
+                    "public_key": str(keypair.pubkey()),
+                    "encrypted_private_key": encrypted,
+                    "created_at": None  # Will be set by pool manager
+                }
+            )
+            for keypair, encrypted in zip(keypairs, encrypted_keys)
+        ]
+    
+    def generate_batch_raw(
+        self,
+        count: int,
+        password: Optional[str] = None
+    ) -> List[Tuple[Keypair, bytes]]:
+        """
+        Generate multiple keypairs with compact binary ciphertexts
+        
+        Args:
+            count: Number of keypairs to generate
+            password: Optional password for encryption
+            
+        Returns:
+            List of (keypair, ciphertext) tuples
+        """
+        keypairs = [Keypair() for _ in range(count)]
+        ciphertexts = encrypt_keys_raw([bytes(keypair) for keypair in keypairs], password)
+        self.generated_count += count
+        
+        logger.debug(f"Generated batch of {count} keypairs (total: {self.generated_count})")
+        return list(zip(keypairs, ciphertexts))
+    
     def generate_from_seed(self, seed: bytes) -> Keypair:
         """
         Generate keypair from seed (for deterministic generation if needed)
@@ -123,4 +177,30 @@ class WalletGenerator:
         private_key_bytes = decrypt_key(encrypted_private_key, password)
         
         return Keypair.from_bytes(private_key_bytes)
+    
+    def encrypt_keypair_raw(self, keypair: Keypair, password: Optional[str] = None) -> bytes:
+        """
+        Encrypt keypair to a compact binary ciphertext
+        
+        Args:
+            keypair: Keypair to encrypt
+            password: Optional password for encryption
+            
+        Returns:
+            Binary ciphertext
+        """
+        return encrypt_keys_raw([self.get_private_key_bytes(keypair)], password)[0]
+    
+    def decrypt_keypair_raw(self, ciphertext: bytes, password: Optional[str] = None) -> Keypair:
+        """
+        Decrypt keypair from a binary ciphertext
+        
+        Args:
+            ciphertext: Ciphertext from encrypt_keypair_raw() or generate_batch_raw()
+            password: Password used for encryption
+            
+        Returns:
+            Decrypted Keypair
+        """
+        return Keypair.from_bytes(decrypt_key_raw(ciphertext, password))
 
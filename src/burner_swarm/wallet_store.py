@@ -0,0 +1,856 @@
+"""
+Wallet Store
+
+Pluggable persistent storage for burner wallets, so the reserve and
+active pools survive restarts.
+"""
+
+import base64
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from solders.pubkey import Pubkey
+from .pool_manager import BurnerWallet, WalletStatus
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def wallet_to_record(wallet: BurnerWallet) -> dict:
+    """
+    Convert wallet to a JSON-serializable record
+    
+    Args:
+        wallet: Wallet to convert
+        
+    Returns:
+        Record dictionary (no plaintext key material)
+    """
+    ciphertext = wallet.ciphertext
+    return {
+        "public_key": str(wallet.public_key),
+        "status": wallet.status.value,
+        "created_at": wallet.created_ts,
+        "last_used": wallet.last_used_ts,
+        "usage_count": wallet.usage_count,
+        "encrypted_private_key": base64.b64encode(ciphertext).decode() if ciphertext is not None else None
+    }
+
+
+def wallet_from_record(record: dict) -> BurnerWallet:
+    """
+    Convert record back to a wallet (keypair not decrypted)
+    
+    Args:
+        record: Record dictionary
+        
+    Returns:
+        BurnerWallet instance
+    """
+    encrypted = record["encrypted_private_key"]
+    if isinstance(encrypted, str):
+        encrypted = base64.b64decode(encrypted)
+    
+    return BurnerWallet(
+        public_key=Pubkey.from_string(record["public_key"]),
+        keypair=None,
+        created_at=record["created_at"],
+        last_used=record["last_used"],
+        usage_count=record["usage_count"],
+        status=WalletStatus(record["status"]),
+        encrypted_private_key=encrypted
+    )
+
+
+class WalletStore(ABC):
+    """
+    Base class for wallet storage backends
+    
+    Implementations may buffer save() writes; callers must flush() (or
+    close()) to make them durable. Status transitions that a crash must
+    not undo (checkout, retirement) go through commit() instead.
+    
+    Attributes:
+        flush_interval: Seconds between periodic flush() calls the backend
+            expects from its owner (None if it flushes on its own)
+        shared: Whether several processes use the store as one pool (see
+            SharedWalletStore)
+    """
+    
+    flush_interval: Optional[float] = None
+    shared: bool = False
+    
+    @abstractmethod
+    def save(self, wallet: BurnerWallet):
+        """
+        Insert or update a wallet record
+        
+        Args:
+            wallet: Wallet to persist
+        """
+    
+    def commit(self, wallet: BurnerWallet, wait: bool = True) -> Optional[int]:
+        """
+        Write a wallet status transition durably
+        
+        A checked-out wallet that reverted to reserve after a crash could be
+        handed to a second caller, so these writes are never buffered.
+        
+        Args:
+            wallet: Wallet whose status changed
+            wait: Block until the write is durable
+            
+        Returns:
+            Ticket to pass to wait_durable() if wait is False and the write
+            is not durable yet, else None
+        """
+        self.save(wallet)
+        self.flush()
+        return None
+    
+    def is_durable(self, ticket: int) -> bool:
+        """
+        Check without blocking whether a commit() is durable
+        
+        Args:
+            ticket: Ticket returned by commit()
+            
+        Returns:
+            True once the write is durable
+        """
+        return True
+    
+    def wait_durable(self, ticket: int):
+        """
+        Block until a commit() is durable
+        
+        Args:
+            ticket: Ticket returned by commit()
+        """
+    
+    @abstractmethod
+    def load(self) -> List[BurnerWallet]:
+        """
+        Load all reserve and active wallets
+        
+        Returns:
+            List of wallets (keypairs not decrypted)
+        """
+    
+    @abstractmethod
+    def flush(self):
+        """Write buffered records to storage"""
+    
+    def close(self):
+        """Flush and release resources"""
+        self.flush()
+
+
+class SQLiteWalletStore(WalletStore):
+    """
+    SQLite wallet store with write-batching
+    
+    Saves (new reserve wallets, usage updates) are buffered and written in
+    one transaction once batch_size records are pending or flush_interval
+    seconds have passed. Commits are written and synced immediately.
+    """
+    
+    _UPSERT = """
+        INSERT INTO wallets (
+            public_key, status, created_at, last_used, usage_count, encrypted_private_key
+        ) VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(public_key) DO UPDATE SET
+            status = excluded.status,
+            last_used = excluded.last_used,
+            usage_count = excluded.usage_count,
+            encrypted_private_key = excluded.encrypted_private_key
+    """
+    
+    def __init__(
+        self,
+        path: str = "burner_swarm.db",
+        batch_size: int = 100,
+        flush_interval: float = 1.0
+    ):
+        """
+        Initialize SQLite wallet store
+        
+        Args:
+            path: Database file path
+            batch_size: Pending records that trigger a flush
+            flush_interval: Maximum seconds between flushes while saving
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple] = {}
+        self._last_flush = time.monotonic()
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # FULL syncs the WAL on every commit, so committed transitions also
+        # survive power loss (NORMAL only survives process crashes)
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS wallets (
+                public_key TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL,
+                usage_count INTEGER NOT NULL DEFAULT 0,
+                encrypted_private_key BLOB
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_wallets_status ON wallets (status)")
+        self._conn.commit()
+        
+        logger.info(f"SQLiteWalletStore initialized: {path}")
+    
+    @staticmethod
+    def _to_row(wallet: BurnerWallet) -> Tuple:
+        """Convert wallet to table row"""
+        return (
+            str(wallet.public_key),
+            wallet.status.value,
+            wallet.created_ts,
+            wallet.last_used_ts,
+            wallet.usage_count,
+            wallet.ciphertext
+        )
+    
+    @staticmethod
+    def _from_row(row: Tuple) -> BurnerWallet:
+        """Convert table row to wallet"""
+        public_key, status, created_at, last_used, usage_count, encrypted = row
+        if isinstance(encrypted, str):
+            encrypted = json.loads(encrypted)  # Rows written before binary ciphertexts
+        
+        return BurnerWallet(
+            public_key=Pubkey.from_string(public_key),
+            keypair=None,
+            created_at=created_at,
+            last_used=last_used,
+            usage_count=usage_count,
+            status=WalletStatus(status),
+            encrypted_private_key=encrypted
+        )
+    
+    def save(self, wallet: BurnerWallet):
+        """
+        Buffer a wallet record for writing
+        
+        Args:
+            wallet: Wallet to persist
+        """
+        row = self._to_row(wallet)
+        with self._lock:
+            self._pending[row[0]] = row
+            due = (
+                len(self._pending) >= self.batch_size
+                or self.flush_interval is None
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        
+        if due:
+            self.flush()
+    
+    def commit(self, wallet: BurnerWallet, wait: bool = True) -> Optional[int]:
+        """
+        Write a wallet status transition immediately
+        
+        Any buffered record of the same wallet is superseded, so a later
+        flush cannot overwrite the transition with an older status.
+        
+        Args:
+            wallet: Wallet whose status changed
+            wait: Unused (the write is always durable on return)
+            
+        Returns:
+            None
+        """
+        row = self._to_row(wallet)
+        with self._lock:
+            self._pending.pop(row[0], None)
+            with self._conn:
+                self._conn.execute(self._UPSERT, row)
+        return None
+    
+    def flush(self):
+        """Write all buffered records in a single transaction"""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending:
+                return
+            
+            rows = list(self._pending.values())
+            self._pending.clear()
+            
+            with self._conn:
+                self._conn.executemany(self._UPSERT, rows)
+        
+        logger.debug(f"Flushed {len(rows)} wallet records")
+    
+    def load(self) -> List[BurnerWallet]:
+        """
+        Load all reserve and active wallets
+        
+        Returns:
+            List of wallets (keypairs not decrypted)
+        """
+        self.flush()
+        
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT public_key, status, created_at, last_used, usage_count, encrypted_private_key
+                FROM wallets
+                WHERE status != ?
+                ORDER BY created_at
+                """,
+                (WalletStatus.RETIRED.value,)
+            ).fetchall()
+        
+        return [self._from_row(row) for row in rows]
+    
+    def close(self):
+        """Flush pending records and close the database"""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+def default_lease_owner() -> str:
+    """Lease owner id unique to this process (host:pid:random)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class SharedWalletStore(WalletStore):
+    """
+    Base class for stores that several instances serve one pool from
+    
+    The store is the pool. Checkout atomically moves a reserve wallet to
+    active under a time-bounded lease held by this store's owner id;
+    owners renew leases on their active wallets with heartbeats, and any
+    instance may reclaim expired leases, which retires their wallets (a
+    handed-out wallet is never checked out again).
+    
+    Attributes:
+        owner: Lease owner id of this instance
+        lease_ttl: Seconds a lease lasts unless renewed
+    """
+    
+    shared = True
+    
+    def __init__(self, owner: Optional[str] = None, lease_ttl: float = 30.0):
+        """
+        Initialize lease settings
+        
+        Args:
+            owner: Lease owner id (default: host:pid:random)
+            lease_ttl: Seconds a lease lasts unless renewed
+        """
+        self.owner = owner or default_lease_owner()
+        self.lease_ttl = lease_ttl
+    
+    @abstractmethod
+    def checkout(self) -> Optional[BurnerWallet]:
+        """
+        Atomically lease the oldest reserve wallet to this owner
+        
+        Returns:
+            Checked-out wallet (status ACTIVE, keypair not decrypted), or
+            None if the shared reserve is empty
+        """
+    
+    @abstractmethod
+    def get(self, public_key: Pubkey) -> Optional[BurnerWallet]:
+        """
+        Look up a wallet by public key (any status)
+        
+        Args:
+            public_key: Wallet public key
+            
+        Returns:
+            Wallet (keypair not decrypted), or None if unknown
+        """
+    
+    @abstractmethod
+    def record_use(self, public_key: Pubkey, used_at: int) -> Tuple[int, int]:
+        """
+        Atomically increment a wallet's usage count
+        
+        Args:
+            public_key: Wallet public key
+            used_at: Use time (epoch seconds)
+            
+        Returns:
+            (usage_count, last_used) after the increment
+        """
+    
+    @abstractmethod
+    def retire_expired(self, cutoff: float, limit: Optional[int] = None) -> List[BurnerWallet]:
+        """
+        Retire reserve/active wallets created before a cutoff
+        
+        Args:
+            cutoff: Epoch seconds; older wallets are retired
+            limit: Maximum wallets to retire (None for all)
+            
+        Returns:
+            List of retired wallets
+        """
+    
+    @abstractmethod
+    def count_by_status(self) -> Dict[WalletStatus, int]:
+        """
+        Count wallets in each pool
+        
+        Returns:
+            Status mapped to number of wallets
+        """
+    
+    @abstractmethod
+    def claim_reserve(self, target: int, limit: int) -> int:
+        """
+        Claim the right to add reserve wallets towards a target size
+        
+        Claims of other owners count as already added, so instances
+        refilling at the same time never overshoot the target together.
+        A new claim replaces this owner's previous one.
+        
+        Args:
+            target: Reserve size to fill up to
+            limit: Maximum wallets to claim
+            
+        Returns:
+            Number of wallets this owner may add (0 if none)
+        """
+    
+    @abstractmethod
+    def release_reserve_claim(self):
+        """Drop this owner's reserve claim once its wallets are saved"""
+    
+    @abstractmethod
+    def renew_leases(self, public_keys: List[Pubkey]) -> Set[str]:
+        """
+        Extend this owner's leases (heartbeat)
+        
+        Args:
+            public_keys: Active wallets held by this owner
+            
+        Returns:
+            Base58 keys still leased to this owner (others were reclaimed)
+        """
+    
+    @abstractmethod
+    def reclaim_expired_leases(self) -> int:
+        """
+        Retire active wallets whose lease expired
+        
+        Returns:
+            Number of wallets retired
+        """
+
+
+class SharedSQLiteWalletStore(SharedWalletStore, SQLiteWalletStore):
+    """
+    SQLite shared wallet store for processes on one host
+    
+    Serves uvicorn workers (or local multi-instance tests) from one database
+    file: writes go through immediately and checkouts, leases and usage
+    counts are updated atomically under SQLite's write lock.
+    """
+    
+    _COLUMNS = "public_key, status, created_at, last_used, usage_count, encrypted_private_key"
+    
+    def __init__(
+        self,
+        path: str = "burner_swarm.db",
+        busy_timeout: float = 5.0,
+        owner: Optional[str] = None,
+        lease_ttl: float = 30.0
+    ):
+        """
+        Initialize shared SQLite wallet store
+        
+        Args:
+            path: Database file path (must be a file, not ":memory:")
+            busy_timeout: Seconds to wait for another process's write lock
+            owner: Lease owner id (default: host:pid:random)
+            lease_ttl: Seconds a lease lasts unless renewed
+        """
+        if path == ":memory:":
+            raise ValueError("Shared wallet store needs a database file")
+        
+        SharedWalletStore.__init__(self, owner=owner, lease_ttl=lease_ttl)
+        SQLiteWalletStore.__init__(self, path, batch_size=1, flush_interval=0.0)
+        self.flush_interval = None  # Writes are never buffered
+        self._conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout * 1000)}")
+        
+        self._migrate()
+        self._init_counts()
+    
+    def _migrate(self):
+        """Add lease columns, indexes and the claims table (once, across processes)"""
+        with self._lock:
+            # Processes starting together must not both see the columns missing
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                columns = {row[1] for row in self._conn.execute("PRAGMA table_info(wallets)")}
+                if "lease_owner" not in columns:
+                    self._conn.execute("ALTER TABLE wallets ADD COLUMN lease_owner TEXT")
+                    self._conn.execute("ALTER TABLE wallets ADD COLUMN lease_expires REAL")
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_wallets_status_created ON wallets (status, created_at)"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_wallets_status_lease ON wallets (status, lease_expires)"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS reserve_claims (owner TEXT PRIMARY KEY, count INTEGER, expires REAL)"
+                )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+    
+    def _init_counts(self):
+        """Create per-status counters kept current by triggers (seeded once from the table)"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                exists = self._conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'wallet_counts'"
+                ).fetchone()
+                if not exists:
+                    self._conn.execute("CREATE TABLE wallet_counts (status TEXT PRIMARY KEY, count INTEGER NOT NULL)")
+                    self._conn.executemany(
+                        "INSERT INTO wallet_counts (status, count) VALUES (?, 0)",
+                        [(status.value,) for status in WalletStatus]
+                    )
+                    self._conn.execute(
+                        """
+                        UPDATE wallet_counts SET count = (
+                            SELECT COUNT(*) FROM wallets WHERE wallets.status = wallet_counts.status
+                        )
+                        """
+                    )
+                    self._conn.execute(
+                        """
+                        CREATE TRIGGER wallets_count_insert AFTER INSERT ON wallets BEGIN
+                            UPDATE wallet_counts SET count = count + 1 WHERE status = NEW.status;
+                        END
+                        """
+                    )
+                    self._conn.execute(
+                        """
+                        CREATE TRIGGER wallets_count_update AFTER UPDATE OF status ON wallets
+                        WHEN OLD.status != NEW.status BEGIN
+                            UPDATE wallet_counts SET count = count - 1 WHERE status = OLD.status;
+                            UPDATE wallet_counts SET count = count + 1 WHERE status = NEW.status;
+                        END
+                        """
+                    )
+                    self._conn.execute(
+                        """
+                        CREATE TRIGGER wallets_count_delete AFTER DELETE ON wallets BEGIN
+                            UPDATE wallet_counts SET count = count - 1 WHERE status = OLD.status;
+                        END
+                        """
+                    )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+    
+    def save(self, wallet: BurnerWallet):
+        """
+        Write a wallet record immediately
+        
+        Args:
+            wallet: Wallet to persist
+        """
+        row = self._to_row(wallet)
+        with self._lock:
+            self._pending[row[0]] = row
+        self.flush()
+    
+    def checkout(self) -> Optional[BurnerWallet]:
+        """
+        Atomically lease the oldest reserve wallet to this owner
+        
+        Returns:
+            Checked-out wallet (status ACTIVE, keypair not decrypted), or
+            None if the shared reserve is empty
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    f"""
+                    UPDATE wallets SET status = ?, lease_owner = ?, lease_expires = ?
+                    WHERE public_key = (
+                        SELECT public_key FROM wallets
+                        WHERE status = ?
+                        ORDER BY created_at
+                        LIMIT 1
+                    )
+                    RETURNING {self._COLUMNS}
+                    """,
+                    (
+                        WalletStatus.ACTIVE.value,
+                        self.owner,
+                        time.time() + self.lease_ttl,
+                        WalletStatus.RESERVE.value
+                    )
+                ).fetchone()
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        
+        return self._from_row(row) if row is not None else None
+    
+    def get(self, public_key: Pubkey) -> Optional[BurnerWallet]:
+        """
+        Look up a wallet by public key (any status)
+        
+        Args:
+            public_key: Wallet public key
+            
+        Returns:
+            Wallet (keypair not decrypted), or None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM wallets WHERE public_key = ?",
+                (str(public_key),)
+            ).fetchone()
+        
+        return self._from_row(row) if row is not None else None
+    
+    def record_use(self, public_key: Pubkey, used_at: int) -> Tuple[int, int]:
+        """
+        Atomically increment a wallet's usage count
+        
+        Args:
+            public_key: Wallet public key
+            used_at: Use time (epoch seconds)
+            
+        Returns:
+            (usage_count, last_used) after the increment
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                """
+                UPDATE wallets SET usage_count = usage_count + 1, last_used = ?
+                WHERE public_key = ?
+                RETURNING usage_count, last_used
+                """,
+                (used_at, str(public_key))
+            ).fetchone()
+        
+        if row is None:
+            raise KeyError(str(public_key))
+        usage_count, last_used = row
+        return int(usage_count), int(last_used)
+    
+    def retire_expired(self, cutoff: float, limit: Optional[int] = None) -> List[BurnerWallet]:
+        """
+        Retire reserve/active wallets created before a cutoff
+        
+        Args:
+            cutoff: Epoch seconds; older wallets are retired
+            limit: Maximum wallets to retire (None for all)
+            
+        Returns:
+            List of retired wallets
+        """
+        retired_at = int(time.time())
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                f"""
+                UPDATE wallets SET status = ?, encrypted_private_key = NULL
+                WHERE public_key IN (
+                    SELECT public_key FROM wallets
+                    WHERE status != ? AND created_at < ?
+                    ORDER BY created_at
+                    LIMIT ?
+                )
+                RETURNING {self._COLUMNS}
+                """,
+                (WalletStatus.RETIRED.value, WalletStatus.RETIRED.value, cutoff, -1 if limit is None else limit)
+            ).fetchall()
+        
+        wallets = [self._from_row(row) for row in rows]
+        for wallet in wallets:
+            wallet.retired_ts = retired_at
+        return wallets
+    
+    def count_by_status(self) -> Dict[WalletStatus, int]:
+        """
+        Count wallets in each pool (trigger-maintained counters, no table scan)
+        
+        Returns:
+            Status mapped to number of wallets
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT status, count FROM wallet_counts").fetchall()
+        
+        counts = {status: 0 for status in WalletStatus}
+        for status, count in rows:
+            counts[WalletStatus(status)] = count
+        return counts
+    
+    def claim_reserve(self, target: int, limit: int) -> int:
+        """
+        Claim the right to add reserve wallets towards a target size
+        
+        Runs under SQLite's write lock, so concurrent claims see each other.
+        Claims expire after lease_ttl in case their owner dies mid-refill.
+        
+        Args:
+            target: Reserve size to fill up to
+            limit: Maximum wallets to claim
+            
+        Returns:
+            Number of wallets this owner may add (0 if none)
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM reserve_claims WHERE expires < ? OR owner = ?",
+                    (now, self.owner)
+                )
+                reserve: int = self._conn.execute(
+                    "SELECT count FROM wallet_counts WHERE status = ?",
+                    (WalletStatus.RESERVE.value,)
+                ).fetchone()[0]
+                claimed: int = self._conn.execute("SELECT COALESCE(SUM(count), 0) FROM reserve_claims").fetchone()[0]
+                count = max(0, min(limit, target - reserve - claimed))
+                if count:
+                    self._conn.execute(
+                        "INSERT INTO reserve_claims (owner, count, expires) VALUES (?, ?, ?)",
+                        (self.owner, count, now + self.lease_ttl)
+                    )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        
+        return count
+    
+    def release_reserve_claim(self):
+        """Drop this owner's reserve claim once its wallets are saved"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM reserve_claims WHERE owner = ?", (self.owner,))
+    
+    def renew_leases(self, public_keys: List[Pubkey]) -> Set[str]:
+        """
+        Extend this owner's leases (heartbeat)
+        
+        Args:
+            public_keys: Active wallets held by this owner
+            
+        Returns:
+            Base58 keys still leased to this owner (others were reclaimed)
+        """
+        keys = [str(public_key) for public_key in public_keys]
+        expires = time.time() + self.lease_ttl
+        renewed: Set[str] = set()
+        
+        with self._lock, self._conn:
+            for start in range(0, len(keys), 500):  # Stay under SQLite's variable limit
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"""
+                    UPDATE wallets SET lease_expires = ?
+                    WHERE status = ? AND lease_owner = ?
+                        AND public_key IN ({", ".join("?" * len(chunk))})
+                    RETURNING public_key
+                    """,
+                    (expires, WalletStatus.ACTIVE.value, self.owner, *chunk)
+                ).fetchall()
+                renewed.update(row[0] for row in rows)
+        
+        return renewed
+    
+    def reclaim_expired_leases(self) -> int:
+        """
+        Retire active wallets whose lease expired
+        
+        Every expired lease is retired, used or not: its owner may have
+        returned the wallet to a caller who funds or signs with it later.
+        
+        Returns:
+            Number of wallets retired
+        """
+        with self._lock, self._conn:
+            retired = self._conn.execute(
+                """
+                UPDATE wallets SET status = ?, encrypted_private_key = NULL,
+                    lease_owner = NULL, lease_expires = NULL
+                WHERE status = ? AND lease_expires < ?
+                """,
+                (WalletStatus.RETIRED.value, WalletStatus.ACTIVE.value, time.time())
+            ).rowcount
+        
+        if retired:
+            logger.info(f"Retired {retired} wallets with expired leases")
+        return retired
+
+
+def create_wallet_store(
+    backend: str = "sqlite",
+    path: str = "burner_swarm.db",
+    batch_size: int = 100,
+    flush_interval: float = 1.0,
+    compact_threshold: int = 10000,
+    shared: bool = False,
+    lease_ttl: float = 30.0
+) -> Optional[WalletStore]:
+    """
+    Create wallet store for a configured backend
+    
+    Args:
+        backend: "sqlite", "journal" or "memory" (no persistence)
+        path: Database file path (sqlite) or directory (journal)
+        batch_size: Pending records that trigger a flush (sqlite)
+        flush_interval: Maximum seconds between flushes while saving (sqlite)
+        compact_threshold: Journal entries that trigger a snapshot (journal)
+        shared: Share one pool between processes (sqlite only)
+        lease_ttl: Seconds a checkout lease lasts unless renewed (shared)
+        
+    Returns:
+        Wallet store, or None for in-memory only
+    """
+    if shared and backend != "sqlite":
+        raise ValueError(f"Shared pool requires the sqlite backend, not {backend}")
+    
+    if backend == "memory":
+        return None
+    if backend == "sqlite" and shared:
+        return SharedSQLiteWalletStore(path, lease_ttl=lease_ttl)
+    if backend == "sqlite":
+        return SQLiteWalletStore(path, batch_size=batch_size, flush_interval=flush_interval)
+    if backend == "journal":
+        from .journal import JournalWalletStore
+        return JournalWalletStore(path, compact_threshold=compact_threshold)
+    
+    raise ValueError(f"Unknown wallet store backend: {backend}")
@@ -3,6 +3,7 @@ Configuration settings
 """
 
 import os
+from typing import Optional
 
 
 class Settings:
@@ -11,13 +12,86 @@ class Settings:
     # Solana RPC
     SOLANA_RPC_URL: str = os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
     
+    # Multiple RPC endpoints, comma-separated (overrides SOLANA_RPC_URL)
+    SOLANA_RPC_URLS: list = [url.strip() for url in os.getenv("SOLANA_RPC_URLS", "").split(",") if url.strip()]
+    RPC_FAILURE_THRESHOLD: int = int(os.getenv("RPC_FAILURE_THRESHOLD", "5"))
+    RPC_BREAKER_COOLDOWN: float = float(os.getenv("RPC_BREAKER_COOLDOWN", "30.0"))
+    
+    # RPC connection pool
+    RPC_MAX_CONNECTIONS: int = int(os.getenv("RPC_MAX_CONNECTIONS", "20"))
+    RPC_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("RPC_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    RPC_KEEPALIVE_EXPIRY: float = float(os.getenv("RPC_KEEPALIVE_EXPIRY", "30.0"))
+    RPC_TIMEOUT: float = float(os.getenv("RPC_TIMEOUT", "10.0"))
+    
     # Pool settings
     MIN_RESERVE_SIZE: int = int(os.getenv("MIN_RESERVE_SIZE", "5"))
     MAX_ACTIVE_SIZE: int = int(os.getenv("MAX_ACTIVE_SIZE", "10"))
     
+    # Reserve replenishment (refill below low watermark, up to high watermark;
+    # unset, the low watermark is MIN_RESERVE_SIZE and the high one the low one)
+    RESERVE_LOW_WATERMARK: Optional[int] = (
+        int(os.environ["RESERVE_LOW_WATERMARK"]) if os.getenv("RESERVE_LOW_WATERMARK") else None
+    )
+    RESERVE_HIGH_WATERMARK: Optional[int] = (
+        int(os.environ["RESERVE_HIGH_WATERMARK"]) if os.getenv("RESERVE_HIGH_WATERMARK") else None
+    )
+    REPLENISH_BATCH_SIZE: int = int(os.getenv("REPLENISH_BATCH_SIZE", "10"))
+    REPLENISH_INTERVAL: float = float(os.getenv("REPLENISH_INTERVAL", "1.0"))
+    # Adaptive reserve target (between RESERVE_LOW_WATERMARK and RESERVE_TARGET_MAX)
+    ADAPTIVE_RESERVE: bool = os.getenv("ADAPTIVE_RESERVE", "false").lower() == "true"
+    RESERVE_TARGET_MAX: int = int(os.getenv("RESERVE_TARGET_MAX", "100"))
+    RESERVE_RATE_WINDOW: float = float(os.getenv("RESERVE_RATE_WINDOW", "10.0"))
+    RESERVE_RATE_ALPHA: float = float(os.getenv("RESERVE_RATE_ALPHA", "0.3"))
+    RESERVE_LEAD_TIME: float = float(os.getenv("RESERVE_LEAD_TIME", "30.0"))
+    
+    # Seconds a checkout waits for the replenisher when the reserve is empty
+    CHECKOUT_TIMEOUT: float = float(os.getenv("CHECKOUT_TIMEOUT", "10.0"))
+    
+    # Multi-process wallet generation (0 workers disables)
+    GENERATION_WORKERS: int = int(os.getenv("GENERATION_WORKERS", "0"))
+    GENERATION_PARALLEL_THRESHOLD: int = int(os.getenv("GENERATION_PARALLEL_THRESHOLD", "100"))
+    
+    # Wallet store ("sqlite", "journal" or "memory")
+    WALLET_STORE_BACKEND: str = os.getenv("WALLET_STORE_BACKEND", "sqlite")
+    WALLET_STORE_PATH: str = os.getenv("WALLET_STORE_PATH", "burner_swarm.db")
+    WALLET_STORE_BATCH_SIZE: int = int(os.getenv("WALLET_STORE_BATCH_SIZE", "100"))
+    WALLET_STORE_FLUSH_INTERVAL: float = float(os.getenv("WALLET_STORE_FLUSH_INTERVAL", "1.0"))
+    JOURNAL_COMPACT_THRESHOLD: int = int(os.getenv("JOURNAL_COMPACT_THRESHOLD", "10000"))
+    # Serve one pool from the sqlite store to all API worker processes
+    SHARED_POOL: bool = os.getenv("SHARED_POOL", "false").lower() == "true"
+    LEASE_TTL: float = float(os.getenv("LEASE_TTL", "30.0"))
+    LEASE_HEARTBEAT_INTERVAL: float = float(os.getenv("LEASE_HEARTBEAT_INTERVAL", "10.0"))
+    
+    # Retired wallets (empty tombstone path drops evicted entries)
+    RETIRED_CACHE_SIZE: int = int(os.getenv("RETIRED_CACHE_SIZE", "1000"))
+    RETIRED_TTL: float = float(os.getenv("RETIRED_TTL", "3600.0"))
+    RETIRED_TOMBSTONE_PATH: str = os.getenv("RETIRED_TOMBSTONE_PATH", "burner_swarm.tombstones")
+    RETIRED_TOMBSTONE_FLUSH_INTERVAL: float = float(os.getenv("RETIRED_TOMBSTONE_FLUSH_INTERVAL", "1.0"))
+    RETIRED_TOMBSTONE_COMPACT_INTERVAL: float = float(os.getenv("RETIRED_TOMBSTONE_COMPACT_INTERVAL", "3600.0"))
+    # Seconds tombstones are kept after retirement (0 keeps them forever)
+    RETIRED_TOMBSTONE_RETENTION: float = float(os.getenv("RETIRED_TOMBSTONE_RETENTION", "604800.0"))
+    
+    # Expiry sweeper
+    EXPIRY_SWEEP_BATCH_SIZE: int = int(os.getenv("EXPIRY_SWEEP_BATCH_SIZE", "100"))
+    EXPIRY_SWEEP_MAX_INTERVAL: float = float(os.getenv("EXPIRY_SWEEP_MAX_INTERVAL", "60.0"))
+    
+    # Funding settings
+    # Commitment fundings wait for (processed, confirmed, finalized; empty returns once sent)
+    FUNDING_COMMITMENT: str = os.getenv("FUNDING_COMMITMENT", "")
+    CONFIRMATION_POLL_INTERVAL: float = float(os.getenv("CONFIRMATION_POLL_INTERVAL", "0.5"))
+    CONFIRMATION_TIMEOUT: float = float(os.getenv("CONFIRMATION_TIMEOUT", "60.0"))
+    
+    # Blockhash cache
+    BLOCKHASH_TTL: float = float(os.getenv("BLOCKHASH_TTL", "20.0"))
+    BLOCKHASH_REFRESH_INTERVAL: float = float(os.getenv("BLOCKHASH_REFRESH_INTERVAL", "5.0"))
+    BLOCKHASH_BACKGROUND_REFRESH: bool = os.getenv("BLOCKHASH_BACKGROUND_REFRESH", "true").lower() == "true"
+    
     # Rotation settings
     MAX_USES: int = int(os.getenv("MAX_USES", "1"))
     MAX_AGE_HOURS: int = int(os.getenv("MAX_AGE_HOURS", "24"))
+    # Optional rules (0 disables)
+    MAX_IDLE_HOURS: float = float(os.getenv("MAX_IDLE_HOURS", "0"))
+    MIN_BALANCE_SOL: float = float(os.getenv("MIN_BALANCE_SOL", "0"))
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -3,35 +3,53 @@ Encryption utilities for secure key storage
 """
 
 import base64
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 
+DEFAULT_PASSWORD = "evalys-default-key"  # In production, use secure default
+DEFAULT_SALT = b'evalys_salt_12345678'  # In production, generate random salt
+DEFAULT_ITERATIONS = 100000
 
-def derive_key(password: Optional[str] = None, salt: Optional[bytes] = None) -> bytes:
+# Maximum number of derived keys kept in memory
+KEY_CACHE_SIZE = 32
+
+# Cache of ready Fernet instances keyed by (password, salt, iterations)
+_fernet_cache: "OrderedDict[Tuple[str, bytes, int], Fernet]" = OrderedDict()
+_fernet_cache_lock = threading.Lock()
+
+
+def derive_key(
+    password: Optional[str] = None,
+    salt: Optional[bytes] = None,
+    iterations: int = DEFAULT_ITERATIONS
+) -> bytes:
     """
     Derive encryption key from password
     
     Args:
         password: Optional password (uses default if None)
         salt: Optional salt (generates new if None)
+        iterations: PBKDF2 iteration count
         
     Returns:
         Encryption key
     """
     if password is None:
-        password = "evalys-default-key"  # In production, use secure default
+        password = DEFAULT_PASSWORD
     
     if salt is None:
-        salt = b'evalys_salt_12345678'  # In production, generate random salt
+        salt = DEFAULT_SALT
     
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
         salt=salt,
-        iterations=100000,
+        iterations=iterations,
         backend=default_backend()
     )
     
@@ -39,6 +57,55 @@ def derive_key(password: Optional[str] = None, salt: Optional[bytes] = None) ->
     return key
 
 
+def get_fernet(
+    password: Optional[str] = None,
+    salt: Optional[bytes] = None,
+    iterations: int = DEFAULT_ITERATIONS
+) -> Fernet:
+    """
+    Get a Fernet instance for the given key parameters
+    
+    Derived keys are cached (LRU, bounded by KEY_CACHE_SIZE) so PBKDF2 runs
+    once per (password, salt, iterations) rather than once per call.
+    
+    Args:
+        password: Optional password (uses default if None)
+        salt: Optional salt (uses default if None)
+        iterations: PBKDF2 iteration count
+        
+    Returns:
+        Fernet instance
+    """
+    cache_key = (
+        DEFAULT_PASSWORD if password is None else password,
+        DEFAULT_SALT if salt is None else salt,
+        iterations
+    )
+    
+    with _fernet_cache_lock:
+        fernet = _fernet_cache.get(cache_key)
+        if fernet is not None:
+            _fernet_cache.move_to_end(cache_key)
+            return fernet
+    
+    # Derive outside the lock so other keys are not blocked by PBKDF2
+    fernet = Fernet(derive_key(*cache_key))
+    
+    with _fernet_cache_lock:
+        _fernet_cache[cache_key] = fernet
+        _fernet_cache.move_to_end(cache_key)
+        while len(_fernet_cache) > KEY_CACHE_SIZE:
+            _fernet_cache.popitem(last=False)
+    
+    return fernet
+
+
+def clear_key_cache():
+    """Clear all cached derived keys from memory"""
+    with _fernet_cache_lock:
+        _fernet_cache.clear()
+
+
 def encrypt_key(data: bytes, password: Optional[str] = None) -> dict:
     """
     Encrypt data
@@ -50,8 +117,7 @@ def encrypt_key(data: bytes, password: Optional[str] = None) -> dict:
     Returns:
         Dictionary with encrypted data and metadata
     """
-    key = derive_key(password)
-    fernet = Fernet(key)
+    fernet = get_fernet(password)
     encrypted = fernet.encrypt(data)
     
     return {
@@ -61,6 +127,30 @@ def encrypt_key(data: bytes, password: Optional[str] = None) -> dict:
     }
 
 
+def encrypt_keys(data_list: List[bytes], password: Optional[str] = None) -> List[dict]:
+    """
+    Encrypt multiple items with a single key lookup
+    
+    Args:
+        data_list: Data items to encrypt
+        password: Optional password
+        
+    Returns:
+        List of dictionaries with encrypted data and metadata
+    """
+    fernet = get_fernet(password)
+    has_password = password is not None
+    
+    return [
+        {
+            "encrypted_data": base64.b64encode(fernet.encrypt(data)).decode(),
+            "algorithm": "fernet",
+            "has_password": has_password
+        }
+        for data in data_list
+    ]
+
+
 def decrypt_key(encrypted_data: dict, password: Optional[str] = None) -> bytes:
     """
     Decrypt data
@@ -73,9 +163,71 @@ def decrypt_key(encrypted_data: dict, password: Optional[str] = None) -> bytes:
         Decrypted bytes
     """
     encrypted_bytes = base64.b64decode(encrypted_data["encrypted_data"])
-    key = derive_key(password)
-    fernet = Fernet(key)
+    fernet = get_fernet(password)
     
     decrypted = fernet.decrypt(encrypted_bytes)
     return decrypted
 
+
+def encrypt_keys_raw(data_list: List[bytes], password: Optional[str] = None) -> List[bytes]:
+    """
+    Encrypt multiple items to compact binary ciphertexts
+    
+    The Fernet token is stored as raw bytes rather than base64 text, which
+    is about a quarter smaller and skips the extra base64 wrapping used by
+    encrypt_key().
+    
+    Args:
+        data_list: Data items to encrypt
+        password: Optional password
+        
+    Returns:
+        List of binary ciphertexts
+    """
+    fernet = get_fernet(password)
+    return [base64.urlsafe_b64decode(fernet.encrypt(data)) for data in data_list]
+
+
+def decrypt_key_raw(ciphertext: bytes, password: Optional[str] = None) -> bytes:
+    """
+    Decrypt a binary ciphertext
+    
+    Args:
+        ciphertext: Ciphertext from encrypt_keys_raw()
+        password: Password used for encryption
+        
+    Returns:
+        Decrypted bytes
+    """
+    return get_fernet(password).decrypt(base64.urlsafe_b64encode(ciphertext))
+
+
+def pack_ciphertext(encrypted_data: dict) -> bytes:
+    """
+    Convert an encrypt_key() dictionary to a binary ciphertext
+    
+    Args:
+        encrypted_data: Encrypted data dictionary
+        
+    Returns:
+        Binary ciphertext
+    """
+    return base64.urlsafe_b64decode(base64.b64decode(encrypted_data["encrypted_data"]))
+
+
+def unpack_ciphertext(ciphertext: bytes, has_password: bool = False) -> dict:
+    """
+    Convert a binary ciphertext to the encrypt_key() dictionary format
+    
+    Args:
+        ciphertext: Binary ciphertext
+        has_password: Whether a non-default password was used
+        
+    Returns:
+        Dictionary with encrypted data and metadata
+    """
+    return {
+        "encrypted_data": base64.b64encode(base64.urlsafe_b64encode(ciphertext)).decode(),
+        "algorithm": "fernet",
+        "has_password": has_password
+    }
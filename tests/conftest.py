@@ -0,0 +1,9 @@
+"""
+Shared test configuration
+"""
+
+import os
+
+# Keep the API module's global fabric in memory during tests
+os.environ.setdefault("WALLET_STORE_BACKEND", "memory")
+os.environ.setdefault("RETIRED_TOMBSTONE_PATH", "")
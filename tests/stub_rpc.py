@@ -0,0 +1,89 @@
+"""
+Local stub Solana JSON-RPC server for tests
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answers JSON-RPC requests from the server's configured results"""
+    
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server.requests.append(body["method"])
+        
+        if server.delay:
+            time.sleep(server.delay)
+        
+        if server.fail:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        
+        result = server.results[body["method"]]
+        data = json.dumps({"jsonrpc": "2.0", "id": body["id"], "result": result}).encode()
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class StubRpcServer:
+    """
+    Stub RPC server running in a background thread
+    
+    Attributes:
+        delay: Seconds to wait before answering
+        fail: Answer every request with HTTP 500
+        requests: Methods received, in order
+    """
+    
+    def __init__(self, balance: int = 0, delay: float = 0.0):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.delay = delay
+        self._server.fail = False
+        self._server.requests = []
+        self._server.results = {
+            "getBalance": {"context": {"slot": 1}, "value": balance},
+        }
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True
+        )
+    
+    @property
+    def url(self) -> str:
+        """Endpoint URL"""
+        return f"http://127.0.0.1:{self._server.server_port}"
+    
+    @property
+    def requests(self) -> list:
+        """Methods received"""
+        return self._server.requests
+    
+    @property
+    def fail(self) -> bool:
+        return self._server.fail
+    
+    @fail.setter
+    def fail(self, value: bool):
+        self._server.fail = value
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,270 @@
+"""
+Tests for burner swarm fabric
+"""
+
+import asyncio
+import time
+import pytest
+from fastapi import HTTPException
+from src.api import routes
+from src.burner_swarm.burner_swarm_fabric import BurnerSwarmFabric, SwarmFundingError
+from src.burner_swarm.checkout_queue import PoolExhaustedError
+from src.burner_swarm.funding_manager import BatchFundingError
+from src.burner_swarm.pool_manager import WalletStatus
+from solders.keypair import Keypair
+
+
+@pytest.fixture
+async def fabric():
+    """Fabric with an empty reserve pool"""
+    fabric = BurnerSwarmFabric(min_reserve_size=0)
+    yield fabric
+    await fabric.close()
+
+
+async def test_get_burner_refills_reserve_in_background(fabric):
+    """Test get_burner returns immediately and reserve refills afterwards"""
+    fabric.replenisher.low_watermark = 3
+    fabric.replenisher.high_watermark = 3
+    
+    wallet = await fabric.get_burner()
+    assert wallet.status == WalletStatus.ACTIVE
+    
+    await fabric._refill_task
+    assert len(fabric.pool_manager.reserve_pool) == 3
+
+
+async def test_pool_stats_fast_during_refill(fabric, monkeypatch):
+    """Test /pool-stats stays responsive while reserve refills"""
+    generator = fabric.pool_manager.generator
+    generate_batch = generator.generate_batch_raw
+    
+    def slow_generate_batch(count, password=None):
+        time.sleep(0.01 * count)  # Simulate expensive generation
+        return generate_batch(count, password)
+    
+    monkeypatch.setattr(generator, "generate_batch_raw", slow_generate_batch)
+    monkeypatch.setattr(routes, "fabric", fabric)
+    fabric.replenisher.low_watermark = 50
+    fabric.replenisher.high_watermark = 50
+    
+    refill = asyncio.create_task(fabric.replenish_reserve())
+    await asyncio.sleep(0)
+    
+    latencies = []
+    while not refill.done():
+        start = time.perf_counter()
+        await asyncio.sleep(0.005)
+        await routes.get_pool_stats()
+        latencies.append(time.perf_counter() - start)
+    
+    assert await refill == 50
+    assert len(latencies) > 10
+    assert max(latencies) < 0.1
+
+
+async def test_replenisher_refills_between_watermarks(fabric):
+    """Test background replenisher refills from below low up to high watermark"""
+    replenisher = fabric.replenisher
+    replenisher.low_watermark = 2
+    replenisher.high_watermark = 7
+    replenisher.batch_size = 3
+    
+    await fabric.start()
+    assert replenisher.running
+    
+    for _ in range(100):
+        if len(fabric.pool_manager.reserve_pool) == 7:
+            break
+        await asyncio.sleep(0.01)
+    assert len(fabric.pool_manager.reserve_pool) == 7
+    
+    # Above low watermark: checkout does not trigger a refill
+    await fabric.get_burner()
+    await asyncio.sleep(0.05)
+    assert len(fabric.pool_manager.reserve_pool) == 6
+    
+    await fabric.stop()
+    assert not replenisher.running
+
+
+def test_api_watermarks_default_to_min_reserve_size():
+    """Test unset watermark settings fall back to MIN_RESERVE_SIZE"""
+    from src.config.settings import Settings
+    
+    if Settings.RESERVE_LOW_WATERMARK is not None or Settings.RESERVE_HIGH_WATERMARK is not None:
+        pytest.skip("Watermarks set in the environment")
+    
+    assert routes.fabric.replenisher.low_watermark == Settings.MIN_RESERVE_SIZE
+    assert routes.fabric.replenisher.high_watermark == Settings.MIN_RESERVE_SIZE
+
+
+async def test_api_lifespan_starts_replenisher():
+    """Test FastAPI startup/shutdown hooks manage the replenisher"""
+    from src.api.server import app, lifespan
+    
+    async with lifespan(app):
+        assert routes.fabric.replenisher.running
+    assert not routes.fabric.replenisher.running
+
+
+async def test_funded_swarm_batched_with_per_wallet_results(fabric, monkeypatch):
+    """Test swarm funding goes through one batch call and isolates failures"""
+    calls = []
+    
+    async def fake_fund_wallets_batch(amounts, source_wallet, priority_fee=None, commitment=None):
+        calls.append(amounts)
+        keys = list(amounts)
+        signatures = {key: f"sig-{key}" for key in keys if key != keys[1]}
+        raise BatchFundingError(signatures, {keys[1]: RuntimeError("transfer failed")})
+    
+    monkeypatch.setattr(fabric.funding_manager, "fund_wallets_batch", fake_fund_wallets_batch)
+    
+    results = await fabric.get_funded_swarm(6, Keypair(), 0.1)
+    
+    assert len(calls) == 1
+    assert len(calls[0]) == 6
+    assert all(amount > 0.1 for amount in calls[0].values())
+    assert [r.wallet.public_key for r in results] == list(calls[0])
+    assert sum(1 for r in results if r.success) == 5
+    
+    failed = [r for r in results if not r.success]
+    assert failed[0].wallet.public_key == list(calls[0])[1]
+    assert failed[0].error == "transfer failed"
+    assert failed[0].signature is None
+    
+    for result in results:
+        assert result.wallet.status == WalletStatus.ACTIVE
+        if result.success:
+            assert result.signature == f"sig-{result.wallet.public_key}"
+
+
+async def test_concurrent_swarm_raises_on_failed_funding(fabric, monkeypatch):
+    """Test concurrent get_burner_swarm reports failed fundings instead of dropping them"""
+    async def fake_fund_wallets_batch(amounts, source_wallet, priority_fee=None, commitment=None):
+        keys = list(amounts)
+        signatures = {key: f"sig-{key}" for key in keys[1:]}
+        raise BatchFundingError(signatures, {keys[0]: RuntimeError("transfer failed")})
+    
+    monkeypatch.setattr(fabric.funding_manager, "fund_wallets_batch", fake_fund_wallets_batch)
+    
+    with pytest.raises(SwarmFundingError) as error:
+        await fabric.get_burner_swarm(4, auto_fund=True, source_wallet=Keypair(), funding_amount=0.1, concurrent=True)
+    
+    results = error.value.results
+    assert [r.success for r in results] == [False, True, True, True]
+    assert results[0].wallet.status == WalletStatus.RETIRED
+    assert len(fabric.pool_manager.active_pool) == 3
+
+
+async def test_balances_route(fabric, monkeypatch):
+    """Test bulk balance route resolves pool wallets and reports unknown keys"""
+    monkeypatch.setattr(routes, "fabric", fabric)
+    
+    async def fake_get_balances(public_keys):
+        return {key: 0.5 for key in public_keys}
+    
+    monkeypatch.setattr(fabric.funding_manager, "get_balances", fake_get_balances)
+    
+    wallets = [await fabric.get_burner() for _ in range(3)]
+    unknown = str(Keypair().pubkey())
+    
+    response = await routes.get_balances(routes.GetBalancesRequest())
+    assert len(response["balances"]) == 3
+    
+    response = await routes.get_balances(
+        routes.GetBalancesRequest(public_keys=[str(wallets[0].public_key), unknown])
+    )
+    assert response["balances"] == [{
+        "public_key": str(wallets[0].public_key),
+        "balance_sol": 0.5,
+        "balance_lamports": 500_000_000
+    }]
+    assert response["not_found"] == [unknown]
+
+
+async def test_replenisher_stops_when_cancelled_after_wakeup(fabric):
+    """Test stop() is not lost when it races with a pending wake-up"""
+    fabric.replenisher.interval = 100
+    fabric.replenisher.start()
+    await asyncio.sleep(0)  # Task is now waiting on the already-set wake-up event
+    
+    stop = asyncio.ensure_future(fabric.replenisher.stop())
+    done, _ = await asyncio.wait({stop}, timeout=2)
+    assert stop in done
+    assert not fabric.replenisher.running
+
+
+async def test_burst_waits_for_replenisher_instead_of_generating(fabric, monkeypatch):
+    """Test checkouts on an empty reserve queue for batched refills"""
+    def no_inline_generation():
+        raise AssertionError("wallet generated inline")
+    
+    monkeypatch.setattr(fabric.pool_manager, "generate_wallet", no_inline_generation)
+    
+    wallets = await asyncio.gather(*(fabric.get_burner() for _ in range(5)))
+    
+    assert len({w.public_key for w in wallets}) == 5
+    stats = fabric.get_pool_stats()["checkout"]
+    assert stats["waited"] + stats["immediate"] == 5
+    assert stats["max_waiting"] >= 1
+    assert stats["waiting"] == 0
+    assert stats["timeouts"] == 0
+
+
+async def test_checkout_timeout_returns_pool_exhausted(fabric, monkeypatch):
+    """Test an empty reserve past the timeout raises PoolExhaustedError (503 from the API)"""
+    generate_batch = fabric.pool_manager.generate_batch
+    
+    def slow_generate_batch(count):
+        time.sleep(0.3)
+        return generate_batch(count)
+    
+    monkeypatch.setattr(fabric.pool_manager, "generate_batch", slow_generate_batch)
+    monkeypatch.setattr(routes, "fabric", fabric)
+    fabric.checkout_queue.timeout = 0.05
+    
+    with pytest.raises(PoolExhaustedError):
+        await fabric.get_burner()
+    
+    with pytest.raises(HTTPException) as excinfo:
+        await routes.get_burner(routes.GetBurnerRequest())
+    assert excinfo.value.status_code == 503
+    
+    stats = fabric.get_pool_stats()["checkout"]
+    assert stats["timeouts"] == 2
+    assert stats["waiting"] == 0
+    
+    await fabric._refill_task
+    assert (await fabric.get_burner()).status == WalletStatus.ACTIVE
+
+
+async def test_failed_swarm_checkout_retires_partial_wallets(fabric, monkeypatch):
+    """Test wallets checked out before the Nth checkout raises are retired, not orphaned"""
+    for _ in range(5):
+        fabric.pool_manager.add_to_reserve()
+    
+    checkout = fabric.checkout_queue.checkout
+    calls = 0
+    
+    async def failing_checkout(timeout=None):
+        nonlocal calls
+        calls += 1
+        if calls == 3:
+            raise PoolExhaustedError(0.1, 0)
+        return await checkout(timeout)
+    
+    monkeypatch.setattr(fabric.checkout_queue, "checkout", failing_checkout)
+    
+    with pytest.raises(PoolExhaustedError):
+        await fabric.get_funded_swarm(5, Keypair(), 0.1)
+    
+    assert len(fabric.pool_manager.active_pool) == 0
+    assert len(fabric.pool_manager.retired_pool) == 2
+    assert len(fabric.pool_manager.reserve_pool) == 3
+    
+    calls = 0
+    with pytest.raises(PoolExhaustedError):
+        await fabric.get_burner_swarm(5)
+    assert len(fabric.pool_manager.active_pool) == 0
+    assert len(fabric.pool_manager.retired_pool) == 4
@@ -0,0 +1,51 @@
+"""
+Tests for encryption utilities
+"""
+
+from src.utils import encryption
+from src.utils.encryption import (
+    encrypt_key,
+    decrypt_key,
+    get_fernet,
+    clear_key_cache,
+)
+
+
+def test_encrypt_decrypt_roundtrip():
+    """Test data survives encryption roundtrip"""
+    encrypted = encrypt_key(b"secret")
+    assert decrypt_key(encrypted) == b"secret"
+    
+    encrypted = encrypt_key(b"secret", password="hunter2")
+    assert decrypt_key(encrypted, password="hunter2") == b"secret"
+
+
+def test_fernet_cached():
+    """Test derived keys are reused"""
+    clear_key_cache()
+    
+    assert get_fernet() is get_fernet()
+    assert get_fernet("a") is not get_fernet("b")
+    assert get_fernet(iterations=1000) is not get_fernet()
+
+
+def test_fernet_cache_bounded(monkeypatch):
+    """Test cache evicts least recently used keys"""
+    clear_key_cache()
+    monkeypatch.setattr(encryption, "KEY_CACHE_SIZE", 2)
+    
+    first = get_fernet("a", iterations=1000)
+    get_fernet("b", iterations=1000)
+    get_fernet("c", iterations=1000)
+    
+    assert len(encryption._fernet_cache) == 2
+    assert get_fernet("a", iterations=1000) is not first
+
+
+def test_clear_key_cache():
+    """Test cache can be cleared"""
+    fernet = get_fernet()
+    clear_key_cache()
+    
+    assert len(encryption._fernet_cache) == 0
+    assert get_fernet() is not fernet
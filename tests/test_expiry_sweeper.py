@@ -0,0 +1,83 @@
+"""
+Tests for expiry sweeper
+"""
+
+import asyncio
+import time
+from src.burner_swarm.burner_swarm_fabric import BurnerSwarmFabric
+from src.burner_swarm.expiry_sweeper import ExpirySweeper
+from src.burner_swarm.pool_manager import PoolManager, WalletStatus
+
+
+def add_wallets(pool_manager, count, created_ts):
+    """Add reserve wallets with a given creation time"""
+    wallets = pool_manager.generate_batch(count)
+    for wallet in wallets:
+        wallet.created_ts = created_ts
+        pool_manager.add_to_reserve(wallet)
+    return wallets
+
+
+async def test_sweep_retires_in_bounded_batches():
+    """Test a sweep retires all due wallets, batch_size at a time"""
+    pool_manager = PoolManager(min_reserve_size=0)
+    now = int(time.time())
+    expired = add_wallets(pool_manager, 7, now - 2 * 3600)
+    fresh = add_wallets(pool_manager, 2, now)
+    
+    steps = []
+    cleanup = pool_manager.cleanup_expired_wallets
+    
+    def tracked_cleanup(max_age_hours, limit=None, wait=True):
+        retired = cleanup(max_age_hours, limit, wait)
+        steps.append(len(retired))
+        return retired
+    
+    pool_manager.cleanup_expired_wallets = tracked_cleanup
+    retired_batches = []
+    sweeper = ExpirySweeper(pool_manager, max_age_hours=1, batch_size=3, on_retired=retired_batches.append)
+    
+    assert await sweeper.sweep() == 7
+    assert steps == [3, 3, 1]
+    assert all(w.status == WalletStatus.RETIRED for w in expired)
+    assert all(w.status == WalletStatus.RESERVE for w in fresh)
+    assert len(retired_batches[0]) == 7
+    
+    stats = sweeper.get_stats()
+    assert stats["runs"] == 1
+    assert stats["last_retired"] == 7
+    assert stats["last_run_duration"] >= stats["last_max_step_duration"] > 0
+    assert stats["next_expiry"] == now + 3600
+
+
+async def test_sweeper_wakes_at_next_deadline():
+    """Test the background task sleeps until the oldest wallet expires"""
+    pool_manager = PoolManager(min_reserve_size=0)
+    # Expires 0.5s from now with a 1 hour max age
+    wallet = add_wallets(pool_manager, 1, time.time() - 3600 + 0.5)[0]
+    sweeper = ExpirySweeper(pool_manager, max_age_hours=1, max_interval=30)
+    
+    assert 0 < sweeper.next_delay() <= 1.6
+    
+    sweeper.start()
+    try:
+        for _ in range(150):
+            if wallet.status == WalletStatus.RETIRED:
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        await sweeper.stop()
+    
+    assert wallet.status == WalletStatus.RETIRED
+    assert sweeper.total_retired == 1
+    assert sweeper.next_delay() == 30
+
+
+async def test_fabric_runs_sweeper_and_reports_stats():
+    """Test the fabric starts the sweeper and exposes its stats"""
+    fabric = BurnerSwarmFabric(min_reserve_size=0)
+    await fabric.start()
+    assert fabric.expiry_sweeper.running
+    assert "expiry_sweeper" in fabric.get_pool_stats()
+    await fabric.close()
+    assert not fabric.expiry_sweeper.running
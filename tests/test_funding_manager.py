@@ -0,0 +1,310 @@
+"""
+Tests for funding manager
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.signature import Signature
+from solders.transaction import Transaction
+from solders.transaction_status import TransactionConfirmationStatus
+from solana.rpc.commitment import Confirmed, Finalized
+from src.burner_swarm.confirmation_tracker import TransactionFailedError
+from src.burner_swarm.funding_manager import (
+    FundingManager,
+    BatchFundingError,
+    PACKET_DATA_SIZE,
+)
+
+
+def landed(level=TransactionConfirmationStatus.Confirmed, err=None):
+    """Signature status of a landed transaction"""
+    return SimpleNamespace(slot=1, err=err, confirmation_status=level)
+
+
+class StubClient:
+    """Minimal async RPC client stub"""
+    
+    def __init__(self, fail_on: int = -1, fail_for=()):
+        self.sent = []
+        self.fail_on = fail_on
+        self.fail_for = set(fail_for)
+        self.blockhash_calls = 0
+        self.block_height = 0
+        self.lamports = {}
+        self.account_calls = []
+        self.statuses = {}
+        self.status_calls = []
+        self.landed = landed()
+    
+    async def get_latest_blockhash(self, commitment=None):
+        self.blockhash_calls += 1
+        return SimpleNamespace(
+            value=SimpleNamespace(
+                blockhash=Hash.new_unique(),
+                last_valid_block_height=self.block_height + 150
+            )
+        )
+    
+    async def get_block_height(self, commitment=None):
+        return SimpleNamespace(value=self.block_height)
+    
+    async def get_multiple_accounts(self, pubkeys, commitment=None, data_slice=None):
+        self.account_calls.append(len(pubkeys))
+        return SimpleNamespace(value=[
+            SimpleNamespace(lamports=self.lamports[key]) if key in self.lamports else None
+            for key in pubkeys
+        ])
+    
+    async def send_transaction(self, transaction, opts=None):
+        self.sent.append(transaction)
+        if len(self.sent) - 1 == self.fail_on:
+            raise RuntimeError("send failed")
+        if self.fail_for & set(transaction.message.account_keys):
+            raise RuntimeError("send failed")
+        self.statuses[transaction.signatures[0]] = self.landed
+        return SimpleNamespace(value=transaction.signatures[0])
+    
+    async def get_signature_statuses(self, signatures, search_transaction_history=False):
+        self.status_calls.append(len(signatures))
+        return SimpleNamespace(value=[self.statuses.get(s) for s in signatures])
+    
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def funding_manager():
+    """Funding manager with a stub RPC client"""
+    manager = FundingManager(rpc_url="http://127.0.0.1:8899")
+    manager.rpc.endpoints[0].pool.client = StubClient()
+    return manager
+
+
+def test_pack_transfers_fits_packet_size(funding_manager):
+    """Test transfers are packed into the fewest transactions that fit"""
+    source = Keypair()
+    transfers = [(Keypair().pubkey(), 1000) for _ in range(50)]
+    
+    groups = funding_manager.pack_transfers(source.pubkey(), transfers)
+    
+    assert [len(g) for g in groups] == [21, 21, 8]
+    for group in groups:
+        transaction = funding_manager._build_transfer_transaction(source, group, Hash.default())
+        assert len(bytes(transaction)) <= PACKET_DATA_SIZE
+    
+    # One more transfer would not fit
+    oversized = funding_manager._build_transfer_transaction(source, transfers[:22], Hash.default())
+    assert len(bytes(oversized)) > PACKET_DATA_SIZE
+
+
+async def test_fund_wallets_batch(funding_manager):
+    """Test batch funding maps every recipient to its transaction signature"""
+    source = Keypair()
+    amounts = {Keypair().pubkey(): 0.01 for _ in range(30)}
+    
+    signatures = await funding_manager.fund_wallets_batch(amounts, source)
+    
+    sent = funding_manager.client.sent
+    assert len(sent) == 2
+    assert set(signatures) == set(amounts)
+    assert len(set(signatures.values())) == 2
+    
+    for transaction in sent:
+        assert isinstance(transaction, Transaction)
+        assert transaction.verify() is None
+        for key in transaction.message.account_keys[1:-1]:
+            assert signatures[key] == str(transaction.signatures[0])
+
+
+async def test_fund_wallets_batch_retries_failed_transaction(funding_manager):
+    """Test recipients of a failed transaction are retried one by one"""
+    client = StubClient(fail_on=0)
+    funding_manager.rpc.endpoints[0].pool.client = client
+    amounts = {Keypair().pubkey(): 0.01 for _ in range(30)}
+    
+    signatures = await funding_manager.fund_wallets_batch(amounts, Keypair())
+    
+    assert set(signatures) == set(amounts)
+    assert len(client.sent) == 2 + 21
+    assert len(set(signatures.values())) == 1 + 21
+
+
+async def test_fund_wallets_batch_partial_failure(funding_manager):
+    """Test only the recipient whose own transfer fails is reported failed"""
+    amounts = {Keypair().pubkey(): 0.01 for _ in range(30)}
+    bad = list(amounts)[3]
+    funding_manager.rpc.endpoints[0].pool.client = StubClient(fail_for=[bad])
+    
+    with pytest.raises(BatchFundingError) as exc_info:
+        await funding_manager.fund_wallets_batch(amounts, Keypair())
+    
+    error = exc_info.value
+    assert set(error.failed) == {bad}
+    assert len(error.signatures) == 29
+    assert set(error.failed) | set(error.signatures) == set(amounts)
+
+
+async def test_blockhash_shared_across_concurrent_fundings(funding_manager):
+    """Test concurrent fundings reuse one cached blockhash"""
+    source = Keypair()
+    
+    await asyncio.gather(*(
+        funding_manager.fund_wallet(Keypair().pubkey(), source, 0.01)
+        for _ in range(10)
+    ))
+    
+    client = funding_manager.client
+    assert client.blockhash_calls == 1
+    assert len({t.message.recent_blockhash for t in client.sent}) == 1
+    
+    stats = funding_manager.blockhash_cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 9
+
+
+async def test_blockhash_refreshes_near_last_valid_height(funding_manager):
+    """Test a blockhash close to its last valid height is refreshed early"""
+    cache = funding_manager.blockhash_cache
+    funding_manager.client.block_height = 1000
+    
+    # 150 blocks of validity minus margin: fresh for the TTL
+    first = await cache.get()
+    assert await cache.get() == first
+    
+    # Validity window entirely inside the margin: never served from cache
+    cache.refresh_margin_blocks = 150
+    cache.invalidate()
+    await cache.get()
+    await cache.get()
+    assert cache.misses == 3
+
+
+async def test_blockhash_background_refresh(funding_manager):
+    """Test background refresher keeps the cache warm"""
+    cache = funding_manager.blockhash_cache
+    cache.refresh_interval = 0.1
+    
+    cache.start()
+    await asyncio.sleep(0.25)
+    await cache.get()
+    await cache.stop()
+    
+    assert cache.refreshes >= 2
+    assert cache.misses == 0
+    assert cache.hits == 1
+
+
+async def test_get_balances_chunks_multiple_accounts(funding_manager):
+    """Test bulk balances use getMultipleAccounts in chunks of the RPC maximum"""
+    public_keys = [Keypair().pubkey() for _ in range(250)]
+    client = funding_manager.client
+    client.lamports = {key: i * 1_000_000 for i, key in enumerate(public_keys) if i % 2}
+    
+    balances = await funding_manager.get_balances(public_keys)
+    
+    assert client.account_calls == [100, 100, 50]
+    assert len(balances) == 250
+    assert balances[public_keys[0]] == 0.0  # Account does not exist
+    assert balances[public_keys[3]] == 0.003
+
+
+async def test_rpc_pool_limits_in_flight(funding_manager):
+    """Test RPC pool bounds in-flight requests and reports queueing"""
+    pool = funding_manager.rpc.endpoints[0].pool
+    pool.max_connections = 2
+    pool._semaphore = asyncio.Semaphore(2)
+    observed = []
+    
+    async def slow_get_balance(public_key, commitment=None):
+        observed.append((pool.in_flight, pool.queued))
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(value=1_000_000_000)
+    
+    pool.client.get_balance = slow_get_balance
+    
+    balances = await asyncio.gather(*(
+        funding_manager.get_balance(Keypair().pubkey()) for _ in range(6)
+    ))
+    
+    assert balances == [1.0] * 6
+    assert max(in_flight for in_flight, _ in observed) == 2
+    
+    stats = funding_manager.get_rpc_stats()["endpoints"][0]
+    assert stats["peak_in_flight"] == 2
+    assert stats["peak_queued"] == 4
+    assert stats["total_requests"] == 6
+    assert stats["in_flight"] == 0
+    assert stats["queued"] == 0
+
+
+def test_rpc_pool_client_without_limit_options(monkeypatch):
+    """Test the pool still builds a client on solana releases without connection limit options"""
+    from src.burner_swarm import rpc_pool
+    
+    class OldAsyncClient:
+        def __init__(self, endpoint, commitment=None, timeout=None):
+            self.endpoint = endpoint
+            self.timeout = timeout
+    
+    monkeypatch.setattr(rpc_pool, "AsyncClient", OldAsyncClient)
+    monkeypatch.setattr(rpc_pool, "CLIENT_LIMIT_ARGS", False)
+    
+    pool = rpc_pool.RpcConnectionPool("http://localhost:8899", max_connections=4, timeout=5.0)
+    client = pool.get_client()
+    assert isinstance(client, OldAsyncClient)
+    assert client.timeout == 5.0
+
+
+async def test_confirmations_batched_per_commitment(funding_manager):
+    """Test pending signatures are polled in chunks and resolved per requested commitment"""
+    client = funding_manager.client
+    tracker = funding_manager.confirmations
+    tracker.poll_interval = 0.01
+    signatures = [Signature.new_unique() for _ in range(600)]
+    
+    confirmed = [tracker.track(s, Confirmed) for s in signatures]
+    finalized = tracker.track(signatures[0], Finalized)
+    for signature in signatures:
+        client.statuses[signature] = landed()
+    
+    await asyncio.gather(*confirmed)
+    assert client.status_calls[:3] == [256, 256, 88]
+    assert not finalized.done()
+    assert tracker.pending == 1
+    
+    client.statuses[signatures[0]] = landed(TransactionConfirmationStatus.Finalized)
+    status = await finalized
+    assert status.confirmation_status == TransactionConfirmationStatus.Finalized
+    
+    stats = tracker.get_stats()
+    assert stats["confirmed"] == 601
+    assert stats["pending"] == 0
+    await funding_manager.disconnect()
+    assert not tracker.running
+
+
+async def test_fund_wallet_waits_for_commitment(funding_manager):
+    """Test fund_wallet with a commitment returns once confirmed and raises on a failed transfer"""
+    client = funding_manager.client
+    funding_manager.confirmations.poll_interval = 0.01
+    source = Keypair()
+    
+    signatures = await asyncio.gather(*(
+        funding_manager.fund_wallet(Keypair().pubkey(), source, 0.01, commitment=Confirmed)
+        for _ in range(20)
+    ))
+    assert len(set(signatures)) == 20
+    assert sum(client.status_calls) < 20 * 2  # Concurrent fundings share polls
+    
+    client.landed = landed(err="InsufficientFundsForRent")
+    with pytest.raises(TransactionFailedError):
+        await funding_manager.fund_wallet(Keypair().pubkey(), source, 0.01, commitment=Confirmed)
+    
+    # Without a commitment nothing is polled
+    calls = len(client.status_calls)
+    await funding_manager.fund_wallet(Keypair().pubkey(), source, 0.01)
+    assert len(client.status_calls) == calls
+    await funding_manager.disconnect()
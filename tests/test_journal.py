@@ -0,0 +1,145 @@
+"""
+Tests for the wallet journal store
+"""
+
+import asyncio
+import json
+import os
+import time
+import pytest
+from src.burner_swarm.pool_manager import PoolManager
+from src.burner_swarm.journal import JournalWalletStore, JOURNAL_FILE, SNAPSHOT_FILE
+from src.burner_swarm.wallet_store import create_wallet_store
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    """Temporary journal directory"""
+    return str(tmp_path / "journal")
+
+
+def test_crash_recovery_replays_journal(journal_dir):
+    """Test state is rebuilt from the journal after an unclean shutdown"""
+    store = JournalWalletStore(journal_dir)
+    pool_manager = PoolManager(min_reserve_size=4, store=store)
+    pool_manager.maintain_reserve_pool()
+    
+    active = pool_manager.activate_wallet(pool_manager.get_from_reserve())
+    pool_manager.mark_used(active)
+    retired = pool_manager.get_from_reserve()
+    pool_manager.retire_wallet(retired)
+    store.flush()
+    
+    # Simulate a crash mid-append: no close(), torn last line
+    with open(store.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"public_key": "tor')
+    
+    restored = PoolManager(min_reserve_size=4, store=JournalWalletStore(journal_dir))
+    
+    assert set(restored.reserve_pool) == set(pool_manager.reserve_pool)
+    assert str(retired.public_key) not in restored.reserve_pool
+    wallet = restored.active_pool[str(active.public_key)]
+    assert wallet.usage_count == 1
+    assert wallet.last_used is not None
+    assert wallet.keypair.pubkey() == active.public_key
+    
+    # Torn tail is truncated so later appends stay parseable
+    with open(restored.store.journal_path, "rb") as f:
+        assert f.read().endswith(b"\n")
+    restored.close()
+    store.close()
+
+
+def test_transitions_group_committed(journal_dir):
+    """Test transitions are recorded as deltas and committed in batches"""
+    store = JournalWalletStore(journal_dir)
+    pool_manager = PoolManager(min_reserve_size=50, store=store)
+    pool_manager.maintain_reserve_pool()
+    wallet = pool_manager.activate_wallet(pool_manager.get_from_reserve())
+    pool_manager.close()
+    
+    stats = store.get_stats()
+    assert stats["appends"] == 51
+    assert stats["durable_seq"] == 51
+    assert stats["commits"] <= stats["appends"]
+    
+    with open(store.journal_path, "r", encoding="utf-8") as f:
+        last = json.loads(f.readlines()[-1])
+    assert last == {"public_key": str(wallet.public_key), "status": "active", "seq": 51}
+
+
+def test_compaction_snapshot_and_tail(journal_dir):
+    """Test compaction writes a snapshot and replay combines it with the tail"""
+    store = JournalWalletStore(journal_dir, compact_threshold=10)
+    pool_manager = PoolManager(min_reserve_size=12, store=store)
+    pool_manager.maintain_reserve_pool()
+    store.flush()
+    pool_manager.retire_wallet(pool_manager.get_from_reserve())
+    pool_manager.close()
+    
+    assert store.compactions >= 1
+    assert (store.directory / SNAPSHOT_FILE).exists()
+    with open(store.directory / JOURNAL_FILE, "r", encoding="utf-8") as f:
+        assert len(f.readlines()) < 10
+    
+    restored = JournalWalletStore(journal_dir, compact_threshold=10)
+    assert {str(w.public_key) for w in restored.load()} == set(pool_manager.reserve_pool)
+    restored.close()
+
+
+def test_create_journal_backend(journal_dir):
+    """Test factory builds the journal backend"""
+    store = create_wallet_store("journal", journal_dir, compact_threshold=5)
+    assert isinstance(store, JournalWalletStore)
+    assert store.compact_threshold == 5
+    store.close()
+
+
+async def test_fabric_starts_with_journal_store(journal_dir):
+    """Test the fabric runs without a periodic flush loop for the journal backend"""
+    from src.burner_swarm.burner_swarm_fabric import BurnerSwarmFabric
+    
+    fabric = BurnerSwarmFabric(min_reserve_size=2, wallet_store=JournalWalletStore(journal_dir))
+    await fabric.start()
+    await fabric.get_burner()
+    await fabric.close()
+    
+    restored = JournalWalletStore(journal_dir)
+    assert len(restored.load()) >= 2
+    restored.close()
+
+
+async def test_checkout_durable_before_get_burner_returns(journal_dir, monkeypatch):
+    """Test get_burner waits for the activation's group commit without blocking the loop"""
+    from src.burner_swarm import journal
+    from src.burner_swarm.burner_swarm_fabric import BurnerSwarmFabric
+    
+    fsync = os.fsync
+    
+    def slow_fsync(fd):
+        time.sleep(0.2)
+        fsync(fd)
+    
+    monkeypatch.setattr(journal.os, "fsync", slow_fsync)
+    store = JournalWalletStore(journal_dir)
+    fabric = BurnerSwarmFabric(min_reserve_size=3, wallet_store=store)
+    
+    gaps = []
+    
+    async def ticker():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            gaps.append(time.perf_counter() - start)
+    
+    task = asyncio.create_task(ticker())
+    wallet = await fabric.get_burner()
+    task.cancel()
+    
+    # Crash right after the wallet was handed out: a fresh reader sees it active
+    reader = JournalWalletStore(journal_dir)
+    recovered = {str(w.public_key): w.status for w in reader.load()}
+    reader.close()
+    assert recovered[str(wallet.public_key)] == "active"
+    assert max(gaps) < 0.1
+    await fabric.close()
@@ -0,0 +1,80 @@
+"""
+Tests for lease-based checkout on a shared wallet store
+"""
+
+import time
+import pytest
+from src.burner_swarm.lease_keeper import LeaseKeeper
+from src.burner_swarm.pool_manager import PoolManager, WalletStatus
+from src.burner_swarm.wallet_store import SharedSQLiteWalletStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Temporary database path"""
+    return str(tmp_path / "wallets.db")
+
+
+def make_instance(db_path, owner, lease_ttl=30.0, min_reserve_size=0):
+    """Pool manager on a shared store with its own lease owner id"""
+    store = SharedSQLiteWalletStore(db_path, owner=owner, lease_ttl=lease_ttl)
+    return PoolManager(min_reserve_size=min_reserve_size, store=store)
+
+
+def test_expired_leases_reclaimed(db_path):
+    """Test used and unused wallets are both retired when their lease lapses"""
+    crashed = make_instance(db_path, "crashed", lease_ttl=0.05, min_reserve_size=3)
+    crashed.maintain_reserve_pool()
+    unused = crashed.activate_wallet(crashed.get_from_reserve())
+    used = crashed.activate_wallet(crashed.get_from_reserve())
+    crashed.mark_used(used)
+    
+    survivor = make_instance(db_path, "survivor")
+    keeper = LeaseKeeper(survivor)
+    keeper.heartbeat()
+    assert keeper.reclaimed == 0
+    
+    time.sleep(0.1)
+    keeper.heartbeat()
+    assert keeper.reclaimed == 2
+    
+    # A handed-out wallet is never checked out again, even if unused
+    for wallet in (unused, used):
+        retired = survivor.get_wallet(wallet.public_key)
+        assert retired.status == WalletStatus.RETIRED
+        assert retired.ciphertext is None
+    assert survivor.reserve_size() == 1
+    assert survivor.get_from_reserve().public_key not in (unused.public_key, used.public_key)
+    
+    crashed.close()
+    survivor.close()
+
+
+def test_heartbeat_keeps_leases_and_drops_lost_ones(db_path):
+    """Test renewed leases survive reclaim and a reclaimed wallet is dropped by its old owner"""
+    owner = make_instance(db_path, "owner", lease_ttl=0.5, min_reserve_size=2)
+    owner.maintain_reserve_pool()
+    kept = owner.activate_wallet(owner.get_from_reserve())
+    stale = owner.activate_wallet(owner.get_from_reserve())
+    
+    other = make_instance(db_path, "other")
+    time.sleep(0.3)
+    assert owner.renew_leases() == []
+    time.sleep(0.3)  # First lease would have lapsed without the renewal
+    assert other.reclaim_expired_leases() == 0
+    
+    # Simulate a missed heartbeat on one wallet: its lease is reclaimed
+    other.store._conn.execute(
+        "UPDATE wallets SET lease_expires = 0 WHERE public_key = ?",
+        (str(stale.public_key),)
+    )
+    other.store._conn.commit()
+    assert other.reclaim_expired_leases() == 1
+    
+    lost = owner.renew_leases()
+    assert lost == [stale]
+    assert str(stale.public_key) not in owner.active_pool
+    assert owner.get_active_wallet(kept.public_key) is kept
+    
+    owner.close()
+    other.close()
@@ -0,0 +1,115 @@
+"""
+Tests for pool manager
+"""
+
+import pytest
+from src.burner_swarm.pool_manager import PoolManager, WalletStatus
+from src.burner_swarm.parallel_generator import ParallelWalletGenerator
+
+
+def test_maintain_reserve_pool():
+    """Test reserve pool is filled to minimum"""
+    pool_manager = PoolManager(min_reserve_size=4)
+    
+    pool_manager.maintain_reserve_pool()
+    
+    assert len(pool_manager.reserve_pool) == 4
+    assert pool_manager.reserve_deficit() == 0
+
+
+def test_generate_batch():
+    """Test batch generation shares creation timestamp"""
+    pool_manager = PoolManager(min_reserve_size=0)
+    
+    wallets = pool_manager.generate_batch(3)
+    
+    assert len(wallets) == 3
+    assert len({w.created_at for w in wallets}) == 1
+    assert all(w.status == WalletStatus.RESERVE for w in wallets)
+    assert all(w.keypair.pubkey() == w.public_key for w in wallets)
+
+
+def test_parallel_batch_decrypted_on_activation():
+    """Test worker-generated wallets decrypt their keypair only on activation"""
+    parallel = ParallelWalletGenerator(workers=1)
+    pool_manager = PoolManager(
+        min_reserve_size=0,
+        parallel_generator=parallel,
+        parallel_threshold=2
+    )
+    
+    try:
+        wallets = pool_manager.generate_batch(2)
+    finally:
+        pool_manager.close()
+    
+    wallet = wallets[0]
+    assert wallet.keypair is None
+    
+    pool_manager.activate_wallet(wallet)
+    assert wallet.keypair.pubkey() == wallet.public_key
+
+
+def test_compact_wallet_representation():
+    """Test wallets are slotted with epoch timestamps and binary ciphertext"""
+    pool_manager = PoolManager(min_reserve_size=0)
+    wallet = pool_manager.generate_wallet()
+    
+    assert not hasattr(wallet, "__dict__")
+    assert isinstance(wallet.created_ts, int)
+    assert isinstance(wallet.ciphertext, bytes)
+    assert wallet.created_at.timestamp() > 0
+    
+    # Legacy dictionary view still decrypts
+    assert pool_manager.generator.decrypt_keypair(wallet.encrypted_private_key).pubkey() == wallet.public_key
+    
+    wallet.mark_used()
+    assert wallet.last_used_ts >= wallet.created_ts
+    assert wallet.last_used is not None
+
+
+def test_unified_index_tracks_status():
+    """Test one index serves lookups across statuses and pool views stay consistent"""
+    pool_manager = PoolManager(min_reserve_size=3)
+    pool_manager.maintain_reserve_pool()
+    
+    active = pool_manager.activate_wallet(pool_manager.get_from_reserve())
+    retired = pool_manager.get_from_reserve()
+    pool_manager.retire_wallet(retired)
+    reserve = next(iter(pool_manager.reserve_pool.values()))
+    
+    for wallet, status in ((active, WalletStatus.ACTIVE), (retired, WalletStatus.RETIRED), (reserve, WalletStatus.RESERVE)):
+        assert pool_manager.get_wallet(wallet.public_key) is wallet
+        assert wallet.status == status
+    
+    assert list(pool_manager.active_pool) == [str(active.public_key)]
+    assert pool_manager.active_pool[str(active.public_key)] is active
+    assert str(active.public_key) not in pool_manager.reserve_pool
+    assert "not-a-key" not in pool_manager.reserve_pool
+    assert pool_manager.get_active_wallet(reserve.public_key) is None
+    
+    stats = pool_manager.get_pool_stats()
+    assert (stats["active"], stats["reserve"], stats["retired"]) == (1, 1, 1)
+
+
+def test_cleanup_pops_only_expired():
+    """Test expiry index retires expired wallets and skips stale entries"""
+    pool_manager = PoolManager(min_reserve_size=0)
+    old = pool_manager.generate_batch(3)
+    fresh = pool_manager.generate_batch(2)
+    for wallet in old:
+        wallet.created_ts -= 25 * 3600
+    for wallet in old + fresh:
+        pool_manager.add_to_reserve(wallet)
+    
+    # Checked out and re-activated: leaves a stale heap entry behind
+    pool_manager.activate_wallet(pool_manager.get_from_reserve())
+    # Already retired: its entry must be skipped
+    pool_manager.retire_wallet(old[2])
+    
+    expired = pool_manager.cleanup_expired_wallets(max_age_hours=24)
+    
+    assert {bytes(w.public_key) for w in expired} == {bytes(w.public_key) for w in old[:2]}
+    assert all(w.status == WalletStatus.RESERVE for w in fresh)
+    assert pool_manager.get_pool_stats()["retired"] == 3
+    assert pool_manager.cleanup_expired_wallets(max_age_hours=24) == []
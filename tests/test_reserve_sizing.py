@@ -0,0 +1,68 @@
+"""
+Tests for adaptive reserve sizing
+"""
+
+import pytest
+from src.burner_swarm.burner_swarm_fabric import BurnerSwarmFabric
+from src.burner_swarm.reserve_sizing import ReserveSizer
+
+
+def test_target_follows_checkout_rate_within_bounds():
+    """Test the target tracks the EWMA checkout rate and decays when idle"""
+    sizer = ReserveSizer(min_size=5, max_size=50, window=10.0, alpha=0.5, lead_time=30.0)
+    start = sizer._checkouts.window_start
+    assert sizer.target(start) == 5
+    
+    # 1 checkout/s for three windows: EWMA 0.5, 0.75, 0.875 /s
+    for second in range(30):
+        sizer.record_checkout(now=start + second)
+    assert sizer.forecast(start + 30) == pytest.approx(0.875)
+    assert sizer.target(start + 30) == 27
+    
+    # Burst is capped at max_size
+    sizer.record_checkout(100, now=start + 31)
+    assert sizer.target(start + 31) == 50
+    
+    # Idle windows decay the forecast back to the floor
+    assert sizer.target(start + 600) == 5
+
+
+def test_unused_expiries_shrink_target():
+    """Test wallets expiring unused reduce the target by the waste ratio"""
+    sizer = ReserveSizer(min_size=1, max_size=1000, window=10.0, alpha=1.0, lead_time=100.0, max_age_hours=None)
+    start = sizer._checkouts.window_start
+    sizer.record_checkout(20, now=start)
+    assert sizer.target(start + 10) == 200
+    
+    sizer.record_expired(20, now=start + 10)
+    assert sizer.target(start + 19) == 100
+    
+    # Lifetime cap: never hold more than the forecast consumes before expiry
+    sizer.max_age_hours = 10 / 3600
+    assert sizer.target(start + 19) == 20
+
+
+async def test_replenisher_follows_adaptive_target():
+    """Test the fabric refills to the adaptive target and reports it in pool stats"""
+    fabric = BurnerSwarmFabric(
+        min_reserve_size=0,
+        reserve_low_watermark=2,
+        reserve_high_watermark=3,
+        adaptive_reserve=True,
+        reserve_target_max=20,
+        reserve_lead_time=10.0
+    )
+    assert fabric.replenisher.watermarks() == (2, 3)
+    
+    fabric.reserve_sizer.record_checkout(12)  # 1.2/s over the current window
+    assert fabric.replenisher.watermarks() == (12, 13)
+    
+    await fabric.replenish_reserve()
+    assert len(fabric.pool_manager.reserve_pool) == 13
+    
+    stats = fabric.get_pool_stats()["reserve_sizing"]
+    assert stats["adaptive"] is True
+    assert stats["target"] == 12
+    assert stats["forecast"] == pytest.approx(12.0)
+    
+    await fabric.close()
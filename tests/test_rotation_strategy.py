@@ -0,0 +1,82 @@
+"""
+Tests for rotation strategy
+"""
+
+import os
+import time
+import pytest
+from solders.pubkey import Pubkey
+from src.burner_swarm.pool_manager import BurnerWallet, WalletStatus
+from src.burner_swarm.rotation_policy import RotationPolicy
+from src.burner_swarm.rotation_strategy import RotationStrategy
+
+
+def make_wallet(created_at: int, usage_count: int = 0) -> BurnerWallet:
+    """Active wallet with a random public key"""
+    return BurnerWallet(
+        public_key=Pubkey(os.urandom(32)),
+        keypair=None,
+        created_at=created_at,
+        usage_count=usage_count,
+        status=WalletStatus.ACTIVE
+    )
+
+
+def test_top_candidates_match_sorted_selection():
+    """Test heap-based top-k matches select_rotation_candidates ordering"""
+    now = int(time.time())
+    strategy = RotationStrategy(max_uses=3, max_age_hours=1)
+    wallets = [make_wallet(now - i * 600, usage_count=i % 5) for i in range(30)]
+    for wallet in wallets:
+        strategy.track(wallet)
+    
+    expected = strategy.select_rotation_candidates(wallets, 10)
+    assert strategy.top_candidates(10) == expected
+    assert strategy.top_candidates(10) == expected  # Selection does not consume entries
+
+
+def test_top_candidates_follow_use_expiry_and_untrack():
+    """Test usage updates, age deadlines and retirement reorder candidates"""
+    now = int(time.time())
+    strategy = RotationStrategy(max_uses=2, max_age_hours=1)
+    fresh = make_wallet(now)
+    aging = make_wallet(now - 3000)
+    for wallet in (fresh, aging):
+        strategy.track(wallet)
+    
+    assert strategy.top_candidates(5) == []
+    
+    # Aging wallet is promoted once its deadline passes
+    assert strategy.top_candidates(5, now=now + 1200) == [aging]
+    
+    fresh.mark_used()
+    fresh.mark_used()
+    strategy.record_use(fresh)
+    assert strategy.top_candidates(5, now=now + 1200) == [fresh, aging]
+    
+    strategy.untrack(fresh)
+    aging.status = WalletStatus.RETIRED  # Retired without untrack()
+    assert strategy.top_candidates(5, now=now + 1200) == []
+
+
+def test_policy_rules_share_one_evaluation():
+    """Test idle and balance rules, and recommendation agreeing with should_rotate"""
+    now = int(time.time())
+    strategy = RotationStrategy(max_uses=10, max_age_hours=24, max_idle_hours=1, min_balance_sol=0.01)
+    
+    idle = make_wallet(now - 7200)
+    drained = make_wallet(now, usage_count=1)
+    strategy.record_balance(drained, 0.001)
+    unfunded = make_wallet(now)
+    strategy.record_balance(unfunded, 0)  # Never used: not drained
+    
+    for wallet, rotates in ((idle, True), (drained, True), (unfunded, False)):
+        recommendation = strategy.get_rotation_recommendation(wallet)
+        assert strategy.should_rotate(wallet) is rotates
+        assert recommendation["should_rotate"] is rotates
+        assert len(recommendation["reasons"]) == int(rotates)
+    
+    assert recommendation["rules"] == {"usage": 10, "age": 24, "idle": 1, "balance": 0.01}
+    
+    with pytest.raises(ValueError):
+        RotationPolicy({"usage": 1, "moon_phase": 3})
@@ -0,0 +1,103 @@
+"""
+Tests for RPC router
+"""
+
+import pytest
+from solders.keypair import Keypair
+from src.burner_swarm.funding_manager import FundingManager
+from src.burner_swarm.rpc_router import RpcRouter
+from tests.stub_rpc import StubRpcServer
+
+
+@pytest.fixture
+def servers():
+    """Fast, slow and flaky stub RPC servers"""
+    with StubRpcServer(balance=1, delay=0.05) as slow, \
+            StubRpcServer(balance=2) as fast, \
+            StubRpcServer(balance=3) as flaky:
+        yield slow, fast, flaky
+
+
+async def test_reads_go_to_fastest_endpoint(servers):
+    """Test reads prefer the lowest-latency endpoint once measured"""
+    slow, fast, flaky = servers
+    router = RpcRouter([slow.url, fast.url], timeout=2.0)
+    public_key = Keypair().pubkey()
+    
+    try:
+        # First calls sample every endpoint
+        for _ in range(2):
+            await router.request("get_balance", public_key)
+        
+        for _ in range(5):
+            response = await router.request("get_balance", public_key)
+            assert response.value == 2
+    finally:
+        await router.close()
+    
+    assert len(slow.requests) == 1
+    assert len(fast.requests) == 6
+
+
+async def test_read_fails_over_and_trips_breaker(servers):
+    """Test failed reads retry elsewhere and a failing endpoint is cut off"""
+    slow, fast, flaky = servers
+    flaky.fail = True
+    router = RpcRouter([flaky.url, slow.url], failure_threshold=2, breaker_cooldown=60.0, timeout=2.0)
+    public_key = Keypair().pubkey()
+    
+    try:
+        for _ in range(5):
+            response = await router.request("get_balance", public_key)
+            assert response.value == 1
+        
+        stats = {s["endpoint"]: s for s in router.get_stats()}
+    finally:
+        await router.close()
+    
+    # Flaky endpoint is tried until the breaker opens, then skipped
+    assert len(flaky.requests) == 2
+    assert stats[flaky.url]["circuit_open"]
+    assert stats[flaky.url]["circuit_trips"] == 1
+    assert not stats[slow.url]["circuit_open"]
+
+
+async def test_writes_not_retried(servers):
+    """Test non-idempotent calls are sent to one endpoint only"""
+    slow, fast, flaky = servers
+    flaky.fail = True
+    router = RpcRouter([flaky.url, fast.url], timeout=2.0)
+    
+    try:
+        with pytest.raises(Exception):
+            await router.request("send_raw_transaction", b"\x00")
+    finally:
+        await router.close()
+    
+    assert len(flaky.requests) == 1
+    assert fast.requests == []
+
+
+async def test_funding_manager_routes_balance_reads(servers):
+    """Test funding manager reads survive a failing endpoint"""
+    slow, fast, flaky = servers
+    flaky.fail = True
+    manager = FundingManager(rpc_urls=[flaky.url, fast.url], rpc_timeout=2.0)
+    
+    try:
+        balance = await manager.get_balance(Keypair().pubkey())
+    finally:
+        await manager.disconnect()
+    
+    assert balance == 2 / 1_000_000_000
+    assert len(manager.get_rpc_stats()["endpoints"]) == 2
+
+
+async def test_request_without_endpoints_raises():
+    """Test a router left without endpoints raises a clear error"""
+    router = RpcRouter(["http://127.0.0.1:8899"])
+    await router.close()
+    router.endpoints = []
+    
+    with pytest.raises(RuntimeError, match="No RPC endpoint"):
+        await router.request("get_balance", Keypair().pubkey())
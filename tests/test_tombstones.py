@@ -0,0 +1,127 @@
+"""
+Tests for bounded retired pool and tombstone log
+"""
+
+import os
+from src.burner_swarm import tombstones as tombstones_module
+from src.burner_swarm.pool_manager import PoolManager, WalletStatus
+from src.burner_swarm.tombstones import TombstoneLog, RECORD
+
+
+def test_retired_pool_bounded_and_spilled(tmp_path):
+    """Test retired wallets beyond the cap spill to the tombstone log"""
+    tombstones = TombstoneLog(str(tmp_path / "retired.tombstones"))
+    pool_manager = PoolManager(min_reserve_size=0, retired_cache_size=3, tombstones=tombstones)
+    
+    wallets = pool_manager.generate_batch(10)
+    for wallet in wallets:
+        pool_manager.add_to_reserve(wallet)
+        pool_manager.retire_wallet(wallet)
+    
+    assert len(pool_manager.retired_pool) == 3
+    assert len(tombstones) == 7
+    
+    stats = pool_manager.get_pool_stats()
+    assert stats["retired"] == 10
+    assert stats["retired_in_memory"] == 3
+    assert stats["retired_spilled"] == 7
+    
+    # Spilled wallet still answers "retired at T"
+    found = pool_manager.get_wallet(wallets[0].public_key)
+    assert found.status == WalletStatus.RETIRED
+    assert found.retired_ts == wallets[0].retired_ts
+    assert found.created_ts == wallets[0].created_ts
+    assert found.keypair is None and found.ciphertext is None
+    
+    assert pool_manager.get_wallet(pool_manager.generate_wallet().public_key) is None
+
+
+def test_retired_ttl_evicts():
+    """Test retired wallets older than the TTL leave memory"""
+    pool_manager = PoolManager(min_reserve_size=0, retired_ttl=60)
+    
+    old, new = pool_manager.generate_batch(2)
+    pool_manager.retire_wallet(old)
+    old.retired_ts -= 120
+    pool_manager.retire_wallet(new)
+    
+    assert list(pool_manager.retired_pool) == [str(new.public_key)]
+    assert pool_manager.get_pool_stats()["retired"] == 2
+
+
+def test_tombstones_survive_restart(tmp_path):
+    """Test in-memory retired wallets are spilled on close and reloaded"""
+    path = str(tmp_path / "retired.tombstones")
+    pool_manager = PoolManager(min_reserve_size=0, tombstones=TombstoneLog(path))
+    wallet = pool_manager.generate_wallet()
+    pool_manager.retire_wallet(wallet)
+    pool_manager.close()
+    
+    # Torn trailing record is discarded
+    with open(path, "ab") as f:
+        f.write(b"\x00" * (RECORD.size // 2))
+    
+    restored = PoolManager(min_reserve_size=0, tombstones=TombstoneLog(path))
+    assert restored.get_pool_stats()["retired"] == 1
+    assert restored.get_wallet(wallet.public_key).retired_at == wallet.retired_at
+    restored.close()
+
+
+def test_tombstone_index_flush_and_compact(tmp_path, monkeypatch):
+    """Test lookups use the index, flush writes buffered records and compaction drops expired ones"""
+    path = tmp_path / "retired.tombstones"
+    tombstones = TombstoneLog(str(path), retention=3600)
+    pool_manager = PoolManager(min_reserve_size=0)
+    old, new, unknown = pool_manager.generate_batch(3)
+    for wallet in (old, new):
+        pool_manager.retire_wallet(wallet)
+    old.retired_ts -= 7200
+    
+    # Appends stay buffered (no disk write) until flushed
+    assert tombstones.append([old, new]) == 2
+    assert path.stat().st_size == 0
+    assert tombstones.find(new.public_key).retired_ts == new.retired_ts
+    assert tombstones.flush() == 2
+    assert path.stat().st_size == 2 * RECORD.size
+    
+    # Misses are answered by the index without reading the file
+    reads = []
+    real_pread = os.pread
+    monkeypatch.setattr(tombstones_module.os, "pread", lambda *args: reads.append(args) or real_pread(*args))
+    assert not tombstones.might_contain(unknown.public_key)
+    assert tombstones.find(unknown.public_key) is None
+    assert reads == []
+    assert tombstones.find(old.public_key).retired_ts == old.retired_ts
+    assert len(reads) == 1
+    
+    assert tombstones.compact() == 1
+    assert len(tombstones) == 1
+    assert tombstones.find(old.public_key) is None
+    assert tombstones.find(new.public_key).retired_ts == new.retired_ts
+    tombstones.close()
+    
+    assert len(TombstoneLog(str(path))) == 1
+
+
+def test_retired_count_survives_compaction(tmp_path):
+    """Test tombstones compacted away for age still count as retired after a restart"""
+    path = str(tmp_path / "retired.tombstones")
+    pool_manager = PoolManager(
+        min_reserve_size=0,
+        retired_cache_size=0,
+        tombstones=TombstoneLog(path, retention=3600)
+    )
+    old, new = pool_manager.generate_batch(2)
+    pool_manager.retire_wallet(old)
+    old.retired_ts -= 7200
+    pool_manager.retire_wallet(new)
+    pool_manager.tombstones.flush()
+    pool_manager.tombstones.append([old])  # Same key logged again
+    
+    assert pool_manager.tombstones.compact() == 2
+    assert pool_manager.tombstones.expired == 1
+    pool_manager.close()
+    
+    restored = PoolManager(min_reserve_size=0, tombstones=TombstoneLog(path, retention=3600))
+    assert restored.get_pool_stats()["retired"] == 2
+    restored.close()
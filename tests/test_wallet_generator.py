@@ -4,6 +4,7 @@ Tests for wallet generator
 
 import pytest
 from src.burner_swarm.wallet_generator import WalletGenerator
+from src.burner_swarm.parallel_generator import ParallelWalletGenerator
 from solders.keypair import Keypair
 
 
@@ -72,3 +73,36 @@ def test_encrypt_decrypt_keypair():
     decrypted = generator.decrypt_keypair(encrypted)
     assert decrypted.pubkey() == keypair.pubkey()
 
+
+
+def test_generate_batch():
+    """Test batch keypair generation"""
+    generator = WalletGenerator()
+    
+    batch = generator.generate_batch(5)
+    
+    assert len(batch) == 5
+    assert generator.generated_count == 5
+    assert len({str(keypair.pubkey()) for keypair, _ in batch}) == 5
+    
+    for keypair, encrypted in batch:
+        assert encrypted["public_key"] == str(keypair.pubkey())
+        assert generator.decrypt_keypair(encrypted).pubkey() == keypair.pubkey()
+
+
+def test_parallel_generate_encrypted():
+    """Test multi-process generation returns only encrypted key material"""
+    generator = WalletGenerator()
+    parallel = ParallelWalletGenerator(workers=2, chunk_size=3)
+    
+    try:
+        records = parallel.generate_encrypted(7)
+    finally:
+        parallel.close()
+    
+    assert len(records) == 7
+    assert parallel.generated_count == 7
+    
+    for public_key, ciphertext in records:
+        assert isinstance(ciphertext, bytes)
+        assert generator.decrypt_keypair_raw(ciphertext).pubkey() == public_key
@@ -0,0 +1,237 @@
+"""
+Tests for wallet store
+"""
+
+import multiprocessing
+import sqlite3
+import pytest
+from src.burner_swarm.pool_manager import PoolManager, WalletStatus
+from src.burner_swarm.wallet_store import SQLiteWalletStore, create_wallet_store
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Temporary database path"""
+    return str(tmp_path / "wallets.db")
+
+
+def test_reserve_and_active_survive_restart(db_path):
+    """Test pools are restored from the store on startup"""
+    pool_manager = PoolManager(min_reserve_size=5, store=SQLiteWalletStore(db_path))
+    pool_manager.maintain_reserve_pool()
+    
+    active = pool_manager.activate_wallet(pool_manager.get_from_reserve())
+    pool_manager.mark_used(active)
+    retired = pool_manager.get_from_reserve()
+    pool_manager.retire_wallet(retired)
+    pool_manager.close()
+    
+    restored = PoolManager(min_reserve_size=5, store=SQLiteWalletStore(db_path))
+    
+    assert set(restored.reserve_pool) == set(pool_manager.reserve_pool)
+    assert restored.reserve_deficit() == 2
+    assert restored.generator.generated_count == 0
+    
+    wallet = restored.active_pool[str(active.public_key)]
+    assert wallet.usage_count == 1
+    assert wallet.last_used is not None
+    assert wallet.created_at == active.created_at
+    assert wallet.keypair.pubkey() == active.public_key
+    
+    # Reserve keypairs are decrypted only on activation
+    reserve_wallet = restored.get_from_reserve()
+    assert reserve_wallet.keypair is None
+    restored.activate_wallet(reserve_wallet)
+    assert reserve_wallet.keypair.pubkey() == reserve_wallet.public_key
+    restored.close()
+
+
+def test_retired_key_material_removed(db_path):
+    """Test retiring a wallet removes its encrypted key from disk"""
+    pool_manager = PoolManager(min_reserve_size=1, store=SQLiteWalletStore(db_path))
+    pool_manager.maintain_reserve_pool()
+    wallet = pool_manager.get_from_reserve()
+    pool_manager.retire_wallet(wallet)
+    pool_manager.close()
+    
+    conn = sqlite3.connect(db_path)
+    row = conn.execute(
+        "SELECT status, encrypted_private_key FROM wallets WHERE public_key = ?",
+        (str(wallet.public_key),)
+    ).fetchone()
+    conn.close()
+    
+    assert row == (WalletStatus.RETIRED.value, None)
+
+
+def test_writes_batched(db_path):
+    """Test saves are buffered until the batch size is reached"""
+    store = SQLiteWalletStore(db_path, batch_size=10, flush_interval=3600)
+    pool_manager = PoolManager(min_reserve_size=0, store=store)
+    
+    def stored_count():
+        conn = sqlite3.connect(db_path)
+        count = conn.execute("SELECT COUNT(*) FROM wallets").fetchone()[0]
+        conn.close()
+        return count
+    
+    for wallet in pool_manager.generate_batch(9):
+        pool_manager.add_to_reserve(wallet)
+    assert stored_count() == 0
+    
+    pool_manager.add_to_reserve(pool_manager.generate_wallet())
+    assert stored_count() == 10
+    
+    pool_manager.add_to_reserve(pool_manager.generate_wallet())
+    pool_manager.flush()
+    assert stored_count() == 11
+    pool_manager.close()
+
+
+def test_checkout_survives_crash_before_flush(db_path):
+    """Test a handed-out wallet never returns to reserve when buffered writes are lost"""
+    store = SQLiteWalletStore(db_path, batch_size=100, flush_interval=3600)
+    pool_manager = PoolManager(min_reserve_size=3, store=store)
+    pool_manager.maintain_reserve_pool()
+    pool_manager.flush()
+    
+    active = pool_manager.activate_wallet(pool_manager.get_from_reserve())
+    retired = pool_manager.get_from_reserve()
+    pool_manager.retire_wallet(retired)
+    unsaved = pool_manager.add_to_reserve()
+    
+    # Crash: buffered records are dropped without flush()
+    store._pending.clear()
+    store._conn.close()
+    
+    restored = PoolManager(min_reserve_size=3, store=SQLiteWalletStore(db_path))
+    assert str(active.public_key) in restored.active_pool
+    assert str(active.public_key) not in restored.reserve_pool
+    assert str(retired.public_key) not in restored.reserve_pool
+    assert str(unsaved.public_key) not in restored.reserve_pool  # Lost reserve insert is harmless
+    assert len(restored.reserve_pool) == 1
+    restored.close()
+
+
+def test_create_wallet_store(db_path):
+    """Test backend factory"""
+    assert create_wallet_store("memory") is None
+    
+    store = create_wallet_store("sqlite", db_path)
+    assert isinstance(store, SQLiteWalletStore)
+    store.close()
+    
+    with pytest.raises(ValueError):
+        create_wallet_store("redis")
+
+
+def test_shared_store_serves_one_pool_to_several_managers(db_path):
+    """Test processes sharing a store see one pool and never double-checkout"""
+    first = PoolManager(min_reserve_size=6, store=create_wallet_store("sqlite", db_path, shared=True))
+    first.maintain_reserve_pool()
+    second = PoolManager(min_reserve_size=6, store=create_wallet_store("sqlite", db_path, shared=True))
+    assert second.reserve_deficit() == 0
+    assert second.generator.generated_count == 0
+    
+    wallets = [manager.activate_wallet(manager.get_from_reserve()) for manager in (first, second) * 3]
+    assert len({w.public_key for w in wallets}) == 6
+    assert first.get_from_reserve() is None
+    assert second.get_pool_stats()["active"] == 6
+    
+    # Wallet activated by the first manager is usable through the second
+    wallet = second.get_wallet(wallets[0].public_key)
+    assert wallet.status == WalletStatus.ACTIVE
+    second.mark_used(wallet)
+    first.mark_used(wallets[0])
+    assert wallets[0].usage_count == 2
+    
+    second.retire_wallet(wallet)
+    assert first.get_wallet(wallets[0].public_key).status == WalletStatus.RETIRED
+    assert first.get_pool_stats()["retired"] == 1
+    assert first.reserve_deficit() == 6
+    
+    first.close()
+    second.close()
+
+
+def test_shared_checkout_is_atomic_across_connections(db_path):
+    """Test concurrent checkouts from separate connections hand out each wallet once"""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    seed = PoolManager(min_reserve_size=40, store=create_wallet_store("sqlite", db_path, shared=True))
+    seed.maintain_reserve_pool()
+    stores = [create_wallet_store("sqlite", db_path, shared=True) for _ in range(4)]
+    
+    def drain(store):
+        checked_out = []
+        while (wallet := store.checkout()) is not None:
+            checked_out.append(str(wallet.public_key))
+        return checked_out
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(drain, stores))
+    
+    keys = [key for result in results for key in result]
+    assert len(keys) == len(set(keys)) == 40
+    
+    for store in stores:
+        store.close()
+    seed.close()
+
+
+def _open_shared_store(db_path, barrier):
+    """Open a shared store once every process is ready (child process target)"""
+    barrier.wait()
+    create_wallet_store("sqlite", db_path, shared=True).close()
+
+
+def test_shared_store_startup_across_processes(tmp_path):
+    """Test workers opening a fresh shared database together all start"""
+    context = multiprocessing.get_context("fork")
+    
+    for attempt in range(5):
+        db_path = str(tmp_path / f"wallets-{attempt}.db")
+        barrier = context.Barrier(8)
+        processes = [
+            context.Process(target=_open_shared_store, args=(db_path, barrier))
+            for _ in range(8)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=30)
+        
+        assert [process.exitcode for process in processes] == [0] * 8
+    
+    store = create_wallet_store("sqlite", db_path, shared=True)
+    assert store.count_by_status() == {status: 0 for status in WalletStatus}
+    store.close()
+
+
+async def test_shared_replenishers_stop_at_high_watermark(db_path):
+    """Test replenishers of several instances refilling together do not overshoot"""
+    import asyncio
+    from src.burner_swarm.replenisher import ReserveReplenisher
+    
+    managers = [
+        PoolManager(min_reserve_size=0, store=create_wallet_store("sqlite", db_path, shared=True))
+        for _ in range(4)
+    ]
+    replenishers = [
+        ReserveReplenisher(manager, low_watermark=20, high_watermark=20, batch_size=5)
+        for manager in managers
+    ]
+    await asyncio.gather(*(replenisher.replenish() for replenisher in replenishers))
+    
+    counts = managers[0].store.count_by_status()
+    assert counts[WalletStatus.RESERVE] == 20
+    
+    # Trigger-maintained counters track status changes
+    managers[1].retire_wallet(managers[1].activate_wallet(managers[1].get_from_reserve()))
+    counts = managers[0].store.count_by_status()
+    rows = dict(managers[0].store._conn.execute("SELECT status, COUNT(*) FROM wallets GROUP BY status").fetchall())
+    assert counts[WalletStatus.RESERVE] == rows["reserve"] == 19
+    assert counts[WalletStatus.RETIRED] == rows["retired"] == 1
+    
+    for manager in managers:
+        manager.close()